@@ -0,0 +1,59 @@
+"""
+Compare two benchmark reports written by `benchmarks/run.py`.
+
+Usage:
+    python benchmarks/compare.py before.json after.json
+"""
+
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# Metric path -> whether a higher value is better
+METRICS: List[Tuple[str, bool]] = [
+    ("ops_per_second", True),
+    ("cpu_us_per_op", False),
+    ("latency_ms.p50", False),
+    ("latency_ms.p99", False),
+    ("peak_alloc_bytes_per_op", False),
+    ("cold_start_ms.import_package", False),
+    ("cold_start_ms.import_client", False),
+    ("cold_start_ms.first_send", False),
+]
+
+
+def _get(result: Dict[str, Any], path: str) -> Optional[float]:
+    value: Any = result
+    for key in path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 2:
+        print(__doc__.strip())
+        return 2
+    with open(argv[0]) as before_file, open(argv[1]) as after_file:
+        before = json.load(before_file)["results"]
+        after = json.load(after_file)["results"]
+
+    print(f"{'scenario':<22}{'metric':<30}{'before':>14}{'after':>14}{'change':>10}")
+    for name in sorted(set(before) & set(after)):
+        for metric, higher_is_better in METRICS:
+            old, new = _get(before[name], metric), _get(after[name], metric)
+            if old is None or new is None or old == 0:
+                continue
+            change = (new - old) / old * 100
+            marker = ""
+            if abs(change) >= 5:
+                marker = " +" if (change > 0) == higher_is_better else " -"
+            print(
+                f"{name:<22}{metric:<30}{old:>14.2f}{new:>14.2f}{change:>9.1f}%{marker}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
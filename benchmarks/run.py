@@ -0,0 +1,561 @@
+"""
+Offline benchmarks of the IndiePitcher SDK against an in-process mock API.
+
+Measures throughput, latency percentiles, CPU time and peak allocations per
+call for the sync and async clients, bulk imports and pagination. No network
+access or API key is needed. Results are written as JSON so runs of different
+releases can be compared with `benchmarks/compare.py`.
+
+Usage:
+    python benchmarks/run.py --output before.json
+    python benchmarks/run.py --scenario send_email --iterations 5000
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from importlib.metadata import version
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+import pydantic
+
+from indiepitcher import (
+    Compression,
+    CreateContact,
+    EmailBodyFormat,
+    IndiePitcherAsyncClient,
+    IndiePitcherClient,
+    PreparedEmail,
+    SendEmail,
+)
+from indiepitcher._codec import decode_response, encode_body
+from indiepitcher.models import ContactPage
+from indiepitcher.testing import MockIndiePitcherAPI
+
+HTML_BODY = "<html><body>" + "<p>Hello from IndiePitcher!</p>" * 2000 + "</body></html>"
+
+
+@dataclass
+class Scenario:
+    name: str
+    description: str
+    run: Callable[[MockIndiePitcherAPI, int], Dict[str, Any]]
+
+
+def _email(index: int, body: str = "Hello **there**") -> SendEmail:
+    return SendEmail(
+        to=f"user{index}@example.com",
+        subject="Benchmark",
+        body=body,
+        body_format=EmailBodyFormat.MARKDOWN,
+    )
+
+
+def _seed_contacts(api: MockIndiePitcherAPI, count: int) -> None:
+    for index in range(count):
+        email = f"user{index}@example.com"
+        api.contacts[email] = {
+            "email": email,
+            "name": f"User {index}",
+            "subscribedToLists": ["newsletter", "product"],
+            "customProperties": {"plan": "pro", "seats": index % 50, "beta": True},
+        }
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _summarize(
+    operations: int, wall: float, cpu: float, latencies: List[float]
+) -> Dict[str, Any]:
+    result: Dict[str, Any] = {
+        "operations": operations,
+        "wall_seconds": round(wall, 6),
+        "ops_per_second": round(operations / wall, 2) if wall else None,
+        "cpu_us_per_op": round(cpu / operations * 1e6, 2),
+    }
+    if latencies:
+        result["latency_ms"] = {
+            "p50": round(statistics.median(latencies) * 1000, 4),
+            "p99": round(_percentile(latencies, 99) * 1000, 4),
+            "max": round(max(latencies) * 1000, 4),
+        }
+    return result
+
+
+def _peak_alloc_per_call(call: Callable[[], Any], samples: int = 50) -> int:
+    call()  # warm up caches before measuring
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+    return int(statistics.median(peaks))
+
+
+def _measure_sync(call: Callable[[int], Any], iterations: int) -> Dict[str, Any]:
+    call(0)
+    latencies = []
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    for index in range(iterations):
+        call_started = time.perf_counter()
+        call(index)
+        latencies.append(time.perf_counter() - call_started)
+    wall = time.perf_counter() - started
+    result = _summarize(iterations, wall, time.process_time() - cpu_started, latencies)
+    result["peak_alloc_bytes_per_op"] = _peak_alloc_per_call(lambda: call(0))
+    return result
+
+
+def _measure_async(
+    api: MockIndiePitcherAPI,
+    call: Callable[[IndiePitcherAsyncClient, int], Awaitable[Any]],
+    iterations: int,
+    concurrency: int,
+    **client_options: Any,
+) -> Dict[str, Any]:
+    async def run() -> Dict[str, Any]:
+        async with _async_client(api, **client_options) as client:
+            await call(client, 0)
+            latencies: List[float] = []
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def timed(index: int) -> None:
+                async with semaphore:
+                    call_started = time.perf_counter()
+                    await call(client, index)
+                    latencies.append(time.perf_counter() - call_started)
+
+            cpu_started = time.process_time()
+            started = time.perf_counter()
+            await asyncio.gather(*(timed(index) for index in range(iterations)))
+            wall = time.perf_counter() - started
+        result = _summarize(
+            iterations, wall, time.process_time() - cpu_started, latencies
+        )
+        result["concurrency"] = concurrency
+        return result
+
+    return asyncio.run(run())
+
+
+def _sync_client(api: MockIndiePitcherAPI, **options: Any) -> IndiePitcherClient:
+    return IndiePitcherClient(api_key="benchmark", transport=api.transport(), **options)
+
+
+def _async_client(api: MockIndiePitcherAPI, **options: Any) -> IndiePitcherAsyncClient:
+    return IndiePitcherAsyncClient(
+        api_key="benchmark", transport=api.async_transport(), **options
+    )
+
+
+def bench_send_email(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    with _sync_client(api) as client:
+        return _measure_sync(lambda i: client.send_email(_email(i)), iterations)
+
+
+def bench_send_email_map(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    with _sync_client(api) as client:
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        sent = sum(
+            result.ok
+            for result in client.map(
+                client.send_email, (_email(i) for i in range(iterations)), max_workers=8
+            )
+        )
+        wall = time.perf_counter() - started
+    result = _summarize(sent, wall, time.process_time() - cpu_started, [])
+    result["workers"] = 8
+    return result
+
+
+def bench_send_email_html(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    with _sync_client(api) as client:
+        emails = [_email(i, HTML_BODY) for i in range(2)]
+        return _measure_sync(lambda i: client.send_email(emails[i % 2]), iterations)
+
+
+def bench_send_email_html_gzip(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    with _sync_client(api, compression=Compression()) as client:
+        emails = [_email(i, HTML_BODY) for i in range(2)]
+        result = _measure_sync(lambda i: client.send_email(emails[i % 2]), iterations)
+        stats = client.transfer_stats()
+    result["bytes_sent"] = stats.bytes_sent
+    result["uncompressed_bytes_sent"] = stats.uncompressed_bytes_sent
+    return result
+
+
+def bench_send_prepared_html(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    with _sync_client(api) as client:
+        prepared = PreparedEmail(_email(0, HTML_BODY))
+        return _measure_sync(
+            lambda i: client.send_prepared(prepared, f"user{i}@example.com"),
+            iterations,
+        )
+
+
+def bench_render_prepared_html(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    prepared = PreparedEmail(_email(0, HTML_BODY))
+    return _measure_sync(lambda i: prepared.render(f"user{i}@example.com"), iterations)
+
+
+def bench_get_contact(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    _seed_contacts(api, 100)
+    with _sync_client(api) as client:
+        return _measure_sync(
+            lambda i: client.get_contact(f"user{i % 100}@example.com"), iterations
+        )
+
+
+def bench_list_contacts_page(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    _seed_contacts(api, 100)
+    with _sync_client(api) as client:
+        return _measure_sync(
+            lambda i: client.list_contacts(page=1, per_page=100), iterations // 10 or 1
+        )
+
+
+def bench_iter_contacts(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    count = max(iterations, 100) * 10
+    _seed_contacts(api, count)
+    with _sync_client(api) as client:
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        scanned = sum(1 for _ in client.iter_contacts(per_page=100, prefetch=4))
+        wall = time.perf_counter() - started
+    result = _summarize(scanned, wall, time.process_time() - cpu_started, [])
+    result["pages"] = len(api.requests)
+    return result
+
+
+def bench_iter_contacts_lazy(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    count = max(iterations, 100) * 10
+    _seed_contacts(api, count)
+    with _sync_client(api) as client:
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        scanned = sum(1 for _ in client.iter_contacts_lazy(per_page=100, prefetch=4))
+        wall = time.perf_counter() - started
+    result = _summarize(scanned, wall, time.process_time() - cpu_started, [])
+    result["pages"] = len(api.requests)
+    return result
+
+
+def bench_import_contacts(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    count = max(iterations, 100) * 10
+    contacts = [
+        CreateContact(
+            email=f"user{index}@example.com",
+            name=f"User {index}",
+            custom_properties={"plan": "pro", "seats": index % 50},
+        )
+        for index in range(count)
+    ]
+    with _sync_client(api) as client:
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        report = client.import_contacts(contacts, max_concurrency=4)
+        wall = time.perf_counter() - started
+    result = _summarize(report.total, wall, time.process_time() - cpu_started, [])
+    result["chunks"] = len(report.chunks)
+    return result
+
+
+def bench_reconcile_contacts(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    count = max(iterations, 100) * 10
+    _seed_contacts(api, count)
+    # 1% of the desired contacts differ from the server.
+    desired = [
+        CreateContact(
+            email=f"user{index}@example.com",
+            name=f"User {index}" if index % 100 else "Renamed",
+            subscribed_to_lists=["newsletter", "product"],
+        )
+        for index in range(count)
+    ]
+    with _sync_client(api) as client:
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        report = client.reconcile_contacts(desired)
+        wall = time.perf_counter() - started
+    result = _summarize(count, wall, time.process_time() - cpu_started, [])
+    result["writes"] = report.plan.changes
+    result["requests"] = len(api.requests)
+    return result
+
+
+def bench_encode_html_email(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    email = _email(0, HTML_BODY)
+    return _measure_sync(lambda i: encode_body(email), iterations)
+
+
+def bench_decode_contact_page(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    _seed_contacts(api, 100)
+    content = api.handle(
+        httpx.Request("GET", "https://api.indiepitcher.com/v1/contacts?per=100")
+    ).content
+    return _measure_sync(lambda i: decode_response(ContactPage, content), iterations)
+
+
+def bench_async_send_email(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    return _measure_async(
+        api, lambda client, i: client.send_email(_email(i)), iterations, 50
+    )
+
+
+def bench_async_send_many(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    async def run() -> Dict[str, Any]:
+        async with _async_client(api) as client:
+            cpu_started = time.process_time()
+            started = time.perf_counter()
+            sent = 0
+            emails = (_email(i) for i in range(iterations))
+            async for result in client.send_many(emails, max_concurrency=50):
+                sent += result.ok
+            wall = time.perf_counter() - started
+        result = _summarize(sent, wall, time.process_time() - cpu_started, [])
+        result["concurrency"] = 50
+        return result
+
+    return asyncio.run(run())
+
+
+def bench_async_get_contact(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    _seed_contacts(api, 100)
+    return _measure_async(
+        api,
+        lambda client, i: client.get_contact(f"user{i % 100}@example.com"),
+        iterations,
+        50,
+    )
+
+
+def bench_async_get_contact_hot(
+    api: MockIndiePitcherAPI, iterations: int
+) -> Dict[str, Any]:
+    _seed_contacts(api, 100)
+    result = _measure_async(
+        api,
+        lambda client, i: client.get_contact(f"user{i % 5}@example.com"),
+        iterations,
+        50,
+        coalesce_reads=True,
+    )
+    result["requests"] = len(api.requests)
+    return result
+
+
+# Run in a fresh interpreter for every sample; prints three timestamps in seconds.
+_COLD_START_SCRIPT = """
+import time
+started = time.perf_counter()
+import indiepitcher
+package = time.perf_counter()
+from indiepitcher import EmailBodyFormat, IndiePitcherClient, SendEmail
+client_ready = time.perf_counter()
+import httpx
+transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"success": True}))
+client = IndiePitcherClient(api_key="benchmark", transport=transport)
+client.send_email(
+    SendEmail(to="a@example.com", subject="Hi", body="Hi", body_format=EmailBodyFormat.HTML)
+)
+sent = time.perf_counter()
+print(package - started, client_ready - started, sent - started)
+"""
+
+
+def bench_cold_start(api: MockIndiePitcherAPI, iterations: int) -> Dict[str, Any]:
+    samples = []
+    for _ in range(max(5, min(iterations // 100, 30))):
+        output = subprocess.check_output([sys.executable, "-c", _COLD_START_SCRIPT])
+        samples.append([float(value) for value in output.split()])
+    # The fastest run is the least disturbed by other processes.
+    package, client, first_send = (
+        round(min(sample[column] for sample in samples) * 1000, 2)
+        for column in range(3)
+    )
+    return {
+        "runs": len(samples),
+        "cold_start_ms": {
+            "import_package": package,
+            "import_client": client,
+            "first_send": first_send,
+        },
+    }
+
+
+SCENARIOS = [
+    Scenario(
+        "cold_start",
+        "Fresh interpreter: import, then build a client and send one email",
+        bench_cold_start,
+    ),
+    Scenario("send_email", "Sequential transactional sends", bench_send_email),
+    Scenario(
+        "send_email_map",
+        "Sends fanned out over 8 threads with client.map",
+        bench_send_email_map,
+    ),
+    Scenario(
+        "send_email_html",
+        "Sequential sends of a ~60 KB HTML body",
+        bench_send_email_html,
+    ),
+    Scenario(
+        "send_email_html_gzip",
+        "Sequential sends of a ~60 KB HTML body, gzip-compressed",
+        bench_send_email_html_gzip,
+    ),
+    Scenario(
+        "send_prepared_html",
+        "Sequential sends of a prepared ~60 KB HTML email",
+        bench_send_prepared_html,
+    ),
+    Scenario("get_contact", "Sequential contact lookups", bench_get_contact),
+    Scenario(
+        "list_contacts_page",
+        "Fetching one page of 100 contacts",
+        bench_list_contacts_page,
+    ),
+    Scenario("iter_contacts", "Full scan with page prefetching", bench_iter_contacts),
+    Scenario(
+        "iter_contacts_lazy",
+        "Full scan with page prefetching, as lazy views",
+        bench_iter_contacts_lazy,
+    ),
+    Scenario("import_contacts", "Chunked concurrent import", bench_import_contacts),
+    Scenario(
+        "reconcile_contacts",
+        "Reconciling an audience where 1% of contacts changed",
+        bench_reconcile_contacts,
+    ),
+    Scenario(
+        "async_get_contact_hot",
+        "Concurrent async lookups of 5 hot contacts, with coalesced reads",
+        bench_async_get_contact_hot,
+    ),
+    Scenario(
+        "encode_html_email",
+        "Serializing a ~60 KB HTML send request (no I/O)",
+        bench_encode_html_email,
+    ),
+    Scenario(
+        "render_prepared_html",
+        "Rendering a prepared ~60 KB HTML email for one recipient (no I/O)",
+        bench_render_prepared_html,
+    ),
+    Scenario(
+        "decode_contact_page",
+        "Parsing a page of 100 contacts (no I/O)",
+        bench_decode_contact_page,
+    ),
+    Scenario(
+        "async_send_email",
+        "Concurrent async sends (50 in flight)",
+        bench_async_send_email,
+    ),
+    Scenario(
+        "async_send_many",
+        "Streaming async sends with send_many (50 in flight)",
+        bench_async_send_many,
+    ),
+    Scenario(
+        "async_get_contact",
+        "Concurrent async lookups (50 in flight)",
+        bench_async_get_contact,
+    ),
+]
+
+
+def run(
+    iterations: int, latency: float, only: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Run the selected scenarios and return the JSON-serializable report."""
+    results = {}
+    for scenario in SCENARIOS:
+        if only and scenario.name not in only:
+            continue
+        result = scenario.run(MockIndiePitcherAPI(latency=latency), iterations)
+        result["description"] = scenario.description
+        results[scenario.name] = result
+    return {
+        "environment": {
+            "indiepitcher": version("indiepitcher"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "httpx": httpx.__version__,
+            "pydantic": pydantic.VERSION,
+        },
+        "parameters": {"iterations": iterations, "latency": latency},
+        "results": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="simulated network latency per request, in seconds",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="run only this scenario (can be repeated)",
+    )
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run(args.iterations, args.latency, args.scenario)
+    encoded = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(encoded + "\n")
+    else:
+        print(encoded)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
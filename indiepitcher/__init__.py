@@ -1,35 +1,156 @@
 """IndiePitcher Python SDK for email marketing platform."""
 
-from .async_client import IndiePitcherAsyncClient
-from .client import IndiePitcherClient
-from .models import (  # Models; Response types; Enums
-    Contact,
-    CreateContact,
-    CreateMailingListPortalSession,
-    EmailBodyFormat,
-    EmptyResponse,
-    IndiePitcherResponseError,
-    MailingList,
-    MailingListPortalSession,
-    SendEmail,
-    SendEmailToContact,
-    SendEmailToMailingList,
-    UpdateContact,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .async_client import IndiePitcherAsyncClient
+    from .batching import AsyncEmailToContactBatcher, EmailToContactBatcher
+    from .bulk import BulkImportResult, ItemResult
+    from .cache import CacheStats, ContactCache
+    from .circuit import CircuitBreaker, CircuitOpenError, CircuitState, CircuitStats
+    from .client import IndiePitcherClient
+    from .compression import Compression, TransferStats
+    from .deadlines import Deadline, DeadlineExceeded, deadline
+    from .export import ExportResult
+    from .hedging import HedgingPolicy, HedgingStats
+    from .models import (
+        Contact,
+        CreateContact,
+        CreateMailingListPortalSession,
+        EmailBodyFormat,
+        EmptyResponse,
+        IndiePitcherResponseError,
+        MailingList,
+        MailingListPortalSession,
+        SendEmail,
+        SendEmailToContact,
+        SendEmailToMailingList,
+        UpdateContact,
+    )
+    from .outbox import AsyncOutboxFlusher, Outbox, OutboxFlusher
+    from .pool import IndiePitcherAsyncClientPool, IndiePitcherClientPool
+    from .prepared import PreparedEmail
+    from .rate_limit import RateLimit, RateLimiter
+    from .reconcile import ReconcilePlan, ReconcileReport
+    from .retry import RetryPolicy
+    from .tracing import CallTrace, OpenTelemetryTracer, Tracer
+    from .views import ContactView, MailingListView
+
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access, so `import indiepitcher` does not load httpx or pydantic
+# until a client or model is actually used.
+_LAZY_IMPORTS = {
+    "AsyncEmailToContactBatcher": ".batching",
+    "AsyncOutboxFlusher": ".outbox",
+    "BulkImportResult": ".bulk",
+    "CacheStats": ".cache",
+    "CallTrace": ".tracing",
+    "CircuitBreaker": ".circuit",
+    "CircuitOpenError": ".circuit",
+    "CircuitState": ".circuit",
+    "CircuitStats": ".circuit",
+    "Compression": ".compression",
+    "Contact": ".models",
+    "ContactCache": ".cache",
+    "ContactView": ".views",
+    "CreateContact": ".models",
+    "CreateMailingListPortalSession": ".models",
+    "Deadline": ".deadlines",
+    "DeadlineExceeded": ".deadlines",
+    "EmailBodyFormat": ".models",
+    "EmailToContactBatcher": ".batching",
+    "EmptyResponse": ".models",
+    "ExportResult": ".export",
+    "HedgingPolicy": ".hedging",
+    "HedgingStats": ".hedging",
+    "IndiePitcherAsyncClient": ".async_client",
+    "IndiePitcherAsyncClientPool": ".pool",
+    "IndiePitcherClient": ".client",
+    "IndiePitcherClientPool": ".pool",
+    "IndiePitcherResponseError": ".models",
+    "ItemResult": ".bulk",
+    "MailingList": ".models",
+    "MailingListPortalSession": ".models",
+    "MailingListView": ".views",
+    "OpenTelemetryTracer": ".tracing",
+    "Outbox": ".outbox",
+    "OutboxFlusher": ".outbox",
+    "PreparedEmail": ".prepared",
+    "RateLimit": ".rate_limit",
+    "RateLimiter": ".rate_limit",
+    "ReconcilePlan": ".reconcile",
+    "ReconcileReport": ".reconcile",
+    "RetryPolicy": ".retry",
+    "SendEmail": ".models",
+    "SendEmailToContact": ".models",
+    "SendEmailToMailingList": ".models",
+    "Tracer": ".tracing",
+    "TransferStats": ".compression",
+    "UpdateContact": ".models",
+    "deadline": ".deadlines",
+}
 
 __all__ = [
+    "AsyncEmailToContactBatcher",
+    "AsyncOutboxFlusher",
+    "BulkImportResult",
+    "CallTrace",
+    "CacheStats",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "CircuitStats",
+    "Compression",
     "Contact",
+    "ContactCache",
+    "ContactView",
     "CreateContact",
     "CreateMailingListPortalSession",
+    "Deadline",
+    "DeadlineExceeded",
     "EmailBodyFormat",
+    "EmailToContactBatcher",
     "EmptyResponse",
+    "ExportResult",
+    "HedgingPolicy",
+    "HedgingStats",
     "IndiePitcherClient",
+    "IndiePitcherClientPool",
     "MailingList",
     "MailingListPortalSession",
+    "MailingListView",
+    "OpenTelemetryTracer",
+    "Outbox",
+    "OutboxFlusher",
+    "PreparedEmail",
+    "RateLimit",
+    "RateLimiter",
+    "ReconcilePlan",
+    "ReconcileReport",
+    "RetryPolicy",
     "SendEmail",
     "SendEmailToContact",
     "SendEmailToMailingList",
+    "Tracer",
+    "TransferStats",
     "UpdateContact",
     "IndiePitcherResponseError",
     "IndiePitcherAsyncClient",
+    "IndiePitcherAsyncClientPool",
+    "ItemResult",
+    "deadline",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,52 @@
+"""JSON encoding of request bodies and decoding of responses."""
+
+from typing import Any, Type, TypeVar, get_args
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from .models import PageMetadata
+
+R = TypeVar("R", bound=BaseModel)
+
+
+def encode_body(body: Any) -> bytes:
+    """
+    Encode a request model, a list of models or plain data as JSON bytes.
+
+    Models are serialized straight to bytes by their compiled pydantic
+    serializer, without building an intermediate dict. Bytes are taken to be
+    JSON encoded already, such as the bodies of prepared emails.
+    """
+    if isinstance(body, bytes):
+        return body
+    if isinstance(body, BaseModel):
+        return body.__pydantic_serializer__.to_json(
+            body, by_alias=True, exclude_none=True
+        )
+    if isinstance(body, (list, tuple)) and all(
+        isinstance(item, BaseModel) for item in body
+    ):
+        return b"[" + b",".join(encode_body(item) for item in body) + b"]"
+    return to_json(body)
+
+
+def decode_response(response_model: Type[R], content: bytes) -> R:
+    """Validate a JSON response body with the model's compiled validator."""
+    return response_model.__pydantic_validator__.validate_json(content)
+
+
+def decode_view_page(page_model: Type[R], content: bytes) -> R:
+    """
+    Decode a page of lazy views, such as `PagedDataResponse[ContactView]`.
+
+    The items are parsed into plain dicts and wrapped as they are, so no
+    per-field validation happens until a view's attribute is read.
+    """
+    raw = from_json(content)
+    (item_type,) = get_args(page_model.model_fields["data"].annotation)
+    return page_model.model_construct(
+        success=raw["success"],
+        data=[item_type(item) for item in raw["data"]],
+        metadata=PageMetadata.model_validate(raw["metadata"]),
+    )
@@ -0,0 +1,11 @@
+"""Classification of API paths into endpoint groups."""
+
+
+def endpoint_group(path: str) -> str:
+    """
+    Return the endpoint group of an API path, e.g. `email` for `/email/list`.
+
+    The groups are `contacts`, `lists` and `email`, the names rate limits and
+    circuit breakers are configured and reported by.
+    """
+    return path.lstrip("/").split("/", 1)[0]
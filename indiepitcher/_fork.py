@@ -0,0 +1,26 @@
+"""Resetting clients in child processes forked from the process that created them."""
+
+import os
+import weakref
+from typing import Any
+
+# Objects with a `_reset_after_fork()` method, such as clients owning a
+# connection pool and shared objects guarding their state with a lock that
+# may be held at fork time. Held weakly so that registering does not keep
+# them alive.
+_instances: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def reset_after_fork(instance: Any) -> None:
+    """Call `instance._reset_after_fork()` in every child forked from now on."""
+    _instances.add(instance)
+
+
+def _after_fork_in_child() -> None:
+    for instance in list(_instances):
+        instance._reset_after_fork()
+
+
+# Not available on Windows, where processes are spawned instead of forked.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,299 @@
+"""Coalescing of individual contact sends into batched requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from .models import EmptyResponse, SendEmailToContact
+
+if TYPE_CHECKING:
+    from .async_client import IndiePitcherAsyncClient
+    from .client import IndiePitcherClient
+
+# Fields that identify the recipients of a send; everything else must match
+# for two sends to be merged into one request.
+_RECIPIENT_FIELDS = {"contact_email", "contact_emails"}
+
+
+def _batch_key(email: SendEmailToContact) -> str:
+    return email.model_dump_json(exclude=_RECIPIENT_FIELDS)
+
+
+def _recipients(email: SendEmailToContact) -> List[str]:
+    if email.contact_emails:
+        return list(email.contact_emails)
+    if email.contact_email:
+        return [email.contact_email]
+    raise ValueError("contact_email or contact_emails must be set")
+
+
+@dataclass
+class _Batch:
+    template: SendEmailToContact
+    created_at: float
+    recipients: List[str] = field(default_factory=list)
+    waiters: List[Any] = field(default_factory=list)
+
+    def request(self) -> SendEmailToContact:
+        return self.template.model_copy(
+            update={"contact_email": None, "contact_emails": self.recipients}
+        )
+
+
+def _validate(max_batch_size: int, linger: float, max_concurrency: int) -> None:
+    if max_batch_size < 1:
+        raise ValueError("max_batch_size must be at least 1")
+    if linger < 0:
+        raise ValueError("linger must not be negative")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+class EmailToContactBatcher:
+    """
+    Background sender that merges identical `send_email_to_contact` calls.
+
+    Sends with the same subject, body, format, list, delay and tracking
+    options are grouped into a single request with `contact_emails`. A group
+    is sent when it reaches `max_batch_size` recipients or `linger` seconds
+    after its first send was submitted, whichever comes first.
+
+    Example:
+        with EmailToContactBatcher(client) as batcher:
+            futures = [batcher.submit(email) for email in notifications]
+        results = [future.result() for future in futures]
+    """
+
+    def __init__(
+        self,
+        client: "IndiePitcherClient",
+        max_batch_size: int = 100,
+        linger: float = 0.05,
+        max_concurrency: int = 4,
+    ) -> None:
+        """
+        Initialize the batcher and start its background thread.
+
+        Args:
+            client: Client used to send the batched requests
+            max_batch_size: Maximum recipients per request (default: 100)
+            linger: Seconds to wait for more sends to join a batch (default: 0.05)
+            max_concurrency: Maximum number of batches sent at once (default: 4)
+        """
+        _validate(max_batch_size, linger, max_concurrency)
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.linger = linger
+        self._batches: Dict[str, _Batch] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._thread = threading.Thread(
+            target=self._run, name="indiepitcher-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> "EmailToContactBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def submit(self, email: SendEmailToContact) -> "Future[EmptyResponse]":
+        """
+        Queue a send and return a future resolved once its batch is sent.
+
+        Raises:
+            RuntimeError: If the batcher is closed
+            ValueError: If the email has no recipient
+        """
+        recipients = _recipients(email)
+        future: "Future[EmptyResponse]" = Future()
+        key = _batch_key(email)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Batcher is closed")
+            batch = self._batches.get(key)
+            if batch is not None and (
+                len(batch.recipients) + len(recipients) > self.max_batch_size
+                or not set(recipients).isdisjoint(batch.recipients)
+            ):
+                self._dispatch(self._batches.pop(key))
+                batch = None
+            if batch is None:
+                batch = _Batch(template=email, created_at=time.monotonic())
+                self._batches[key] = batch
+                self._condition.notify()
+            batch.recipients.extend(recipients)
+            batch.waiters.append(future)
+            if len(batch.recipients) >= self.max_batch_size:
+                self._dispatch(self._batches.pop(key))
+        return future
+
+    def flush(self) -> None:
+        """Send all pending batches without waiting for their linger time."""
+        with self._condition:
+            batches = list(self._batches.values())
+            self._batches.clear()
+            for batch in batches:
+                self._dispatch(batch)
+
+    def close(self) -> None:
+        """Send all pending batches and wait for every request to finish."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def _dispatch(self, batch: _Batch) -> None:
+        self._executor.submit(self._send, batch)
+
+    def _send(self, batch: _Batch) -> None:
+        # Futures can no longer be cancelled once running, so the results
+        # below cannot race a caller's `cancel()`; cancelled ones are skipped.
+        waiters = [
+            waiter for waiter in batch.waiters if waiter.set_running_or_notify_cancel()
+        ]
+        try:
+            response = self.client.send_email_to_contact(batch.request())
+        except Exception as exc:
+            for waiter in waiters:
+                waiter.set_exception(exc)
+        else:
+            for waiter in waiters:
+                waiter.set_result(response)
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                timeout: Optional[float] = None
+                for key, batch in list(self._batches.items()):
+                    due_at = batch.created_at + self.linger
+                    if due_at <= now:
+                        self._dispatch(self._batches.pop(key))
+                    elif timeout is None or due_at - now < timeout:
+                        timeout = due_at - now
+                self._condition.wait(timeout)
+
+
+class AsyncEmailToContactBatcher:
+    """
+    Asyncio counterpart of `EmailToContactBatcher`.
+
+    Must be created and used from a running event loop.
+
+    Example:
+        async with AsyncEmailToContactBatcher(client) as batcher:
+            results = await asyncio.gather(*(batcher.send(e) for e in emails))
+    """
+
+    def __init__(
+        self,
+        client: "IndiePitcherAsyncClient",
+        max_batch_size: int = 100,
+        linger: float = 0.05,
+        max_concurrency: int = 4,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            client: Async client used to send the batched requests
+            max_batch_size: Maximum recipients per request (default: 100)
+            linger: Seconds to wait for more sends to join a batch (default: 0.05)
+            max_concurrency: Maximum number of batches sent at once (default: 4)
+        """
+        _validate(max_batch_size, linger, max_concurrency)
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.linger = linger
+        self._batches: Dict[str, _Batch] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: "Set[asyncio.Task[None]]" = set()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._closed = False
+
+    async def __aenter__(self) -> "AsyncEmailToContactBatcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def submit(self, email: SendEmailToContact) -> "asyncio.Future[EmptyResponse]":
+        """
+        Queue a send and return a future resolved once its batch is sent.
+
+        Raises:
+            RuntimeError: If the batcher is closed
+            ValueError: If the email has no recipient
+        """
+        if self._closed:
+            raise RuntimeError("Batcher is closed")
+        recipients = _recipients(email)
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[EmptyResponse]" = loop.create_future()
+        key = _batch_key(email)
+        batch = self._batches.get(key)
+        if batch is not None and (
+            len(batch.recipients) + len(recipients) > self.max_batch_size
+            or not set(recipients).isdisjoint(batch.recipients)
+        ):
+            self._dispatch(key)
+            batch = None
+        if batch is None:
+            batch = _Batch(template=email, created_at=loop.time())
+            self._batches[key] = batch
+            self._timers[key] = loop.call_later(self.linger, self._dispatch, key)
+        batch.recipients.extend(recipients)
+        batch.waiters.append(future)
+        if len(batch.recipients) >= self.max_batch_size:
+            self._dispatch(key)
+        return future
+
+    async def send(self, email: SendEmailToContact) -> EmptyResponse:
+        """Queue a send and wait until its batch has been sent."""
+        return await self.submit(email)
+
+    def flush(self) -> None:
+        """Start sending all pending batches without waiting for their linger time."""
+        for key in list(self._batches):
+            self._dispatch(key)
+
+    async def close(self) -> None:
+        """Send all pending batches and wait for every request to finish."""
+        self._closed = True
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self, key: str) -> None:
+        batch = self._batches.pop(key, None)
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        if batch is None:
+            return
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: _Batch) -> None:
+        async with self._semaphore:
+            try:
+                response = await self.client.send_email_to_contact(batch.request())
+            except Exception as exc:
+                for waiter in batch.waiters:
+                    if not waiter.done():
+                        waiter.set_exception(exc)
+            else:
+                for waiter in batch.waiters:
+                    if not waiter.done():
+                        waiter.set_result(response)
@@ -0,0 +1,349 @@
+"""Helpers for running many API operations with bounded concurrency."""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+    Union,
+)
+
+from .models import Contact, CreateContact, DataResponse
+
+if TYPE_CHECKING:
+    # Imported at runtime only by the async helpers, so that importing the
+    # synchronous client does not pay for loading asyncio.
+    import asyncio
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Maximum number of contacts accepted by a single `/contacts/create_many` call.
+MAX_CONTACTS_PER_REQUEST = 100
+
+
+@dataclass
+class ItemResult(Generic[T, R]):
+    """Outcome of a single operation in a bulk run."""
+
+    index: int
+    item: T
+    result: Optional[R] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation completed without raising."""
+        return self.error is None
+
+    def unwrap(self) -> R:
+        """Return the result, re-raising the captured exception if there is one."""
+        if self.error is not None:
+            raise self.error
+        return self.result  # type: ignore[return-value]
+
+
+@dataclass
+class BulkImportResult:
+    """Aggregated report of a chunked contact import."""
+
+    chunks: List[ItemResult[List[CreateContact], DataResponse[Contact]]] = field(
+        default_factory=list
+    )
+
+    @property
+    def total(self) -> int:
+        """Number of contacts submitted."""
+        return sum(len(chunk.item) for chunk in self.chunks)
+
+    @property
+    def succeeded(self) -> int:
+        """Number of contacts in chunks that were accepted by the API."""
+        return sum(len(chunk.item) for chunk in self.chunks if chunk.ok)
+
+    @property
+    def failed_chunks(
+        self,
+    ) -> List[ItemResult[List[CreateContact], DataResponse[Contact]]]:
+        """Chunks whose request raised an error."""
+        return [chunk for chunk in self.chunks if not chunk.ok]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every chunk was imported successfully."""
+        return not self.failed_chunks
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most `size` items."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+async def achunked(
+    items: Union[Iterable[T], AsyncIterable[T]], size: int
+) -> AsyncIterator[List[T]]:
+    """Split an iterable or async iterable into lists of at most `size` items."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    chunk: List[T] = []
+    async for item in aiterate(items):
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def aiterate(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    """Iterate over either a regular or an async iterable."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _call(fn: Callable[[T], R], index: int, item: T) -> ItemResult[T, R]:
+    try:
+        return ItemResult(index=index, item=item, result=fn(item))
+    except Exception as exc:
+        return ItemResult(index=index, item=item, error=exc)
+
+
+def thread_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = 4,
+    ordered: bool = True,
+    window: Optional[int] = None,
+) -> Iterator[ItemResult[T, R]]:
+    """
+    Run `fn` over `items` on a thread pool, yielding one result per item.
+
+    At most `window` items are pulled from `items` ahead of the consumer,
+    running or with their result waiting to be consumed, so arbitrarily
+    large (or lazy) inputs use bounded memory. Exceptions are captured on
+    the returned `ItemResult` instead of aborting the run.
+
+    Args:
+        fn: Operation to run for every item
+        items: Items to process
+        max_workers: Number of worker threads (default: 4)
+        ordered: Yield results in input order (default) or as they complete
+        window: Maximum number of items pulled ahead of the consumer
+            (default: `2 * max_workers`)
+
+    Raises:
+        ValueError: If `max_workers` or `window` is less than 1, when called
+            rather than on the first result
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if window is None:
+        window = max_workers * 2
+    elif window < 1:
+        raise ValueError("window must be at least 1")
+    return _thread_map(fn, items, max_workers, ordered, window)
+
+
+def _thread_map(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    ordered: bool,
+    window: int,
+) -> Iterator[ItemResult[T, R]]:
+    source = enumerate(items)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    in_order: Deque["Future[ItemResult[T, R]]"] = deque()
+    pending: Set["Future[ItemResult[T, R]]"] = set()
+
+    def submit_next() -> bool:
+        for index, item in source:
+            # Run in a copy of the caller's context, so that the calls share
+            # its deadline.
+            future = executor.submit(copy_context().run, _call, fn, index, item)
+            if ordered:
+                in_order.append(future)
+            pending.add(future)
+            return True
+        return False
+
+    try:
+        while len(pending) < window and submit_next():
+            pass
+        while pending:
+            if ordered:
+                future = in_order.popleft()
+                done = {future}
+                future.result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                yield future.result()
+                submit_next()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def task_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    max_concurrency: int = 4,
+    ordered: bool = True,
+) -> AsyncGenerator[ItemResult[T, R], None]:
+    """
+    Run the coroutine function `fn` over `items` with bounded concurrency.
+
+    Only `max_concurrency` tasks exist at any time and the input is consumed
+    lazily, which gives natural backpressure on large or async inputs.
+    Exceptions are captured on the returned `ItemResult`. Closing the
+    iterator early cancels the tasks still in flight.
+
+    Args:
+        fn: Coroutine function to run for every item
+        items: Items to process, as an iterable or async iterable
+        max_concurrency: Maximum number of concurrent tasks (default: 4)
+        ordered: Yield results in input order (default) or as they complete
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1, when called rather
+            than on the first result
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    return _task_map(fn, items, max_concurrency, ordered)
+
+
+async def _task_map(
+    fn: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    max_concurrency: int,
+    ordered: bool,
+) -> AsyncGenerator[ItemResult[T, R], None]:
+    import asyncio
+
+    async def run(index: int, item: T) -> ItemResult[T, R]:
+        try:
+            return ItemResult(index=index, item=item, result=await fn(item))
+        except Exception as exc:
+            return ItemResult(index=index, item=item, error=exc)
+
+    source = aiterate(items).__aiter__()
+    next_index = 0
+    exhausted = False
+    in_order: Deque["asyncio.Task[ItemResult[T, R]]"] = deque()
+    pending: Set["asyncio.Task[ItemResult[T, R]]"] = set()
+
+    async def fill() -> None:
+        nonlocal next_index, exhausted
+        while not exhausted and len(pending) < max_concurrency:
+            try:
+                item = await source.__anext__()
+            except StopAsyncIteration:
+                exhausted = True
+                return
+            task = asyncio.ensure_future(run(next_index, item))
+            next_index += 1
+            if ordered:
+                in_order.append(task)
+            pending.add(task)
+
+    try:
+        await fill()
+        while pending:
+            done: Iterable["asyncio.Task[ItemResult[T, R]]"]
+            if ordered:
+                task = in_order.popleft()
+                await asyncio.wait({task})
+                done = (task,)
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+            for task in done:
+                pending.discard(task)
+                yield task.result()
+            await fill()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _sorted_chunks(
+    results: Iterable[ItemResult[List[CreateContact], DataResponse[Contact]]],
+) -> BulkImportResult:
+    chunks = sorted(results, key=lambda chunk: chunk.index)
+    return BulkImportResult(chunks=chunks)
+
+
+def import_contacts(
+    create_contacts: Callable[[List[CreateContact]], DataResponse[Contact]],
+    contacts: Iterable[CreateContact],
+    chunk_size: int = MAX_CONTACTS_PER_REQUEST,
+    max_concurrency: int = 4,
+) -> BulkImportResult:
+    """Chunk `contacts` and send the chunks through `create_contacts` on threads."""
+    _validate_chunk_size(chunk_size)
+    return _sorted_chunks(
+        thread_map(
+            create_contacts,
+            chunked(contacts, chunk_size),
+            max_workers=max_concurrency,
+            ordered=False,
+        )
+    )
+
+
+async def aimport_contacts(
+    create_contacts: Callable[[List[CreateContact]], Awaitable[DataResponse[Contact]]],
+    contacts: Union[Iterable[CreateContact], AsyncIterable[CreateContact]],
+    chunk_size: int = MAX_CONTACTS_PER_REQUEST,
+    max_concurrency: int = 4,
+) -> BulkImportResult:
+    """Chunk `contacts` and send the chunks through `create_contacts` as tasks."""
+    _validate_chunk_size(chunk_size)
+    results = [
+        chunk
+        async for chunk in task_map(
+            create_contacts,
+            achunked(contacts, chunk_size),
+            max_concurrency=max_concurrency,
+            ordered=False,
+        )
+    ]
+    return _sorted_chunks(results)
+
+
+def _validate_chunk_size(chunk_size: int) -> None:
+    if not 1 <= chunk_size <= MAX_CONTACTS_PER_REQUEST:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_CONTACTS_PER_REQUEST}")
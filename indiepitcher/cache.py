@@ -0,0 +1,132 @@
+"""In-process read-through cache for contact lookups."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from ._fork import reset_after_fork
+from .models import Contact, DataResponse
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ContactCache:
+    """
+    Size-bounded LRU cache with a TTL for `get_contact` responses.
+
+    Pass an instance to a client as `contact_cache` to serve repeated lookups
+    from memory. Writes made through the same client (`create_contact`,
+    `create_contacts`, `update_contact` and `delete_contact`) update or
+    invalidate the cached entries; changes made elsewhere become visible once
+    the entry expires. Cached responses are shared between callers and should
+    not be mutated. The cache is thread-safe.
+
+    A cache must only be shared between clients using the same API key.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of contacts to keep (default: 1024)
+            ttl: Seconds after which a cached contact is refetched (default: 60)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, DataResponse[Contact]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        reset_after_fork(self)
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock when the process forked.
+        self._lock = threading.Lock()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickled as configuration; a copy in another process starts empty.
+        return (type(self), (self.max_size, self.ttl))
+
+    @staticmethod
+    def _key(email: str) -> str:
+        return email.lower()
+
+    def get(self, email: str) -> Optional[DataResponse[Contact]]:
+        """Return the cached response for `email`, or None on a miss."""
+        key = self._key(email)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return response
+
+    def set(self, email: str, response: DataResponse[Contact]) -> None:
+        """Store the response for `email`, evicting the least recently used entry."""
+        key = self._key(email)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, email: str) -> None:
+        """Drop the cached entry for `email`, if any."""
+        with self._lock:
+            self._entries.pop(self._key(email), None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit, miss and eviction counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,260 @@
+"""Circuit breaking per endpoint group, to fail fast while the API is degraded."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ._endpoints import endpoint_group
+from ._fork import reset_after_fork
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """State of the circuit of an endpoint group."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Exception raised instead of sending a request while its circuit is open."""
+
+    def __init__(self, group: str, retry_after: float):
+        self.group = group
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit for {group} endpoints is open; retry in {retry_after:.1f} seconds"
+        )
+
+
+@dataclass
+class CircuitStats:
+    """
+    Snapshot of the circuit of an endpoint group.
+
+    Attributes:
+        state: Current state
+        consecutive_failures: Failed or slow requests since the last success
+        opened: Number of times the circuit has opened
+        rejected: Number of requests failed fast while the circuit was open
+    """
+
+    state: CircuitState
+    consecutive_failures: int
+    opened: int
+    rejected: int
+
+
+# Receives the endpoint group, the previous state and the new state.
+StateListener = Callable[[str, CircuitState, CircuitState], None]
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+        self.opened = 0
+        self.rejected = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for IndiePitcher requests, tracked per endpoint group.
+
+    A request fails when it raises a transport error (including timeouts) or
+    receives a 5xx response, and optionally when it takes longer than
+    `slow_call_duration`. After `failure_threshold` consecutive failures in an
+    endpoint group (`contacts`, `lists` or `email`), its circuit opens and
+    requests to the group raise `CircuitOpenError` immediately instead of
+    waiting for the API. After `reset_timeout` seconds the circuit becomes
+    half-open and lets up to `half_open_max_calls` requests through at a time
+    as probes; once that many probes succeed the circuit closes, and a failed
+    probe opens it again.
+
+    Like `RateLimiter`, a breaker is thread-safe and can be shared by any
+    number of sync and async clients, so they all stop calling a degraded
+    endpoint group together.
+
+    Example:
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        client = IndiePitcherClient(api_key="...", circuit_breaker=breaker)
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        slow_call_duration: Optional[float] = None,
+        on_state_change: Optional[StateListener] = None,
+    ) -> None:
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            reset_timeout: Seconds a circuit stays open before probing
+            half_open_max_calls: Concurrent probes allowed while half-open,
+                and successful probes needed to close the circuit
+            slow_call_duration: Count requests taking at least this many
+                seconds as failures (default: only errors count)
+            on_state_change: Callable receiving `(group, old_state, new_state)`
+                on every transition, for alerting
+
+        Raises:
+            ValueError: If a threshold is not positive
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError(
+                "failure_threshold and half_open_max_calls must be at least 1"
+            )
+        if reset_timeout < 0:
+            raise ValueError("reset_timeout must not be negative")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.slow_call_duration = slow_call_duration
+        self.on_state_change = on_state_change
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.RLock()
+        reset_after_fork(self)
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock when the process forked.
+        self._lock = threading.RLock()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickled as configuration; a copy in another process starts closed.
+        return (
+            type(self),
+            (
+                self.failure_threshold,
+                self.reset_timeout,
+                self.half_open_max_calls,
+                self.slow_call_duration,
+                self.on_state_change,
+            ),
+        )
+
+    def acquire(self, path: str) -> bool:
+        """
+        Let a request to `path` through, or fail fast.
+
+        Returns:
+            Whether the request is a half-open probe; pass it to `record`
+
+        Raises:
+            CircuitOpenError: If the circuit of the endpoint group is open, or
+                half-open with every probe slot taken
+        """
+        group = endpoint_group(path)
+        with self._lock:
+            circuit = self._circuit(group)
+            if circuit.state is CircuitState.OPEN:
+                remaining = circuit.opened_at + self.reset_timeout - time.monotonic()
+                if remaining > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(group, remaining)
+                self._transition(group, circuit, CircuitState.HALF_OPEN)
+            if circuit.state is CircuitState.HALF_OPEN:
+                if circuit.probes >= self.half_open_max_calls:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(group, 0.0)
+                circuit.probes += 1
+                return True
+            return False
+
+    def record(
+        self,
+        path: str,
+        probe: bool,
+        failed: Optional[bool],
+        duration: float = 0.0,
+    ) -> None:
+        """
+        Record the outcome of a request let through by `acquire`.
+
+        Args:
+            path: API path of the request
+            probe: Value returned by `acquire`
+            failed: Whether the request failed, or None if it was abandoned
+                without an outcome (e.g. cancelled)
+            duration: Seconds the request took
+        """
+        if (
+            failed is False
+            and self.slow_call_duration is not None
+            and duration >= self.slow_call_duration
+        ):
+            failed = True
+        group = endpoint_group(path)
+        with self._lock:
+            circuit = self._circuit(group)
+            if probe:
+                circuit.probes -= 1
+            if failed is None:
+                return
+            if failed:
+                circuit.consecutive_failures += 1
+                if circuit.state is CircuitState.HALF_OPEN or (
+                    circuit.state is CircuitState.CLOSED
+                    and circuit.consecutive_failures >= self.failure_threshold
+                ):
+                    self._open(group, circuit)
+                return
+            circuit.consecutive_failures = 0
+            if probe and circuit.state is CircuitState.HALF_OPEN:
+                circuit.probe_successes += 1
+                if circuit.probe_successes >= self.half_open_max_calls:
+                    self._transition(group, circuit, CircuitState.CLOSED)
+
+    def state(self, group: str) -> CircuitState:
+        """Return the state of an endpoint group's circuit, e.g. `state("email")`."""
+        with self._lock:
+            circuit = self._circuits.get(group)
+            return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def stats(self) -> Dict[str, CircuitStats]:
+        """Return a snapshot of every endpoint group that has been called."""
+        with self._lock:
+            return {
+                group: CircuitStats(
+                    state=circuit.state,
+                    consecutive_failures=circuit.consecutive_failures,
+                    opened=circuit.opened,
+                    rejected=circuit.rejected,
+                )
+                for group, circuit in self._circuits.items()
+            }
+
+    def _circuit(self, group: str) -> _Circuit:
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            circuit = self._circuits[group] = _Circuit()
+        return circuit
+
+    def _open(self, group: str, circuit: _Circuit) -> None:
+        circuit.opened_at = time.monotonic()
+        circuit.opened += 1
+        self._transition(group, circuit, CircuitState.OPEN)
+
+    def _transition(self, group: str, circuit: _Circuit, state: CircuitState) -> None:
+        previous = circuit.state
+        circuit.state = state
+        circuit.probe_successes = 0
+        if state is CircuitState.CLOSED:
+            circuit.consecutive_failures = 0
+        if previous is state or self.on_state_change is None:
+            return
+        try:
+            self.on_state_change(group, previous, state)
+        except Exception:
+            logger.exception("IndiePitcher circuit state listener failed")
@@ -1,42 +1,156 @@
-from typing import List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from datetime import datetime
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import httpx
+from pydantic import BaseModel, ValidationError
 
+from ._codec import decode_response, decode_view_page, encode_body
+from ._fork import reset_after_fork
+from .bulk import (
+    MAX_CONTACTS_PER_REQUEST,
+    BulkImportResult,
+    ItemResult,
+    import_contacts,
+    thread_map,
+)
+from .cache import ContactCache
+from .circuit import CircuitBreaker
+from .compression import (
+    Compression,
+    TransferCounter,
+    TransferStats,
+    received_bytes,
+)
+from .deadlines import (
+    DeadlineExceeded,
+    check_retry,
+    expired,
+    remaining,
+    request_timeout,
+)
+from .export import Destination, ExportResult, export_contacts
+from .hedging import HedgingPolicy, hedged_call
 from .models import (
     BaseIndiePitcherModel,
     Contact,
+    ContactPage,
+    ContactResponse,
     CreateContact,
     CreateMailingListPortalSession,
     DataResponse,
+    EmailRequest,
     EmptyResponse,
     IndiePitcherResponseError,
     MailingList,
+    MailingListPage,
     MailingListPortalSession,
+    MailingListPortalSessionResponse,
     PagedDataResponse,
     SendEmail,
     SendEmailToContact,
     SendEmailToMailingList,
     UpdateContact,
 )
+from .pagination import iter_items
+from .prepared import PreparedEmail
+from .rate_limit import RateLimiter
+from .reconcile import ReconcileReport, reconcile_contacts
+from .retry import NO_RETRY, RetryPolicy
+from .singleflight import SingleFlight, read_key
+from .tracing import CallTrace, Tracer, emit
+from .views import ContactView, ContactViewPage, MailingListView, MailingListViewPage
+
+R = TypeVar("R", bound=BaseModel)
+U = TypeVar("U")
+T = TypeVar("T")
+
+# Same connection pool limits httpx uses by default.
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+def hedge_executor(limits: Optional[httpx.Limits]) -> ThreadPoolExecutor:
+    """Thread pool for hedged requests, with a thread per pooled connection."""
+    limits = limits if limits is not None else DEFAULT_LIMITS
+    return ThreadPoolExecutor(
+        max_workers=limits.max_connections or DEFAULT_LIMITS.max_connections,
+        thread_name_prefix="indiepitcher-hedge",
+    )
 
 
 class ErrorResponse(BaseIndiePitcherModel):
     reason: str
 
 
+def response_error(response: httpx.Response) -> IndiePitcherResponseError:
+    try:
+        reason = ErrorResponse.model_validate_json(response.content).reason
+    except ValidationError:
+        # Errors from proxies and load balancers are not JSON.
+        reason = response.text or response.reason_phrase
+    return IndiePitcherResponseError(status_code=response.status_code, reason=reason)
+
+
 def raise_for_invalid_status(response: httpx.Response) -> None:
     if response.status_code >= 400:
-        decoded_response = ErrorResponse.model_validate_json(response.content)
-        raise IndiePitcherResponseError(
-            status_code=response.status_code, reason=decoded_response.reason
-        )
+        raise response_error(response)
 
 
 class IndiePitcherClient:
-    """Client for interacting with the IndiePitcher API."""
+    """
+    Client for interacting with the IndiePitcher API.
+
+    A client is safe to use from many threads at once: the httpx connection
+    pool, rate limiter, contact cache and read coalescing are thread-safe, and
+    the client's settings are not modified after construction. Share one
+    client across threads instead of creating one per thread, and use `map`
+    to run an operation over many items on a thread pool.
+
+    A client can also cross process boundaries. In a process forked after the
+    client was created (by a pre-fork server or `multiprocessing`), the client
+    opens a new connection pool instead of sharing the parent's sockets.
+    Pickling a client, e.g. to pass it to a `ProcessPoolExecutor`, pickles its
+    configuration; the copy has its own connection pool, and fresh copies of
+    the rate limiter, circuit breaker and contact cache. The tracer must be
+    picklable itself. Clients created with `http_client` or `transport` cannot
+    be pickled, and are not fork-safe either: the connections belong to the
+    HTTP client or transport passed in, so create such clients after forking.
+    """
 
     def __init__(
-        self, api_key: str, base_url: str = "https://api.indiepitcher.com/v1"
+        self,
+        api_key: str,
+        base_url: str = "https://api.indiepitcher.com/v1",
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_in_flight: Optional[int] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        contact_cache: Optional[ContactCache] = None,
+        tracer: Optional[Tracer] = None,
+        coalesce_reads: bool = False,
+        compression: Optional[Compression] = None,
+        timeout: Union[float, httpx.Timeout] = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+        http_client: Optional[httpx.Client] = None,
     ) -> None:
         """
         Initialize the IndiePitcher API client.
@@ -44,17 +158,155 @@ class IndiePitcherClient:
         Args:
             api_key: Your IndiePitcher API key
             base_url: Base URL for the IndiePitcher API (default: https://api.indiepitcher.com/v1)
+            retry_policy: How to retry failed requests (default: no retries)
+            rate_limiter: Rate limiter to throttle requests with, which may be
+                shared with other clients (default: no client-side limit)
+            max_in_flight: Maximum number of requests this client sends at
+                once; further requests wait for a free slot (default: no limit)
+            circuit_breaker: Circuit breaker that fails requests fast while an
+                endpoint group keeps failing, which may be shared with other
+                clients (default: no circuit breaking)
+            hedging: Hedging policy that sends a second GET request when the
+                first is slow and uses whichever answers first, which may be
+                shared with other clients (default: no hedging)
+            contact_cache: Cache for `get_contact` responses, kept up to date by
+                writes made through this client (default: no caching)
+            tracer: Callable receiving a `CallTrace` with timings for every
+                call, such as `OpenTelemetryTracer` (default: no tracing)
+            coalesce_reads: Let concurrent identical GET requests made from
+                different threads share one HTTP request (default: False)
+            compression: Gzip-compress request bodies above a size threshold,
+                for servers that accept `Content-Encoding: gzip`
+                (default: no compression)
+            timeout: Request timeout in seconds, or an `httpx.Timeout` with
+                per-phase values (default: 30 seconds)
+            limits: Connection pool size and keep-alive settings
+                (default: httpx defaults)
+            http2: Enable HTTP/2, which requires `indiepitcher[http2]`
+                (default: False)
+            transport: Custom httpx transport to send requests through; it
+                holds its own connections, so it is shared with forked
+                processes and the client cannot be pickled
+            http_client: Existing `httpx.Client` to share its connection pool;
+                it is not closed by this client and `limits`, `http2` and
+                `transport` must not be set
+
+        Raises:
+            ValueError: If `http_client` is combined with pool options
         """
+        # Constructor arguments, for pickling the client as its configuration
+        # and for rebuilding its connection pool in forked processes.
+        self._config: Dict[str, Any] = {
+            "api_key": api_key,
+            "base_url": base_url,
+            "retry_policy": retry_policy,
+            "rate_limiter": rate_limiter,
+            "max_in_flight": max_in_flight,
+            "circuit_breaker": circuit_breaker,
+            "hedging": hedging,
+            "contact_cache": contact_cache,
+            "tracer": tracer,
+            "coalesce_reads": coalesce_reads,
+            "compression": compression,
+            "timeout": timeout,
+            "limits": limits,
+            "http2": http2,
+            "transport": transport,
+        }
         self.api_key = api_key
         self.base_url = base_url
-        self.client = httpx.Client(
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "IndiePitcher-Python/0.1.0",
-            },
-            timeout=30.0,  # Default timeout of 30 seconds
+        self.retry_policy = retry_policy if retry_policy is not None else NO_RETRY
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        # Hedged GETs run on worker threads, so that the caller can take the
+        # first response without waiting for the slower request.
+        self._hedge_executor = hedge_executor(limits) if hedging is not None else None
+        self._owns_hedge_executor = True
+        self.max_in_flight = max_in_flight
+        self._slots = (
+            threading.BoundedSemaphore(max_in_flight)
+            if max_in_flight is not None
+            else None
+        )
+        self.contact_cache = contact_cache
+        self.tracer = tracer
+        self._reads: Optional[SingleFlight[httpx.Response]] = (
+            SingleFlight() if coalesce_reads else None
+        )
+        self.compression = compression
+        self._transfers = TransferCounter()
+        self.timeout = (
+            timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout)
+        )
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "IndiePitcher-Python/0.1.0",
+        }
+        self._gzip_headers = {**self._headers, "Content-Encoding": "gzip"}
+        if http_client is not None:
+            if limits is not None or http2 or transport is not None:
+                raise ValueError(
+                    "limits, http2 and transport cannot be combined with http_client"
+                )
+            self.client = http_client
+            self._owns_client = False
+        else:
+            self.client = self._open_pool()
+            self._owns_client = True
+        reset_after_fork(self)
+
+    def _open_pool(self) -> httpx.Client:
+        limits = self._config["limits"]
+        return httpx.Client(
+            headers=self._headers,
+            timeout=self.timeout,
+            http2=self._config["http2"],
+            transport=self._config["transport"],
+            limits=limits if limits is not None else DEFAULT_LIMITS,
+        )
+
+    def _borrow_hedge_executor(self, executor: Optional[ThreadPoolExecutor]) -> None:
+        """Run hedged requests on the thread pool of a client pool instead."""
+        if self._owns_hedge_executor and self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self._hedge_executor = executor
+        self._owns_hedge_executor = False
+
+    def _reset_after_fork(self) -> None:
+        """Replace state inherited from the parent process; runs in forked children."""
+        self._slots = (
+            threading.BoundedSemaphore(self.max_in_flight)
+            if self.max_in_flight is not None
+            else None
         )
+        if self._reads is not None:
+            self._reads = SingleFlight()
+        self._transfers = TransferCounter()
+        if self._owns_hedge_executor and self.hedging is not None:
+            # Worker threads do not survive a fork.
+            self._hedge_executor = hedge_executor(self._config["limits"])
+        if self._owns_client:
+            # The inherited connections are the parent's sockets. They are
+            # dropped without closing them, which could shut them down for
+            # the parent too.
+            self.client = self._open_pool()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the client as its configuration, for use in other processes."""
+        if not self._owns_client:
+            raise TypeError(
+                "Clients created with http_client cannot be pickled; "
+                "pickle the client configuration instead"
+            )
+        if self._config["transport"] is not None:
+            raise TypeError(
+                "Clients created with a custom transport cannot be pickled, "
+                "because the transport holds its own connections; "
+                "create the client in each process instead"
+            )
+        return (partial(type(self), **self._config), ())
 
     def __enter__(self):
         """Support context manager protocol."""
@@ -65,8 +317,247 @@ class IndiePitcherClient:
         self.close()
 
     def close(self):
-        """Close the underlying HTTP client."""
-        self.client.close()
+        """Close the underlying HTTP client, unless it was passed in."""
+        if self._owns_hedge_executor and self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        if self._owns_client:
+            self.client.close()
+
+    def transfer_stats(self) -> TransferStats:
+        """
+        Return the bytes transferred by this client so far.
+
+        Compare `bytes_sent` with `uncompressed_bytes_sent` (and likewise for
+        received bytes) to see how much bandwidth compression saves.
+        """
+        return self._transfers.stats()
+
+    def map(
+        self,
+        method: Callable[[T], U],
+        items: Iterable[T],
+        max_workers: int = 4,
+        ordered: bool = True,
+    ) -> Iterator[ItemResult[T, U]]:
+        """
+        Run a client operation over many items on a thread pool.
+
+        Items are consumed lazily and at most `2 * max_workers` are in flight,
+        so large inputs use bounded memory. An exception raised for one item is
+        captured on its result instead of aborting the batch. Keep
+        `max_workers` within the connection pool size (`limits`), or workers
+        will wait for a free connection.
+
+        Example:
+            for result in client.map(client.send_email, emails, max_workers=16):
+                if not result.ok:
+                    print(result.item.to, result.error)
+
+        Args:
+            method: Operation to run for every item, usually a bound method of
+                this client such as `client.send_email`
+            items: Items to pass to `method`, one per call
+            max_workers: Number of worker threads (default: 4)
+            ordered: Yield results in input order (default) or as they complete
+
+        Returns:
+            Iterator[ItemResult]: One result per item, with its index, the item
+                and either the return value or the exception raised
+
+        Raises:
+            ValueError: If `max_workers` is less than 1
+        """
+        return thread_map(method, items, max_workers=max_workers, ordered=ordered)
+
+    def _call(
+        self,
+        method: str,
+        path: str,
+        response_model: Type[R],
+        *,
+        idempotent: bool = False,
+        params: Optional[Dict[str, Any]] = None,
+        body: Any = None,
+        decode: Callable[[Type[R], bytes], R] = decode_response,
+    ) -> R:
+        """Encode the request, send it and decode the response, tracing each phase."""
+        trace = CallTrace(method=method, endpoint=path, started_at=time.time())
+        started = time.perf_counter()
+        try:
+            content = None
+            headers = self._headers
+            if body is not None:
+                content = encode_body(body)
+                trace.uncompressed_bytes_sent = len(content)
+                if self.compression is not None:
+                    compressed = self.compression.compress(content)
+                    if compressed is not None:
+                        content, headers = compressed, self._gzip_headers
+                trace.bytes_sent = len(content)
+            trace.serialize_time = time.perf_counter() - started
+            if self._reads is not None and method == "GET":
+                response, trace.coalesced = self._reads.do(
+                    read_key(path, params),
+                    lambda: self._send(
+                        method,
+                        path,
+                        trace,
+                        idempotent=idempotent,
+                        params=params,
+                        content=content,
+                        headers=headers,
+                    ),
+                )
+                if trace.coalesced:
+                    trace.status_code = response.status_code
+                    trace.bytes_received = received_bytes(response)
+                    trace.uncompressed_bytes_received = len(response.content)
+            else:
+                response = self._send(
+                    method,
+                    path,
+                    trace,
+                    idempotent=idempotent,
+                    params=params,
+                    content=content,
+                    headers=headers,
+                )
+            decode_started = time.perf_counter()
+            result = decode(response_model, response.content)
+            trace.decode_time = time.perf_counter() - decode_started
+            return result
+        except Exception as exc:
+            trace.error = exc
+            raise
+        finally:
+            trace.duration = time.perf_counter() - started
+            emit(self.tracer, trace)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        trace: CallTrace,
+        *,
+        idempotent: bool,
+        params: Optional[Dict[str, Any]],
+        content: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> httpx.Response:
+        """Send a request, applying rate limiting and the retry policy."""
+        started_at = time.monotonic()
+        attempt = 1
+        while True:
+            # Checked first, so that an open circuit fails fast instead of
+            # waiting for a rate limit token or an in-flight slot.
+            probe = (
+                self.circuit_breaker.acquire(path)
+                if self.circuit_breaker is not None
+                else False
+            )
+            with ExitStack() as slot:
+                trace.attempts = attempt
+                try:
+                    if self.rate_limiter is not None:
+                        self.rate_limiter.acquire(path)
+                    slot.enter_context(self._slot())
+                    timeout = request_timeout(self.timeout)
+                    network_started = time.perf_counter()
+                    response = self._request(
+                        method,
+                        path,
+                        trace,
+                        params=params,
+                        content=content,
+                        headers=headers,
+                        timeout=timeout,
+                    )
+                except httpx.TransportError as exc:
+                    elapsed = time.perf_counter() - network_started
+                    trace.network_time += elapsed
+                    # A timeout shortened by the deadline says nothing about
+                    # the health of the API.
+                    cut_short = expired()
+                    self._record_outcome(
+                        path, probe, None if cut_short else True, elapsed
+                    )
+                    if cut_short:
+                        raise DeadlineExceeded(
+                            "Deadline exceeded during the request"
+                        ) from exc
+                    delay = self.retry_policy.next_delay(
+                        attempt, started_at, idempotent, error=exc
+                    )
+                    if delay is None:
+                        raise
+                    failure: Exception = exc
+                except BaseException:
+                    self._record_outcome(path, probe, None)
+                    raise
+                else:
+                    elapsed = time.perf_counter() - network_started
+                    trace.network_time += elapsed
+                    self._record_outcome(
+                        path, probe, response.status_code >= 500, elapsed
+                    )
+                    trace.status_code = response.status_code
+                    trace.bytes_received = received_bytes(response)
+                    trace.uncompressed_bytes_received = len(response.content)
+                    self._transfers.record(
+                        trace.bytes_sent, trace.uncompressed_bytes_sent, response
+                    )
+                    if response.status_code < 400:
+                        return response
+                    failure = response_error(response)
+                    delay = self.retry_policy.next_delay(
+                        attempt, started_at, idempotent, response=response
+                    )
+                    if delay is None:
+                        raise failure
+            check_retry(delay, failure)
+            time.sleep(delay)
+            attempt += 1
+
+    def _request(
+        self, method: str, path: str, trace: CallTrace, **kwargs: Any
+    ) -> httpx.Response:
+        """Make one HTTP request, hedged if it is a GET and the client hedges."""
+        url = f"{self.base_url}{path}"
+
+        def send() -> httpx.Response:
+            return self.client.request(method, url, **kwargs)
+
+        hedging, executor = self.hedging, self._hedge_executor
+        if hedging is None or executor is None or method != "GET":
+            return send()
+
+        def send_hedge() -> httpx.Response:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path)
+            return send()
+
+        response, hedged = hedged_call(hedging, path, executor, send, send_hedge)
+        trace.hedged = trace.hedged or hedged
+        return response
+
+    @contextmanager
+    def _slot(self) -> Iterator[None]:
+        """Hold one of the `max_in_flight` request slots, if there is a limit."""
+        if self._slots is None:
+            yield
+            return
+        if not self._slots.acquire(timeout=remaining()):
+            raise DeadlineExceeded("Deadline exceeded waiting for a request slot")
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+    def _record_outcome(
+        self, path: str, probe: bool, failed: Optional[bool], duration: float = 0.0
+    ) -> None:
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(path, probe, failed, duration)
 
     # Contact Management
 
@@ -74,6 +565,9 @@ class IndiePitcherClient:
         """
         Find a contact by email.
 
+        If the client has a `contact_cache`, cached contacts are returned
+        without a request.
+
         Args:
             email: The email address of the contact to find
 
@@ -83,11 +577,20 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.get(
-            f"{self.base_url}/contacts/find", params={"email": email}
+        if self.contact_cache is not None:
+            cached = self.contact_cache.get(email)
+            if cached is not None:
+                return cached
+        found = self._call(
+            "GET",
+            "/contacts/find",
+            ContactResponse,
+            idempotent=True,
+            params={"email": email},
         )
-        raise_for_invalid_status(response)
-        return DataResponse[Contact].model_validate_json(response.content)
+        if self.contact_cache is not None:
+            self.contact_cache.set(email, found)
+        return found
 
     def list_contacts(
         self, page: int = 1, per_page: int = 20
@@ -105,11 +608,86 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.get(
-            f"{self.base_url}/contacts", params={"page": page, "per": per_page}
+        return self._call(
+            "GET",
+            "/contacts",
+            ContactPage,
+            idempotent=True,
+            params={"page": page, "per": per_page},
+        )
+
+    def iter_contacts(
+        self, per_page: int = 100, prefetch: int = 4
+    ) -> Iterator[Contact]:
+        """
+        Iterate over all contacts, fetching pages concurrently.
+
+        The first page is used to learn the total number of contacts; the
+        remaining pages are then fetched on a thread pool with up to `prefetch`
+        requests in flight, and the contacts are yielded in order.
+
+        Args:
+            per_page: Number of contacts per page (default: 100)
+            prefetch: Maximum number of pages fetched concurrently (default: 4)
+
+        Returns:
+            Iterator[Contact]: All contacts, in server order
+
+        Raises:
+            indiepitcher.IndiePitcherResponseError: If fetching a page fails
+        """
+        return iter_items(self.list_contacts, per_page, prefetch)
+
+    def list_contacts_lazy(
+        self, page: int = 1, per_page: int = 20
+    ) -> PagedDataResponse[ContactView]:
+        """
+        List contacts with pagination, as lazy views.
+
+        Unlike `list_contacts`, the contacts are not validated up front: each
+        `ContactView` keeps the raw JSON object and validates a field only when
+        it is read. Use this to scan large audiences for a few fields, and call
+        `ContactView.to_contact()` for the contacts that need the full model.
+
+        Args:
+            page: Page number (default: 1)
+            per_page: Number of contacts per page (default: 20)
+
+        Returns:
+            PagedDataResponse[ContactView]: Paginated list of contact views
+
+        Raises:
+            indiepitcher.IndiePitcherResponseError: If the request fails
+        """
+        return self._call(
+            "GET",
+            "/contacts",
+            ContactViewPage,
+            idempotent=True,
+            params={"page": page, "per": per_page},
+            decode=decode_view_page,
         )
-        raise_for_invalid_status(response)
-        return PagedDataResponse[Contact].model_validate_json(response.content)
+
+    def iter_contacts_lazy(
+        self, per_page: int = 100, prefetch: int = 4
+    ) -> Iterator[ContactView]:
+        """
+        Iterate over all contacts as lazy views, fetching pages concurrently.
+
+        Pages are fetched like in `iter_contacts`, on a thread pool; see
+        `list_contacts_lazy` for how views differ from `Contact`.
+
+        Args:
+            per_page: Number of contacts per page (default: 100)
+            prefetch: Maximum number of pages fetched concurrently (default: 4)
+
+        Returns:
+            Iterator[ContactView]: All contacts, in server order
+
+        Raises:
+            indiepitcher.IndiePitcherResponseError: If fetching a page fails
+        """
+        return iter_items(self.list_contacts_lazy, per_page, prefetch)
 
     def create_contact(self, contact: CreateContact) -> DataResponse[Contact]:
         """
@@ -124,12 +702,16 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.post(
-            f"{self.base_url}/contacts/create",
-            json=contact.model_dump(by_alias=True, exclude_none=True),
+        result = self._call(
+            "POST",
+            "/contacts/create",
+            ContactResponse,
+            idempotent=bool(contact.update_if_exists),
+            body=contact,
         )
-        raise_for_invalid_status(response)
-        return DataResponse[Contact].model_validate_json(response.content)
+        if self.contact_cache is not None:
+            self.contact_cache.set(result.data.email, result)
+        return result
 
     def create_contacts(self, contacts: List[CreateContact]) -> DataResponse[Contact]:
         """
@@ -145,15 +727,138 @@ class IndiePitcherClient:
             indiepitcher.IndiePitcherResponseError: If the request fails
             ValueError: If more than 100 contacts are provided
         """
-        response = self.client.post(
-            f"{self.base_url}/contacts/create_many",
-            json=[
-                contact.model_dump(by_alias=True, exclude_none=True)
-                for contact in contacts
-            ],
+        response = self._call(
+            "POST",
+            "/contacts/create_many",
+            ContactResponse,
+            idempotent=all(contact.update_if_exists for contact in contacts),
+            body=contacts,
+        )
+        if self.contact_cache is not None:
+            for contact in contacts:
+                self.contact_cache.invalidate(contact.email)
+        return response
+
+    def import_contacts(
+        self,
+        contacts: Iterable[CreateContact],
+        chunk_size: int = MAX_CONTACTS_PER_REQUEST,
+        max_concurrency: int = 4,
+    ) -> BulkImportResult:
+        """
+        Import any number of contacts in server-sized chunks.
+
+        The contacts are consumed lazily, split into chunks of `chunk_size` and
+        sent through `create_contacts` on a thread pool, with at most
+        `max_concurrency` requests in flight. A failing chunk does not abort the
+        import; its error is recorded in the returned report.
+
+        Args:
+            contacts: Iterable of contacts to create
+            chunk_size: Number of contacts per request (default: 100, max 100)
+            max_concurrency: Maximum number of concurrent requests (default: 4)
+
+        Returns:
+            BulkImportResult: Per-chunk results of the import
+
+        Raises:
+            ValueError: If `chunk_size` or `max_concurrency` is out of range
+        """
+        return import_contacts(
+            self.create_contacts, contacts, chunk_size, max_concurrency
+        )
+
+    def export_contacts(
+        self,
+        dest: Destination,
+        format: str = "ndjson",
+        per_page: int = 100,
+        prefetch: int = 4,
+        resume: bool = True,
+    ) -> ExportResult:
+        """
+        Stream every contact to an NDJSON, CSV or Parquet file.
+
+        Pages are fetched on a thread pool with up to `prefetch` requests in
+        flight and written as they arrive, so memory use does not grow with
+        the audience. Contacts are written as returned by the API, with
+        camelCase field names; in CSV files, lists and custom properties are
+        JSON-encoded. Parquet output requires `pyarrow`.
+
+        When `dest` is a path, NDJSON and CSV exports record their progress in
+        `<dest>.checkpoint`, and a failed export continues from the last
+        written page when run again with `resume=True`.
+
+        Args:
+            dest: File path, or a binary stream to write to
+            format: `"ndjson"`, `"csv"` or `"parquet"` (default: `"ndjson"`)
+            per_page: Number of contacts per page (default: 100)
+            prefetch: Maximum number of pages fetched concurrently (default: 4)
+            resume: Continue from an existing checkpoint (default: True)
+
+        Returns:
+            ExportResult: Number of contacts and pages exported
+
+        Raises:
+            indiepitcher.IndiePitcherResponseError: If fetching a page fails
+            ValueError: If the format is unknown, or the checkpoint was written
+                with different options
+            ImportError: If Parquet output is requested without pyarrow
+        """
+        return export_contacts(
+            self.list_contacts_lazy, dest, format, per_page, prefetch, resume
+        )
+
+    def reconcile_contacts(
+        self,
+        contacts: Iterable[CreateContact],
+        delete_missing: bool = False,
+        dry_run: bool = False,
+        max_concurrency: int = 4,
+        per_page: int = 100,
+        prefetch: int = 4,
+    ) -> ReconcileReport:
+        """
+        Make the contacts on the server match a local source of truth.
+
+        Every server contact is listed once to build a compact index, which is
+        diffed against `contacts` to find the contacts to create, the changed
+        fields and list subscription deltas to update and, with
+        `delete_missing`, the contacts to delete. Only those changes are sent:
+        creates in chunks through `import_contacts`, then updates and deletes
+        with up to `max_concurrency` requests in flight.
+
+        A field that is None in a desired contact is left unchanged, as are
+        custom properties when they are empty. List subscriptions are replaced
+        by the desired ones unless `ignore_list_subscriptions_when_updating`
+        is set.
+
+        Args:
+            contacts: Desired contacts; emails are matched case-insensitively
+            delete_missing: Delete server contacts missing from `contacts`
+                (default: False)
+            dry_run: Only compute the changes, without applying them
+                (default: False)
+            max_concurrency: Maximum number of concurrent writes (default: 4)
+            per_page: Number of contacts per page when listing (default: 100)
+            prefetch: Maximum number of pages fetched concurrently (default: 4)
+
+        Returns:
+            ReconcileReport: The planned changes and the result of each write
+
+        Raises:
+            indiepitcher.IndiePitcherResponseError: If listing the contacts fails
+            ValueError: If an email appears more than once in `contacts`
+        """
+        return reconcile_contacts(
+            self,
+            contacts,
+            delete_missing,
+            dry_run,
+            max_concurrency,
+            per_page,
+            prefetch,
         )
-        raise_for_invalid_status(response)
-        return DataResponse[Contact].model_validate_json(response.content)
 
     def update_contact(self, contact: UpdateContact) -> DataResponse[Contact]:
         """
@@ -168,12 +873,16 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.patch(
-            f"{self.base_url}/contacts/update",
-            json=contact.model_dump(by_alias=True, exclude_none=True),
+        result = self._call(
+            "PATCH",
+            "/contacts/update",
+            ContactResponse,
+            idempotent=True,
+            body=contact,
         )
-        raise_for_invalid_status(response)
-        return DataResponse[Contact].model_validate_json(response.content)
+        if self.contact_cache is not None:
+            self.contact_cache.set(result.data.email, result)
+        return result
 
     def delete_contact(self, email: str) -> EmptyResponse:
         """
@@ -188,11 +897,12 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.post(
-            f"{self.base_url}/contacts/delete", json={"email": email}
+        response = self._call(
+            "POST", "/contacts/delete", EmptyResponse, body={"email": email}
         )
-        raise_for_invalid_status(response)
-        return EmptyResponse.model_validate_json(response.content)
+        if self.contact_cache is not None:
+            self.contact_cache.invalidate(email)
+        return response
 
     # Mailing List Management
 
@@ -212,11 +922,60 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.get(
-            f"{self.base_url}/lists", params={"page": page, "per": per_page}
+        return self._call(
+            "GET",
+            "/lists",
+            MailingListPage,
+            idempotent=True,
+            params={"page": page, "per": per_page},
+        )
+
+    def list_mailing_lists_lazy(
+        self, page: int = 1, per_page: int = 10
+    ) -> PagedDataResponse[MailingListView]:
+        """
+        Get mailing lists as lazy views that validate fields on access.
+
+        Args:
+            page: Page number (default: 1)
+            per_page: Number of lists per page (default: 10)
+
+        Returns:
+            PagedDataResponse[MailingListView]: Paginated list of mailing list views
+
+        Raises:
+            indiepitcher.IndiePitcherResponseError: If the request fails
+        """
+        return self._call(
+            "GET",
+            "/lists",
+            MailingListViewPage,
+            idempotent=True,
+            params={"page": page, "per": per_page},
+            decode=decode_view_page,
         )
-        raise_for_invalid_status(response)
-        return PagedDataResponse[MailingList].model_validate_json(response.content)
+
+    def iter_mailing_lists(
+        self, per_page: int = 100, prefetch: int = 4
+    ) -> Iterator[MailingList]:
+        """
+        Iterate over all mailing lists, fetching pages concurrently.
+
+        The first page is used to learn the total number of mailing lists; the
+        remaining pages are then fetched on a thread pool with up to `prefetch`
+        requests in flight, and the mailing lists are yielded in order.
+
+        Args:
+            per_page: Number of mailing lists per page (default: 100)
+            prefetch: Maximum number of pages fetched concurrently (default: 4)
+
+        Returns:
+            Iterator[MailingList]: All mailing lists, in server order
+
+        Raises:
+            indiepitcher.IndiePitcherResponseError: If fetching a page fails
+        """
+        return iter_items(self.list_mailing_lists, per_page, prefetch)
 
     def create_mailing_list_portal_session(
         self, session: CreateMailingListPortalSession
@@ -233,13 +992,12 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.post(
-            f"{self.base_url}/lists/portal_session",
-            json=session.model_dump(by_alias=True, exclude_none=True),
-        )
-        raise_for_invalid_status(response)
-        return DataResponse[MailingListPortalSession].model_validate_json(
-            response.content
+        return self._call(
+            "POST",
+            "/lists/portal_session",
+            MailingListPortalSessionResponse,
+            idempotent=True,
+            body=session,
         )
 
     # Email Sending
@@ -257,12 +1015,12 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.post(
-            f"{self.base_url}/email/transactional",
-            json=email.model_dump(by_alias=True, exclude_none=True),
+        return self._call(
+            "POST",
+            "/email/transactional",
+            EmptyResponse,
+            body=email,
         )
-        raise_for_invalid_status(response)
-        return EmptyResponse.model_validate_json(response.content)
 
     def send_email_to_contact(self, email: SendEmailToContact) -> EmptyResponse:
         """
@@ -277,12 +1035,47 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.post(
-            f"{self.base_url}/email/contact",
-            json=email.model_dump(by_alias=True, exclude_none=True),
+        return self._call(
+            "POST",
+            "/email/contact",
+            EmptyResponse,
+            body=email,
+        )
+
+    def send_prepared(
+        self,
+        email: PreparedEmail,
+        recipient: str,
+        delay_seconds: Optional[float] = None,
+        delay_until_date: Optional[datetime] = None,
+    ) -> EmptyResponse:
+        """
+        Send a prepared email to one recipient.
+
+        Only the recipient and delay are encoded; the rest of the request body
+        is reused from `email`, which makes repeated sends of large bodies cheap.
+
+        Args:
+            email: Email prepared with `PreparedEmail`
+            recipient: Email address to send to
+            delay_seconds: Delay before sending, for emails to contacts
+                (default: the delay of the prepared email)
+            delay_until_date: Date to send at, for emails to contacts
+                (default: the delay of the prepared email)
+
+        Returns:
+            EmptyResponse: Success response
+
+        Raises:
+            TypeError: If a delay is given for a transactional email
+            indiepitcher.IndiePitcherResponseError: If the request fails
+        """
+        return self._call(
+            "POST",
+            email.path,
+            EmptyResponse,
+            body=email.render(recipient, delay_seconds, delay_until_date),
         )
-        raise_for_invalid_status(response)
-        return EmptyResponse.model_validate_json(response.content)
 
     def send_email_to_mailing_list(
         self, email: SendEmailToMailingList
@@ -299,9 +1092,45 @@ class IndiePitcherClient:
         Raises:
             indiepitcher.IndiePitcherResponseError: If the request fails
         """
-        response = self.client.post(
-            f"{self.base_url}/email/list",
-            json=email.model_dump(by_alias=True, exclude_none=True),
+        return self._call(
+            "POST",
+            "/email/list",
+            EmptyResponse,
+            body=email,
         )
-        raise_for_invalid_status(response)
-        return EmptyResponse.model_validate_json(response.content)
+
+    def send_many(
+        self,
+        emails: Iterable[EmailRequest],
+        max_workers: int = 4,
+        ordered: bool = False,
+    ) -> Iterator[ItemResult[EmailRequest, EmptyResponse]]:
+        """
+        Send any number of emails on a thread pool.
+
+        Each item is sent with `send_email`, `send_email_to_contact` or
+        `send_email_to_mailing_list` depending on its type. Emails are
+        consumed lazily, like in `map`, and a failed send is reported on its
+        result and does not stop the others.
+
+        Args:
+            emails: Email requests to send
+            max_workers: Number of worker threads (default: 4)
+            ordered: Yield results in input order instead of as they complete
+                (default: False)
+
+        Returns:
+            Iterator[ItemResult]: One result per email
+        """
+        return thread_map(
+            self._send_any, emails, max_workers=max_workers, ordered=ordered
+        )
+
+    def _send_any(self, email: EmailRequest) -> EmptyResponse:
+        if isinstance(email, SendEmail):
+            return self.send_email(email)
+        if isinstance(email, SendEmailToContact):
+            return self.send_email_to_contact(email)
+        if isinstance(email, SendEmailToMailingList):
+            return self.send_email_to_mailing_list(email)
+        raise TypeError(f"Cannot send {type(email).__name__}")
@@ -0,0 +1,111 @@
+"""Gzip compression of large request bodies and counters of transferred bytes."""
+
+import threading
+import zlib
+from dataclasses import dataclass, replace
+from typing import Optional
+
+import httpx
+
+# zlib window bits selecting the gzip container instead of a raw zlib stream.
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+@dataclass(frozen=True)
+class Compression:
+    """
+    Configuration for gzip-compressing request bodies.
+
+    Only bodies of at least `threshold` bytes are compressed, since small JSON
+    bodies gain little and the CPU time is better spent elsewhere. A body is
+    sent as-is if compressing it does not make it smaller. Responses are
+    decompressed by httpx whenever the server compresses them, with or
+    without this setting.
+
+    Attributes:
+        threshold: Minimum size of a request body to compress, in bytes
+        level: Gzip compression level, from 1 (fastest) to 9 (smallest)
+    """
+
+    threshold: int = 4096
+    level: int = 6
+
+    def __post_init__(self) -> None:
+        if self.threshold < 0:
+            raise ValueError("threshold must not be negative")
+        if not 1 <= self.level <= 9:
+            raise ValueError("level must be between 1 and 9")
+
+    def compress(self, content: bytes) -> Optional[bytes]:
+        """Return the gzip-compressed body, or None if it should be sent as-is."""
+        if len(content) < self.threshold:
+            return None
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, _GZIP_WBITS)
+        compressed = compressor.compress(content) + compressor.flush()
+        return compressed if len(compressed) < len(content) else None
+
+
+@dataclass
+class TransferStats:
+    """
+    Snapshot of the bytes a client transferred.
+
+    Sizes are of request and response bodies, over every HTTP attempt that
+    received a response, including retries.
+
+    Attributes:
+        requests: Number of HTTP responses received
+        bytes_sent: Request body bytes sent, after compression
+        bytes_received: Response body bytes received, before decompression
+        uncompressed_bytes_sent: Request body bytes before compression
+        uncompressed_bytes_received: Response body bytes after decompression
+    """
+
+    requests: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    uncompressed_bytes_sent: int = 0
+    uncompressed_bytes_received: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes that compression kept off the network, in both directions."""
+        return (
+            self.uncompressed_bytes_sent
+            - self.bytes_sent
+            + self.uncompressed_bytes_received
+            - self.bytes_received
+        )
+
+
+def received_bytes(response: httpx.Response) -> int:
+    """Size of a response body as received, before decompression."""
+    # Responses that were built already read, such as those of mock
+    # transports, report no downloaded bytes.
+    return response.num_bytes_downloaded or len(response.content)
+
+
+class TransferCounter:
+    """Thread-safe running totals behind `TransferStats`."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats = TransferStats()
+
+    def record(
+        self, sent: int, uncompressed_sent: int, response: httpx.Response
+    ) -> None:
+        """Count one request body and the response received for it."""
+        received = received_bytes(response)
+        with self._lock:
+            stats = self._stats
+            stats.requests += 1
+            stats.bytes_sent += sent
+            stats.uncompressed_bytes_sent += uncompressed_sent
+            stats.bytes_received += received
+            stats.uncompressed_bytes_received += len(response.content)
+
+    def stats(self) -> TransferStats:
+        """Return a snapshot of the totals."""
+        with self._lock:
+            return replace(self._stats)
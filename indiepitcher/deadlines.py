@@ -0,0 +1,176 @@
+"""Time budgets that bound every request made within a block of code."""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Exception raised when a call does not finish within the current deadline."""
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """
+    A point in time by which calls must finish.
+
+    Attributes:
+        expires_at: Expiry as a `time.monotonic()` timestamp
+    """
+
+    expires_at: float
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, or 0 if it has passed."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar(
+    "indiepitcher_deadline", default=None
+)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[Deadline]:
+    """
+    Bound every client call made within the block by a total time budget.
+
+    Every request, retry and page fetched within the block shares the budget:
+    request timeouts are shortened to the time left, a retry whose backoff
+    would end after the deadline is not attempted, waits for a rate limit
+    token or an in-flight slot are bounded by the deadline, and calls raise
+    `DeadlineExceeded` once the budget is spent. Async requests in flight
+    when the deadline passes are cancelled. Nested deadlines can only shorten
+    the budget of the enclosing one.
+
+    The deadline is stored in a context variable, so it follows the calls
+    into the worker threads of `map`, bulk imports and page prefetching, and
+    into the tasks of the async client.
+
+    Example:
+        with deadline(2.0):
+            contact = client.get_contact(email)
+
+    Args:
+        seconds: Budget for the block, in seconds
+
+    Yields:
+        Deadline: The effective deadline
+    """
+    expires_at = time.monotonic() + seconds
+    enclosing = _current.get()
+    if enclosing is not None:
+        expires_at = min(expires_at, enclosing.expires_at)
+    token = _current.set(Deadline(expires_at))
+    try:
+        yield Deadline(expires_at)
+    finally:
+        _current.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline of the enclosing `deadline()` block, if any."""
+    return _current.get()
+
+
+def clear_deadline() -> None:
+    """Remove the deadline from the current context, for work shared by callers."""
+    _current.set(None)
+
+
+def remaining() -> Optional[float]:
+    """
+    Seconds left in the current deadline, or None without a deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    current = _current.get()
+    if current is None:
+        return None
+    left = current.expires_at - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+    return left
+
+
+def request_timeout(timeout: httpx.Timeout) -> httpx.Timeout:
+    """
+    Shorten each phase of a request timeout to the time left in the deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed
+    """
+    left = remaining()
+    if left is None:
+        return timeout
+    return httpx.Timeout(
+        connect=_shorter(timeout.connect, left),
+        read=_shorter(timeout.read, left),
+        write=_shorter(timeout.write, left),
+        pool=_shorter(timeout.pool, left),
+    )
+
+
+def _shorter(phase: Optional[float], left: float) -> float:
+    return left if phase is None else min(phase, left)
+
+
+def allows_wait(delay: float) -> bool:
+    """Whether a wait of `delay` seconds would end before the current deadline."""
+    current = _current.get()
+    return current is None or time.monotonic() + delay < current.expires_at
+
+
+def check_retry(delay: float, error: BaseException) -> None:
+    """
+    Make sure a retry after `delay` seconds would start before the deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before or during the delay,
+            chained to the error that caused the retry
+    """
+    if not allows_wait(delay):
+        raise DeadlineExceeded("Deadline exceeded before the retry") from error
+
+
+def expired() -> bool:
+    """Whether the deadline of the enclosing `deadline()` block has passed."""
+    current = _current.get()
+    return current is not None and current.expired
+
+
+async def within_deadline(awaitable: Awaitable[T]) -> T:
+    """
+    Await `awaitable`, cancelling it if the current deadline passes first.
+
+    Raises:
+        DeadlineExceeded: If the deadline passes before `awaitable` finishes
+    """
+    import asyncio
+
+    try:
+        left = remaining()
+    except DeadlineExceeded:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+    if left is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, left)
+    except DeadlineExceeded:
+        raise
+    except asyncio.TimeoutError as exc:
+        raise DeadlineExceeded("Deadline exceeded during the request") from exc
@@ -0,0 +1,316 @@
+"""Streaming export of every contact to NDJSON, CSV or Parquet."""
+
+import csv
+import io
+import json
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import IO, Any, Awaitable, Callable, Dict, List, Optional, Type, Union
+
+from pydantic_core import to_json
+
+from .models import Contact, PagedDataResponse
+from .pagination import aiter_pages, iter_pages
+from .views import ContactView
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+# Columns of CSV and Parquet exports, named as in the API.
+COLUMNS = [field.alias or name for name, field in Contact.model_fields.items()]
+
+Destination = Union[str, "os.PathLike[str]", IO[bytes]]
+FetchViewPage = Callable[[int, int], PagedDataResponse[ContactView]]
+AsyncFetchViewPage = Callable[[int, int], Awaitable[PagedDataResponse[ContactView]]]
+
+
+@dataclass
+class ExportResult:
+    """
+    Summary of a finished export.
+
+    Attributes:
+        contacts: Number of contacts in the exported file, including those
+            written before a resume
+        pages: Number of pages fetched by this run
+        resumed_from: Page the export resumed at, if a checkpoint was found
+    """
+
+    contacts: int
+    pages: int
+    resumed_from: Optional[int] = None
+
+
+class _Writer(ABC):
+    """Writes pages of contacts to a binary stream in one format."""
+
+    def __init__(self, stream: IO[bytes]) -> None:
+        self.stream = stream
+
+    def start(self) -> None:
+        """Write what precedes the contacts in a new file; skipped on resume."""
+
+    @abstractmethod
+    def write(self, contacts: List[ContactView]) -> None:
+        """Write one page of contacts."""
+
+    def close(self) -> None:
+        """Write what follows the contacts, once the last page is written."""
+
+
+class _NdjsonWriter(_Writer):
+    def write(self, contacts: List[ContactView]) -> None:
+        self.stream.write(b"".join(to_json(view.raw) + b"\n" for view in contacts))
+
+
+class _CsvWriter(_Writer):
+    def __init__(self, stream: IO[bytes]) -> None:
+        super().__init__(stream)
+        self._buffer = io.StringIO()
+        self._csv = csv.writer(self._buffer)
+
+    def start(self) -> None:
+        self._csv.writerow(COLUMNS)
+        self._flush()
+
+    def write(self, contacts: List[ContactView]) -> None:
+        for view in contacts:
+            self._csv.writerow([_csv_value(view.raw.get(column)) for column in COLUMNS])
+        self._flush()
+
+    def _flush(self) -> None:
+        self.stream.write(self._buffer.getvalue().encode("utf-8"))
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+class _ParquetWriter(_Writer):
+    def __init__(self, stream: IO[bytes]) -> None:
+        super().__init__(stream)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet export requires pyarrow; "
+                "install it with `pip install indiepitcher[parquet]`"
+            ) from exc
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("email", pa.string()),
+                ("userId", pa.string()),
+                ("name", pa.string()),
+                ("avatarURL", pa.string()),
+                ("languageCode", pa.string()),
+                ("hardBouncedAt", pa.timestamp("us", tz="UTC")),
+                ("subscribedToLists", pa.list_(pa.string())),
+                ("customProperties", pa.string()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(stream, self._schema)
+
+    def write(self, contacts: List[ContactView]) -> None:
+        rows = [
+            {
+                "email": view.email,
+                "userId": view.user_id,
+                "name": view.name,
+                "avatarURL": view.avatar_url,
+                "languageCode": view.language_code,
+                "hardBouncedAt": view.hard_bounced_at,
+                "subscribedToLists": view.subscribed_to_lists,
+                "customProperties": json.dumps(view.custom_properties),
+            }
+            for view in contacts
+        ]
+        # One row group per page keeps memory bounded by the page size.
+        self._writer.write_table(self._pa.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS: Dict[str, Type[_Writer]] = {
+    "ndjson": _NdjsonWriter,
+    "csv": _CsvWriter,
+    "parquet": _ParquetWriter,
+}
+
+
+class _Export:
+    """File handling and checkpointing shared by the sync and async exports."""
+
+    def __init__(
+        self, dest: Destination, format: str, per_page: int, resume: bool
+    ) -> None:
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+        self.format = format
+        self.per_page = per_page
+        self.contacts = 0
+        self.pages = 0
+        self.start_page = 1
+        self.resumed_from: Optional[int] = None
+        self.checkpoint_path: Optional[str] = None
+        self._owns_stream = isinstance(dest, (str, os.PathLike))
+
+        if isinstance(dest, (str, os.PathLike)):
+            path = os.fspath(dest)
+            # Parquet files are only readable once their footer is written,
+            # so a partial Parquet export cannot be continued.
+            if format != "parquet":
+                self.checkpoint_path = f"{path}.checkpoint"
+            state = self._load_checkpoint() if resume else None
+            if state is not None:
+                self.stream: IO[bytes] = open(path, "r+b")
+                self.stream.truncate(state["offset"])
+                self.stream.seek(state["offset"])
+                self.contacts = state["contacts"]
+                self.start_page = self.resumed_from = state["page"] + 1
+            else:
+                self.stream = open(path, "wb")
+        else:
+            self.stream = dest
+        try:
+            self.writer = _WRITERS[format](self.stream)
+            if self.resumed_from is None:
+                self.writer.start()
+        except BaseException:
+            self.abort()
+            raise
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as file:
+            state = json.load(file)
+        if state["format"] != self.format or state["per_page"] != self.per_page:
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} was written for "
+                f"format={state['format']!r}, per_page={state['per_page']}; "
+                "pass the same options or delete the checkpoint to start over"
+            )
+        return state
+
+    def write_page(self, page: PagedDataResponse[ContactView]) -> None:
+        self.writer.write(page.data)
+        self.contacts += len(page.data)
+        self.pages += 1
+        if self.checkpoint_path is not None:
+            # The data must be in the file before the checkpoint points past it.
+            self.stream.flush()
+            state = {
+                "format": self.format,
+                "per_page": self.per_page,
+                "page": page.metadata.page,
+                "offset": self.stream.tell(),
+                "contacts": self.contacts,
+            }
+            temporary = f"{self.checkpoint_path}.tmp"
+            with open(temporary, "w") as file:
+                json.dump(state, file)
+            os.replace(temporary, self.checkpoint_path)
+
+    def finish(self) -> ExportResult:
+        self.writer.close()
+        if self._owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+        if self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+        return ExportResult(
+            contacts=self.contacts, pages=self.pages, resumed_from=self.resumed_from
+        )
+
+    def abort(self) -> None:
+        if self._owns_stream:
+            self.stream.close()
+
+
+def export_contacts(
+    fetch_page: FetchViewPage,
+    dest: Destination,
+    format: str = "ndjson",
+    per_page: int = 100,
+    prefetch: int = 4,
+    resume: bool = True,
+) -> ExportResult:
+    """
+    Stream every contact to a file, one page at a time.
+
+    Pages are fetched concurrently on a thread pool and written in order as
+    soon as they arrive. At most `prefetch` pages are being fetched, waiting
+    or being written at any time, so memory use is bounded by `prefetch`
+    pages rather than by the size of the audience.
+
+    When `dest` is a path and the format is NDJSON or CSV, a
+    `<dest>.checkpoint` file records the last page written. If the export
+    fails, running it again with `resume=True` truncates any partially
+    written page and continues after the checkpoint. The checkpoint is
+    removed once the export finishes. Pages are addressed by number, so
+    contacts added or deleted while an export is paused can shift between
+    pages.
+
+    Args:
+        fetch_page: Function taking `(page, per_page)` and returning a page of
+            contact views
+        dest: File path, or a binary stream to write to
+        format: `"ndjson"`, `"csv"` or `"parquet"` (default: `"ndjson"`)
+        per_page: Number of contacts per page (default: 100)
+        prefetch: Maximum number of pages fetched concurrently (default: 4)
+        resume: Continue from an existing checkpoint (default: True)
+
+    Returns:
+        ExportResult: Number of contacts and pages exported
+
+    Raises:
+        ValueError: If the format is unknown, or the checkpoint was written
+            with different options
+        ImportError: If Parquet output is requested without pyarrow
+    """
+    export = _Export(dest, format, per_page, resume)
+    try:
+        for page in iter_pages(fetch_page, per_page, prefetch, export.start_page):
+            export.write_page(page)
+    except BaseException:
+        export.abort()
+        raise
+    return export.finish()
+
+
+async def aexport_contacts(
+    fetch_page: AsyncFetchViewPage,
+    dest: Destination,
+    format: str = "ndjson",
+    per_page: int = 100,
+    prefetch: int = 4,
+    resume: bool = True,
+) -> ExportResult:
+    """
+    Stream every contact to a file, one page at a time.
+
+    Async counterpart of `export_contacts`: pages are fetched as concurrent
+    tasks. Each page is written to the file from the event loop; writes are
+    a single page in size.
+    """
+    export = _Export(dest, format, per_page, resume)
+    pages = aiter_pages(fetch_page, per_page, prefetch, export.start_page)
+    try:
+        async for page in pages:
+            export.write_page(page)
+    except BaseException:
+        export.abort()
+        raise
+    finally:
+        await pages.aclose()
+    return export.finish()
@@ -0,0 +1,297 @@
+"""Hedged requests that cut the tail latency of idempotent reads."""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from ._fork import reset_after_fork
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+# Hedges that may be banked while requests are fast, so that a sudden
+# slowdown cannot release an unbounded burst of extra requests.
+_MAX_BANKED_HEDGES = 10.0
+
+# New samples after which the adaptive delay of an endpoint is recomputed.
+_RECOMPUTE_EVERY = 10
+
+
+@dataclass
+class HedgingStats:
+    """
+    Counters of a `HedgingPolicy`.
+
+    Attributes:
+        requests: Requests that were eligible for hedging
+        hedges: Hedge requests sent
+        hedge_wins: Hedges that answered before the request they hedged
+    """
+
+    requests: int
+    hedges: int
+    hedge_wins: int
+
+
+class _Latencies:
+    def __init__(self, window: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.delay: Optional[float] = None
+        self.new_samples = 0
+
+
+class HedgingPolicy:
+    """
+    Hedging of GET requests, to cut the tail latency caused by slow connections.
+
+    When the response to a GET request has not arrived after the hedge delay,
+    an identical request is sent on another connection and whichever answers
+    first is used. The delay is either fixed (`delay`) or the `percentile` of
+    the latencies recently observed for the endpoint, so that only the
+    slowest requests are hedged; adaptive hedging starts once `min_samples`
+    latencies have been observed.
+
+    The extra load is bounded by `max_ratio`: every request earns that
+    fraction of a hedge, and a hedge is only sent when a whole one has been
+    earned. Only GET requests are hedged, because they are idempotent and
+    sending them twice is harmless.
+
+    Like `CircuitBreaker`, a policy is thread-safe and can be shared by any
+    number of sync and async clients, which then share its hedge budget.
+
+    Example:
+        hedging = HedgingPolicy(percentile=0.95, max_ratio=0.05)
+        client = IndiePitcherClient(api_key="...", hedging=hedging)
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        max_ratio: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        """
+        Initialize the hedging policy.
+
+        Args:
+            delay: Seconds to wait for a response before hedging (default:
+                adapt to the observed latencies)
+            percentile: Latency percentile to use as the delay when `delay` is
+                not set, between 0 and 1 (default: 0.95)
+            max_ratio: Maximum number of hedges per request (default: 0.05)
+            min_samples: Latencies to observe for an endpoint before adaptive
+                hedging starts
+            window: Number of recent latencies kept per endpoint
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if delay is not None and delay < 0:
+            raise ValueError("delay must not be negative")
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0 <= max_ratio <= 1:
+            raise ValueError("max_ratio must be between 0 and 1")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("min_samples must be at least 1 and at most window")
+        self.delay = delay
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies: Dict[str, _Latencies] = {}
+        self._budget = 0.0
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+        reset_after_fork(self)
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock when the process forked.
+        self._lock = threading.Lock()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Pickled as configuration; a copy in another process starts without
+        # observed latencies or hedge budget.
+        return (
+            type(self),
+            (
+                self.delay,
+                self.percentile,
+                self.max_ratio,
+                self.min_samples,
+                self.window,
+            ),
+        )
+
+    def hedge_delay(self, path: str) -> Optional[float]:
+        """
+        Count a request to `path` and return how long to wait before hedging it.
+
+        Returns:
+            Seconds to wait for a response before sending a hedge, or None if
+            the request must not be hedged
+        """
+        with self._lock:
+            self._requests += 1
+            self._budget = min(_MAX_BANKED_HEDGES, self._budget + self.max_ratio)
+            if self._budget < 1:
+                return None
+            if self.delay is not None:
+                return self.delay
+            latencies = self._latencies.get(path)
+            if latencies is None or len(latencies.samples) < self.min_samples:
+                return None
+            if latencies.delay is None or latencies.new_samples >= _RECOMPUTE_EVERY:
+                ordered = sorted(latencies.samples)
+                index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+                latencies.delay = ordered[index]
+                latencies.new_samples = 0
+            return latencies.delay
+
+    def acquire_hedge(self) -> bool:
+        """Spend one hedge from the budget, returning whether one was left."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self._hedges += 1
+            return True
+
+    def record_latency(self, path: str, seconds: float) -> None:
+        """Record how long a request to `path` took to answer."""
+        with self._lock:
+            latencies = self._latencies.get(path)
+            if latencies is None:
+                latencies = self._latencies[path] = _Latencies(self.window)
+            latencies.samples.append(seconds)
+            latencies.new_samples += 1
+
+    def record_win(self) -> None:
+        """Record that a hedge answered before the request it hedged."""
+        with self._lock:
+            self._hedge_wins += 1
+
+    def stats(self) -> HedgingStats:
+        """Return the policy's counters."""
+        with self._lock:
+            return HedgingStats(
+                requests=self._requests,
+                hedges=self._hedges,
+                hedge_wins=self._hedge_wins,
+            )
+
+
+def _timed(policy: HedgingPolicy, path: str, send: Callable[[], T]) -> T:
+    started = time.perf_counter()
+    result = send()
+    policy.record_latency(path, time.perf_counter() - started)
+    return result
+
+
+async def _atimed(
+    policy: HedgingPolicy, path: str, send: Callable[[], Awaitable[T]]
+) -> T:
+    started = time.perf_counter()
+    result = await send()
+    policy.record_latency(path, time.perf_counter() - started)
+    return result
+
+
+def hedged_call(
+    policy: HedgingPolicy,
+    path: str,
+    executor: Executor,
+    send: Callable[[], T],
+    send_hedge: Callable[[], T],
+) -> Tuple[T, bool]:
+    """
+    Run `send`, and `send_hedge` as well if `send` is slower than the hedge delay.
+
+    Both run on `executor`, so that the caller can take the first result
+    without waiting for the other request, which finishes in the background.
+
+    Returns:
+        The first successful result, and whether a hedge was sent
+
+    Raises:
+        Exception: The error of `send` if both calls fail
+    """
+    delay = policy.hedge_delay(path)
+    if delay is None:
+        return _timed(policy, path, send), False
+    primary = executor.submit(copy_context().run, _timed, policy, path, send)
+    done, _ = wait([primary], timeout=delay)
+    if done or not policy.acquire_hedge():
+        return primary.result(), False
+    hedge = executor.submit(copy_context().run, _timed, policy, path, send_hedge)
+    pending = {primary, hedge}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in (primary, hedge):
+            if future in done and future.exception() is None:
+                if future is hedge:
+                    policy.record_win()
+                return future.result(), True
+    return primary.result(), True
+
+
+async def ahedged_call(
+    policy: HedgingPolicy,
+    path: str,
+    send: Callable[[], Awaitable[T]],
+    send_hedge: Callable[[], Awaitable[T]],
+) -> Tuple[T, bool]:
+    """
+    Async counterpart of `hedged_call`; the slower request is cancelled.
+
+    Returns:
+        The first successful result, and whether a hedge was sent
+
+    Raises:
+        Exception: The error of `send` if both calls fail
+    """
+    import asyncio
+
+    delay = policy.hedge_delay(path)
+    if delay is None:
+        return await _atimed(policy, path, send), False
+    primary: "asyncio.Future[T]" = asyncio.ensure_future(_atimed(policy, path, send))
+    hedge: "Optional[asyncio.Future[T]]" = None
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not policy.acquire_hedge():
+            return await primary, False
+        hedge = asyncio.ensure_future(_atimed(policy, path, send_hedge))
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+            for task in (primary, hedge):
+                if task in done and task.exception() is None:
+                    if task is hedge:
+                        policy.record_win()
+                    return task.result(), True
+        return primary.result(), True
+    finally:
+        for slower in (primary, hedge):
+            if slower is not None and not slower.done():
+                slower.cancel()
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.alias_generators import to_camel
@@ -27,6 +27,9 @@ class BaseIndiePitcherModel(BaseModel):
         populate_by_name=True,
         alias_generator=to_camel_patched,
         arbitrary_types_allowed=True,
+        # Validators and serializers are built on first use rather than at
+        # import time, so only the models a program touches pay for it.
+        defer_build=True,
     )
 
 
@@ -161,6 +164,17 @@ class SendEmailToMailingList(BaseIndiePitcherModel):
     track_email_link_clicks: Optional[bool] = None
 
 
+# Any of the email send requests.
+EmailRequest = Union[SendEmail, SendEmailToContact, SendEmailToMailingList]
+
+
+# Concrete response shapes, parametrized once instead of on every call.
+ContactResponse = DataResponse[Contact]
+ContactPage = PagedDataResponse[Contact]
+MailingListPage = PagedDataResponse[MailingList]
+MailingListPortalSessionResponse = DataResponse[MailingListPortalSession]
+
+
 class IndiePitcherResponseError(Exception):
     """Exception raised when an API request returns an error response."""
 
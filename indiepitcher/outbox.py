@@ -0,0 +1,442 @@
+"""Durable SQLite-backed outbox for sending emails in the background."""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+
+from .bulk import task_map, thread_map
+from .models import (
+    BaseIndiePitcherModel,
+    EmailRequest,
+    EmptyResponse,
+    IndiePitcherResponseError,
+    SendEmail,
+    SendEmailToContact,
+    SendEmailToMailingList,
+)
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from .async_client import IndiePitcherAsyncClient
+    from .client import IndiePitcherClient
+
+logger = logging.getLogger(__name__)
+
+OutboxEmail = EmailRequest
+
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+# Outbox kind -> (request model, client method used to send it)
+_KINDS: Dict[str, Tuple[Type[BaseIndiePitcherModel], str]] = {
+    "transactional": (SendEmail, "send_email"),
+    "contact": (SendEmailToContact, "send_email_to_contact"),
+    "list": (SendEmailToMailingList, "send_email_to_mailing_list"),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    leased_until REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS outbox_ready ON outbox (status, available_at);
+"""
+
+# Delivery attempts and backoff used by flushers when none is given.
+DEFAULT_OUTBOX_RETRY = RetryPolicy(
+    max_attempts=10, initial_backoff=1.0, max_backoff=300.0
+)
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """A message claimed from the outbox for delivery."""
+
+    id: int
+    kind: str
+    payload: str
+    attempts: int
+
+    def email(self) -> OutboxEmail:
+        """Decode the stored request model."""
+        model, _ = _KINDS[self.kind]
+        return model.model_validate_json(self.payload)  # type: ignore[return-value]
+
+
+def _kind(email: OutboxEmail) -> str:
+    for kind, (model, _) in _KINDS.items():
+        if type(email) is model:
+            return kind
+    raise TypeError(f"Cannot enqueue {type(email).__name__}")
+
+
+class Outbox:
+    """
+    Durable queue of emails to send, stored in a local SQLite database.
+
+    Enqueueing is a local write that returns immediately. A flusher
+    (`OutboxFlusher` or `AsyncOutboxFlusher`) claims messages, sends them and
+    marks them as sent. Claimed messages are leased: if the process dies
+    before a message is marked, the lease expires and the message is sent
+    again, so delivery is at-least-once.
+
+    The outbox can be shared between threads of one process.
+    """
+
+    def __init__(self, path: str, lease_timeout: float = 300.0) -> None:
+        """
+        Open (and create if needed) an outbox database.
+
+        Args:
+            path: Path of the SQLite database file
+            lease_timeout: Seconds after which a claimed but unfinished message
+                is considered abandoned and sent again (default: 300)
+        """
+        self.path = path
+        self.lease_timeout = lease_timeout
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> "Outbox":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+    def enqueue(self, email: OutboxEmail, delay: float = 0.0) -> int:
+        """
+        Store an email for background delivery.
+
+        Args:
+            email: The email to send
+            delay: Seconds to wait before the email may be sent (default: 0)
+
+        Returns:
+            int: The id of the outbox message
+        """
+        kind = _kind(email)
+        payload = email.model_dump_json(by_alias=True, exclude_none=True)
+        now = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO outbox (kind, payload, status, available_at, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (kind, payload, PENDING, now + delay, now),
+            )
+        return int(cursor.lastrowid or 0)
+
+    def claim(self, limit: int) -> List[OutboxEntry]:
+        """Lease up to `limit` messages that are due, including abandoned ones."""
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    "SELECT id, kind, payload, attempts FROM outbox"
+                    " WHERE (status = ? AND available_at <= ?)"
+                    " OR (status = ? AND leased_until <= ?)"
+                    " ORDER BY id LIMIT ?",
+                    (PENDING, now, SENDING, now, limit),
+                ).fetchall()
+                self._db.executemany(
+                    "UPDATE outbox SET status = ?, leased_until = ?,"
+                    " attempts = attempts + 1 WHERE id = ?",
+                    [(SENDING, now + self.lease_timeout, row[0]) for row in rows],
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return [
+            OutboxEntry(id=row[0], kind=row[1], payload=row[2], attempts=row[3] + 1)
+            for row in rows
+        ]
+
+    def complete(self, entry_id: int) -> None:
+        """Mark a message as sent."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE outbox SET status = ?, leased_until = NULL, sent_at = ?"
+                " WHERE id = ?",
+                (SENT, time.time(), entry_id),
+            )
+
+    def fail(self, entry_id: int, error: str, retry_in: Optional[float]) -> None:
+        """Record a failed attempt and reschedule it, or give up if `retry_in` is None."""
+        with self._lock:
+            if retry_in is None:
+                self._db.execute(
+                    "UPDATE outbox SET status = ?, leased_until = NULL, last_error = ?"
+                    " WHERE id = ?",
+                    (FAILED, error, entry_id),
+                )
+            else:
+                self._db.execute(
+                    "UPDATE outbox SET status = ?, leased_until = NULL, last_error = ?,"
+                    " available_at = ? WHERE id = ?",
+                    (PENDING, error, time.time() + retry_in, entry_id),
+                )
+
+    def counts(self) -> Dict[str, int]:
+        """Number of messages per status."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT status, COUNT(*) FROM outbox GROUP BY status"
+            ).fetchall()
+        return {status: count for status, count in rows}
+
+    def purge_sent(self, older_than: float = 0.0) -> int:
+        """Delete sent messages older than `older_than` seconds and return their number."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM outbox WHERE status = ? AND sent_at <= ?",
+                (SENT, time.time() - older_than),
+            )
+        return cursor.rowcount
+
+
+class _FlusherBase:
+    def __init__(
+        self,
+        outbox: Outbox,
+        max_concurrency: int,
+        batch_size: int,
+        poll_interval: float,
+        retry_policy: Optional[RetryPolicy],
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.outbox = outbox
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retry_policy = retry_policy or DEFAULT_OUTBOX_RETRY
+
+    def _record(self, entry: OutboxEntry, error: Optional[BaseException]) -> None:
+        if error is None:
+            self.outbox.complete(entry.id)
+            return
+        permanent = (
+            isinstance(error, IndiePitcherResponseError)
+            and 400 <= error.status_code < 500
+            and error.status_code not in (408, 429)
+        )
+        retry_in: Optional[float] = None
+        if not permanent and entry.attempts < self.retry_policy.max_attempts:
+            retry_in = self.retry_policy.backoff(entry.attempts)
+        self.outbox.fail(entry.id, repr(error), retry_in)
+
+
+class OutboxFlusher(_FlusherBase):
+    """
+    Background thread that drains an `Outbox` through a synchronous client.
+
+    Example:
+        outbox = Outbox("outbox.db")
+        with OutboxFlusher(outbox, client):
+            outbox.enqueue(email)
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        client: "IndiePitcherClient",
+        max_concurrency: int = 4,
+        batch_size: int = 50,
+        poll_interval: float = 0.5,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """
+        Initialize the flusher.
+
+        Args:
+            outbox: Outbox to drain
+            client: Client used to send the emails
+            max_concurrency: Maximum number of concurrent sends (default: 4)
+            batch_size: Messages claimed per round (default: 50)
+            poll_interval: Seconds to wait when the outbox is empty (default: 0.5)
+            retry_policy: Delivery attempts and backoff between them
+                (default: 10 attempts, 1s to 5min backoff)
+        """
+        super().__init__(
+            outbox, max_concurrency, batch_size, poll_interval, retry_policy
+        )
+        self.client = client
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "OutboxFlusher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start draining the outbox on a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="indiepitcher-outbox", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, drain: bool = True) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            drain: Send all messages that are already due before returning
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if drain:
+            while self.flush_once():
+                pass
+
+    def flush_once(self) -> int:
+        """Claim and send one round of due messages, returning how many were claimed."""
+        entries = self.outbox.claim(self.batch_size)
+        for result in thread_map(
+            self._send, entries, max_workers=self.max_concurrency, ordered=False
+        ):
+            self._record(result.item, result.error)
+        return len(entries)
+
+    def _send(self, entry: OutboxEntry) -> EmptyResponse:
+        _, method = _KINDS[entry.kind]
+        return getattr(self.client, method)(entry.email())
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                claimed = self.flush_once()
+            except Exception:
+                # Messages stay in the outbox, e.g. while the database is
+                # locked, so keep polling instead of stopping for good.
+                logger.exception("IndiePitcher outbox flush failed")
+                claimed = 0
+            if not claimed:
+                self._stop.wait(self.poll_interval)
+
+
+class AsyncOutboxFlusher(_FlusherBase):
+    """
+    Asyncio task that drains an `Outbox` through an async client.
+
+    Example:
+        outbox = Outbox("outbox.db")
+        async with AsyncOutboxFlusher(outbox, client):
+            outbox.enqueue(email)
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        client: "IndiePitcherAsyncClient",
+        max_concurrency: int = 4,
+        batch_size: int = 50,
+        poll_interval: float = 0.5,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> None:
+        """
+        Initialize the flusher.
+
+        Args:
+            outbox: Outbox to drain
+            client: Async client used to send the emails
+            max_concurrency: Maximum number of concurrent sends (default: 4)
+            batch_size: Messages claimed per round (default: 50)
+            poll_interval: Seconds to wait when the outbox is empty (default: 0.5)
+            retry_policy: Delivery attempts and backoff between them
+                (default: 10 attempts, 1s to 5min backoff)
+        """
+        super().__init__(
+            outbox, max_concurrency, batch_size, poll_interval, retry_policy
+        )
+        self.client = client
+        self._task: "Optional[asyncio.Task[None]]" = None
+        self._stopping: Optional[asyncio.Event] = None
+
+    async def __aenter__(self) -> "AsyncOutboxFlusher":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Start draining the outbox in a background task."""
+        if self._task is None:
+            self._stopping = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run(self._stopping))
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the background task.
+
+        Args:
+            drain: Send all messages that are already due before returning
+        """
+        if self._task is not None and self._stopping is not None:
+            # Let the current round finish so claimed messages are recorded.
+            self._stopping.set()
+            await self._task
+            self._task = None
+        if drain:
+            while await self.flush_once():
+                pass
+
+    async def flush_once(self) -> int:
+        """Claim and send one round of due messages, returning how many were claimed."""
+        entries = await asyncio.to_thread(self.outbox.claim, self.batch_size)
+        async for result in task_map(
+            self._send, entries, max_concurrency=self.max_concurrency, ordered=False
+        ):
+            await asyncio.to_thread(self._record, result.item, result.error)
+        return len(entries)
+
+    async def _send(self, entry: OutboxEntry) -> Any:
+        _, method = _KINDS[entry.kind]
+        return await getattr(self.client, method)(entry.email())
+
+    async def _run(self, stopping: asyncio.Event) -> None:
+        while not stopping.is_set():
+            try:
+                claimed = await self.flush_once()
+            except Exception:
+                # See `OutboxFlusher._run`.
+                logger.exception("IndiePitcher outbox flush failed")
+                claimed = 0
+            if not claimed:
+                try:
+                    await asyncio.wait_for(stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
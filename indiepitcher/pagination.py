@@ -0,0 +1,110 @@
+"""Iterators that walk paginated endpoints with concurrent page prefetching."""
+
+import math
+from typing import AsyncGenerator, Awaitable, Callable, Iterator, TypeVar
+
+from .bulk import task_map, thread_map
+from .models import PagedDataResponse
+
+T = TypeVar("T")
+
+
+def _last_page(first: PagedDataResponse[T]) -> int:
+    per = first.metadata.per or 1
+    return max(1, math.ceil(first.metadata.total / per))
+
+
+def _validate(per_page: int, prefetch: int) -> None:
+    if per_page < 1:
+        raise ValueError("per_page must be at least 1")
+    if prefetch < 1:
+        raise ValueError("prefetch must be at least 1")
+
+
+def iter_pages(
+    fetch_page: Callable[[int, int], PagedDataResponse[T]],
+    per_page: int,
+    prefetch: int,
+    start: int = 1,
+) -> Iterator[PagedDataResponse[T]]:
+    """
+    Yield every page of a paginated endpoint in order.
+
+    The first page is fetched on its own to learn the total item count, then
+    the remaining pages are fetched on a thread pool with up to `prefetch`
+    requests in flight. At most `prefetch` pages are fetched or held for the
+    consumer at any time.
+
+    Args:
+        fetch_page: Function taking `(page, per_page)` and returning a page
+        per_page: Number of items per page
+        prefetch: Maximum number of pages fetched concurrently
+        start: Number of the first page to fetch (default: 1)
+    """
+    _validate(per_page, prefetch)
+    first = fetch_page(start, per_page)
+    yield first
+    remaining = range(start + 1, _last_page(first) + 1)
+    for page in thread_map(
+        lambda number: fetch_page(number, per_page),
+        remaining,
+        max_workers=prefetch,
+        window=prefetch,
+    ):
+        yield page.unwrap()
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int, int], Awaitable[PagedDataResponse[T]]],
+    per_page: int,
+    prefetch: int,
+    start: int = 1,
+) -> AsyncGenerator[PagedDataResponse[T], None]:
+    """
+    Yield every page of a paginated endpoint in order.
+
+    The first page is fetched on its own to learn the total item count, then
+    the remaining pages are fetched as concurrent tasks with up to `prefetch`
+    requests in flight.
+
+    Args:
+        fetch_page: Coroutine function taking `(page, per_page)` and returning a page
+        per_page: Number of items per page
+        prefetch: Maximum number of pages fetched concurrently
+        start: Number of the first page to fetch (default: 1)
+    """
+    _validate(per_page, prefetch)
+    first = await fetch_page(start, per_page)
+    yield first
+    remaining = range(start + 1, _last_page(first) + 1)
+    pages = task_map(
+        lambda number: fetch_page(number, per_page), remaining, max_concurrency=prefetch
+    )
+    try:
+        async for page in pages:
+            yield page.unwrap()
+    finally:
+        await pages.aclose()
+
+
+def iter_items(
+    fetch_page: Callable[[int, int], PagedDataResponse[T]], per_page: int, prefetch: int
+) -> Iterator[T]:
+    """Yield every item of a paginated endpoint in order."""
+    for page in iter_pages(fetch_page, per_page, prefetch):
+        yield from page.data
+
+
+async def aiter_items(
+    fetch_page: Callable[[int, int], Awaitable[PagedDataResponse[T]]],
+    per_page: int,
+    prefetch: int,
+) -> AsyncGenerator[T, None]:
+    """Yield every item of a paginated endpoint in order."""
+    pages = aiter_pages(fetch_page, per_page, prefetch)
+    try:
+        async for page in pages:
+            for item in page.data:
+                yield item
+    finally:
+        await pages.aclose()
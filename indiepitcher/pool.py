@@ -0,0 +1,259 @@
+"""Clients for many API keys sharing one connection pool."""
+
+import threading
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Union
+
+import httpx
+
+from ._fork import reset_after_fork
+from .async_client import IndiePitcherAsyncClient
+from .circuit import CircuitBreaker
+from .client import DEFAULT_LIMITS, IndiePitcherClient, hedge_executor
+from .compression import Compression
+from .hedging import HedgingPolicy
+from .rate_limit import RateLimit, RateLimiter
+from .retry import RetryPolicy
+from .tracing import Tracer
+
+C = TypeVar("C", IndiePitcherClient, IndiePitcherAsyncClient)
+
+# Pool settings passed on to every tenant client as they are.
+_TENANT_OPTIONS = (
+    "retry_policy",
+    "circuit_breaker",
+    "hedging",
+    "tracer",
+    "coalesce_reads",
+    "compression",
+    "timeout",
+)
+
+
+class _ClientPool(ABC, Generic[C]):
+    """Configuration and tenant clients shared by the sync and async pools."""
+
+    def __init__(
+        self,
+        base_url: str = "https://api.indiepitcher.com/v1",
+        tenant_rate_limit: Optional[RateLimit] = None,
+        tenant_max_in_flight: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        tracer: Optional[Tracer] = None,
+        coalesce_reads: bool = False,
+        compression: Optional[Compression] = None,
+        timeout: Union[float, httpx.Timeout] = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            base_url: Base URL for the IndiePitcher API (default: https://api.indiepitcher.com/v1)
+            tenant_rate_limit: Request rate allowed for each API key
+                (default: no client-side limit)
+            tenant_max_in_flight: Requests each API key may have in flight at
+                once (default: no limit besides the pool size)
+            retry_policy: How tenant clients retry failed requests
+            circuit_breaker: Circuit breaker shared by every tenant client
+            hedging: Hedging policy shared by every tenant client
+            tracer: Tracer receiving the calls of every tenant client
+            coalesce_reads: Let concurrent identical GET requests of a tenant
+                share one HTTP request (default: False)
+            compression: Gzip-compress request bodies above a size threshold
+            timeout: Request timeout in seconds, or an `httpx.Timeout`
+            limits: Size of the shared connection pool (default: httpx defaults)
+            http2: Enable HTTP/2, which requires `indiepitcher[http2]`
+            transport: Custom httpx transport to send requests through; an
+                `httpx.AsyncBaseTransport` for the async pool. It holds its
+                own connections, so it is shared with forked processes and
+                the pool cannot be pickled
+
+        Raises:
+            ValueError: If `tenant_max_in_flight` is less than 1
+        """
+        if tenant_max_in_flight is not None and tenant_max_in_flight < 1:
+            raise ValueError("tenant_max_in_flight must be at least 1")
+        # Constructor arguments, for pickling and for rebuilding the shared
+        # connection pool in forked processes.
+        self._config: Dict[str, Any] = {
+            "base_url": base_url,
+            "tenant_rate_limit": tenant_rate_limit,
+            "tenant_max_in_flight": tenant_max_in_flight,
+            "retry_policy": retry_policy,
+            "circuit_breaker": circuit_breaker,
+            "hedging": hedging,
+            "tracer": tracer,
+            "coalesce_reads": coalesce_reads,
+            "compression": compression,
+            "timeout": timeout,
+            "limits": limits,
+            "http2": http2,
+            "transport": transport,
+        }
+        self._clients: Dict[str, C] = {}
+        self._lock = threading.Lock()
+        self.http_client = self._open_http_client()
+        reset_after_fork(self)
+
+    @abstractmethod
+    def _open_http_client(self) -> Any:
+        """Open the connection pool shared by the tenant clients."""
+
+    @abstractmethod
+    def _new_client(self, **options: Any) -> C:
+        """Create the client of a tenant."""
+
+    def _http_options(self) -> Dict[str, Any]:
+        limits = self._config["limits"]
+        return {
+            "timeout": self._config["timeout"],
+            "limits": limits if limits is not None else DEFAULT_LIMITS,
+            "http2": self._config["http2"],
+            "transport": self._config["transport"],
+        }
+
+    def _rebind(self, client: C) -> None:
+        """Point a tenant client at the pool's new connection pool after a fork."""
+        client.client = self.http_client
+
+    def _reset_after_fork(self) -> None:
+        """Give the forked child its own connection pool; see `IndiePitcherClient`."""
+        self._lock = threading.Lock()
+        self.http_client = self._open_http_client()
+        for client in self._clients.values():
+            self._rebind(client)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the pool as its configuration, for use in other processes."""
+        if self._config["transport"] is not None:
+            raise TypeError(
+                "Client pools created with a custom transport cannot be "
+                "pickled, because the transport holds its own connections; "
+                "create the pool in each process instead"
+            )
+        return (partial(type(self), **self._config), ())
+
+    def client(self, api_key: str) -> C:
+        """
+        Return the client for an API key, creating it on first use.
+
+        The same client is returned for every call with the same key, so its
+        rate limit, in-flight budget and read coalescing apply across callers.
+        Tenant clients do not need to be closed.
+        """
+        with self._lock:
+            client = self._clients.get(api_key)
+            if client is None:
+                config = self._config
+                rate_limit = config["tenant_rate_limit"]
+                client = self._clients[api_key] = self._new_client(
+                    api_key=api_key,
+                    base_url=config["base_url"],
+                    rate_limiter=(
+                        RateLimiter(default=rate_limit)
+                        if rate_limit is not None
+                        else None
+                    ),
+                    max_in_flight=config["tenant_max_in_flight"],
+                    http_client=self.http_client,
+                    **{option: config[option] for option in _TENANT_OPTIONS},
+                )
+            return client
+
+    def remove(self, api_key: str) -> None:
+        """Forget the client of an API key, e.g. when a customer leaves."""
+        with self._lock:
+            self._clients.pop(api_key, None)
+
+    def api_keys(self) -> List[str]:
+        """Return the API keys that have a client."""
+        with self._lock:
+            return list(self._clients)
+
+
+class IndiePitcherClientPool(_ClientPool[IndiePitcherClient]):
+    """
+    Clients for many API keys that share one connection pool.
+
+    Platforms sending on behalf of many customers can hand out a lightweight
+    client per API key with `client(api_key)` instead of opening a connection
+    pool per key. Every tenant client sends its own API key with each request
+    over the shared, already warm connections, and gets its own rate limit
+    and in-flight request budget, so a busy tenant cannot use up the
+    connections or the request rate of the others.
+
+    Example:
+        pool = IndiePitcherClientPool(
+            tenant_rate_limit=RateLimit(rate=10), tenant_max_in_flight=8
+        )
+        pool.client(customer.api_key).send_email(email)
+    """
+
+    http_client: httpx.Client
+
+    def _open_http_client(self) -> httpx.Client:
+        # Hedged requests of every tenant share one thread pool, sized like
+        # the connection pool they use, instead of one per tenant.
+        self._hedge_executor = (
+            hedge_executor(self._config["limits"])
+            if self._config["hedging"] is not None
+            else None
+        )
+        return httpx.Client(**self._http_options())
+
+    def _new_client(self, **options: Any) -> IndiePitcherClient:
+        client = IndiePitcherClient(**options)
+        client._borrow_hedge_executor(self._hedge_executor)
+        return client
+
+    def _rebind(self, client: IndiePitcherClient) -> None:
+        super()._rebind(client)
+        client._borrow_hedge_executor(self._hedge_executor)
+
+    def __enter__(self):
+        """Support context manager protocol."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the pool when exiting context manager."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the shared connection pool, which every tenant client uses."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self.http_client.close()
+
+
+class IndiePitcherAsyncClientPool(_ClientPool[IndiePitcherAsyncClient]):
+    """
+    Async clients for many API keys that share one connection pool.
+
+    Async counterpart of `IndiePitcherClientPool`; see there for details.
+    """
+
+    http_client: httpx.AsyncClient
+
+    def _open_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**self._http_options())
+
+    def _new_client(self, **options: Any) -> IndiePitcherAsyncClient:
+        return IndiePitcherAsyncClient(**options)
+
+    async def __aenter__(self):
+        """Support async context manager protocol."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the pool when exiting context manager."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the shared connection pool, which every tenant client uses."""
+        await self.http_client.aclose()
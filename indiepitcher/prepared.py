@@ -0,0 +1,104 @@
+"""Emails encoded once and sent to many recipients."""
+
+from datetime import datetime
+from typing import FrozenSet, Optional, Union
+
+from pydantic_core import to_json
+
+from .models import SendEmail, SendEmailToContact
+
+# Fields that differ between sends of a prepared email; everything else is
+# encoded once.
+_PER_SEND_FIELDS: FrozenSet[str] = frozenset(
+    {"to", "contact_email", "contact_emails", "delay_seconds", "delay_until_date"}
+)
+
+
+class PreparedEmail:
+    """
+    An email whose shared fields are encoded to JSON once, for sending the
+    same content to many recipients.
+
+    The subject, body and other shared fields of `template` are serialized
+    when the prepared email is created. Each send only encodes the recipient
+    and delay and splices them in front of the cached bytes, so a large body
+    is not serialized again for every recipient. A prepared email is
+    immutable and can be shared between threads and tasks.
+
+    Example:
+        template = SendEmail(
+            to="", subject="Receipt", body=html, body_format=EmailBodyFormat.HTML
+        )
+        prepared = PreparedEmail(template)
+        for address in recipients:
+            client.send_prepared(prepared, address)
+
+    Attributes:
+        template: The email the prepared email was created from
+        path: API path the email is sent to
+    """
+
+    def __init__(self, template: Union[SendEmail, SendEmailToContact]) -> None:
+        """
+        Encode the shared fields of an email.
+
+        Args:
+            template: Email to send; its recipient (`to` or `contact_email` and
+                `contact_emails`) is ignored and given per send instead, and its
+                delay is used for sends that do not set their own
+
+        Raises:
+            TypeError: If the email cannot be sent to a single recipient, such
+                as a `SendEmailToMailingList`
+        """
+        if isinstance(template, SendEmail):
+            self.path = "/email/transactional"
+            self._recipient_key = b'{"to":'
+        elif isinstance(template, SendEmailToContact):
+            self.path = "/email/contact"
+            self._recipient_key = b'{"contactEmail":'
+        else:
+            raise TypeError(
+                f"Cannot prepare {type(template).__name__} for per-recipient sends"
+            )
+        self.template = template
+        shared = template.__pydantic_serializer__.to_json(
+            template, by_alias=True, exclude_none=True, exclude=set(_PER_SEND_FIELDS)
+        )
+        # Drop the opening brace; every send starts a new object with its
+        # recipient and continues with the shared fields.
+        self._shared = b"," + shared[1:]
+
+    def render(
+        self,
+        recipient: str,
+        delay_seconds: Optional[float] = None,
+        delay_until_date: Optional[datetime] = None,
+    ) -> bytes:
+        """
+        Return the JSON request body for one recipient.
+
+        Args:
+            recipient: Email address to send to
+            delay_seconds: Delay before sending, for emails to contacts
+            delay_until_date: Date to send at, for emails to contacts
+
+        Raises:
+            TypeError: If a delay is given for a transactional email
+        """
+        parts = [self._recipient_key, to_json(recipient)]
+        if isinstance(self.template, SendEmailToContact):
+            if delay_seconds is None and delay_until_date is None:
+                delay_seconds = self.template.delay_seconds
+                delay_until_date = self.template.delay_until_date
+            if delay_seconds is not None:
+                parts += [b',"delaySeconds":', to_json(delay_seconds)]
+            if delay_until_date is not None:
+                parts += [b',"delayUntilDate":', to_json(delay_until_date)]
+        elif delay_seconds is not None or delay_until_date is not None:
+            raise TypeError("Transactional emails cannot be delayed")
+        parts.append(self._shared)
+        return b"".join(parts)
+
+    def __repr__(self) -> str:
+        return f"PreparedEmail({self.template!r})"
@@ -0,0 +1,159 @@
+"""Client-side token-bucket rate limiting that can be shared between clients."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ._endpoints import endpoint_group
+from ._fork import reset_after_fork
+from .deadlines import DeadlineExceeded, allows_wait
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A sustained request rate with an allowed burst.
+
+    Attributes:
+        rate: Requests per second that may be sent on average
+        burst: Number of requests that may be sent back to back after an idle
+            period (default: one second worth of requests)
+    """
+
+    rate: float
+    burst: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out reservations instead of blocking."""
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.rate = limit.rate
+        self.capacity = limit.burst if limit.burst is not None else max(1.0, limit.rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        reset_after_fork(self)
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock when the process forked.
+        self._lock = threading.Lock()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # A copy in another process starts with a full bucket of its own.
+        return (type(self), (RateLimit(self.rate, self.capacity),))
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take `tokens` from the bucket and return how long to wait before using them.
+
+        The bucket may go into debt, so concurrent callers are queued behind
+        each other in the order they reserved instead of racing for capacity.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def release(self, tokens: float = 1.0) -> None:
+        """Give back `tokens` reserved for a request that will not be sent."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + tokens)
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter for IndiePitcher requests.
+
+    A single limiter can be passed to any number of `IndiePitcherClient` and
+    `IndiePitcherAsyncClient` instances, across threads and event loops, to keep
+    their combined request rate within the API limits. Requests are throttled
+    by an optional global limit and by an optional limit for their endpoint
+    group (`contacts`, `lists` or `email`).
+
+    Limits apply within one process. A limiter pickled to worker processes
+    gives each worker a full budget of its own, so divide the rates by the
+    number of workers to keep their combined rate within the API limits.
+
+    Example:
+        limiter = RateLimiter(
+            default=RateLimit(rate=10, burst=20),
+            groups={"email": RateLimit(rate=5)},
+        )
+    """
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        groups: Optional[Mapping[str, RateLimit]] = None,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            default: Limit applied to every request
+            groups: Additional limits per endpoint group
+        """
+        self._default = TokenBucket(default) if default is not None else None
+        self._groups: Dict[str, TokenBucket] = {
+            group: TokenBucket(limit) for group, limit in (groups or {}).items()
+        }
+
+    def reserve(self, path: str) -> float:
+        """Reserve capacity for a request to `path` and return the required wait."""
+        delay = 0.0
+        if self._default is not None:
+            delay = self._default.reserve()
+        bucket = self._groups.get(endpoint_group(path))
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        return delay
+
+    def acquire(self, path: str) -> None:
+        """
+        Block the current thread until a request to `path` may be sent.
+
+        Raises:
+            DeadlineExceeded: If the wait would end after the current deadline
+        """
+        delay = self._reserve_within_deadline(path)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, path: str) -> None:
+        """
+        Wait without blocking the event loop until a request to `path` may be sent.
+
+        Raises:
+            DeadlineExceeded: If the wait would end after the current deadline
+        """
+        import asyncio
+
+        delay = self._reserve_within_deadline(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _reserve_within_deadline(self, path: str) -> float:
+        delay = self.reserve(path)
+        if delay > 0 and not allows_wait(delay):
+            # Give the capacity back, so that calls failing on their deadline
+            # do not push back the requests of other callers.
+            if self._default is not None:
+                self._default.release()
+            bucket = self._groups.get(endpoint_group(path))
+            if bucket is not None:
+                bucket.release()
+            raise DeadlineExceeded("Deadline exceeded waiting for the rate limit")
+        return delay
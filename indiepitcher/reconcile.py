@@ -0,0 +1,301 @@
+"""Reconciliation of a local list of contacts against the contacts on the server."""
+
+import json
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from pydantic_core import from_json, to_json
+
+from .bulk import BulkImportResult, ItemResult, task_map, thread_map
+from .models import CreateContact, UpdateContact
+from .views import ContactView
+
+if TYPE_CHECKING:
+    from .async_client import IndiePitcherAsyncClient
+    from .client import IndiePitcherClient
+
+# Scalar contact fields compared by the reconciliation, in fingerprint order.
+_FIELDS = ("user_id", "name", "avatar_url", "language_code")
+
+
+def _fingerprint(value: Any) -> int:
+    """Hash a value decoded from JSON, such as a field of a server contact."""
+    if value is None or isinstance(value, str):
+        return hash(value)
+    return hash(json.dumps(_integral(value), sort_keys=True, separators=(",", ":")))
+
+
+def _desired_fingerprint(value: Any) -> int:
+    """Hash a desired value in the JSON form it is sent to the server in."""
+    if value is None or isinstance(value, str):
+        return hash(value)
+    return _fingerprint(from_json(to_json(value)))
+
+
+def _integral(value: Any) -> Any:
+    # JSON does not tell 1.0 from 1, so neither does the comparison.
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return {key: _integral(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_integral(item) for item in value]
+    return value
+
+
+class _RemoteContact(NamedTuple):
+    email: str
+    fields: Tuple[int, ...]
+    custom_properties: int
+    lists: FrozenSet[str]
+
+
+class RemoteIndex:
+    """
+    Compact snapshot of the contacts on the server, keyed by lowercase email.
+
+    Only hashes of the compared fields and the list subscriptions are kept,
+    so an index of a large audience is much smaller than the contacts.
+    """
+
+    def __init__(self) -> None:
+        self._contacts: Dict[str, _RemoteContact] = {}
+
+    @classmethod
+    def from_contacts(cls, contacts: Iterable[ContactView]) -> "RemoteIndex":
+        """Build an index from contact views, such as `iter_contacts_lazy()`."""
+        index = cls()
+        for contact in contacts:
+            index.add(contact)
+        return index
+
+    @classmethod
+    async def afrom_contacts(
+        cls, contacts: AsyncIterable[ContactView]
+    ) -> "RemoteIndex":
+        """Build an index from async contact views, such as `aiter_contacts_lazy()`."""
+        index = cls()
+        async for contact in contacts:
+            index.add(contact)
+        return index
+
+    def add(self, contact: ContactView) -> None:
+        """Add or replace a contact in the index."""
+        self._contacts[contact.email.lower()] = _RemoteContact(
+            email=contact.email,
+            fields=tuple(_fingerprint(getattr(contact, name)) for name in _FIELDS),
+            custom_properties=_fingerprint(contact.custom_properties),
+            lists=frozenset(contact.subscribed_to_lists),
+        )
+
+    def get(self, email: str) -> Optional[_RemoteContact]:
+        """Return the indexed state of a contact, if it exists on the server."""
+        return self._contacts.get(email.lower())
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._contacts)
+
+
+@dataclass
+class ReconcilePlan:
+    """
+    Minimal set of changes that makes the server match the desired contacts.
+
+    Attributes:
+        creates: Contacts missing on the server
+        updates: Changed fields and list subscription deltas of existing contacts
+        deletes: Emails of server contacts missing from the desired contacts;
+            only filled when deleting was requested
+        unchanged: Number of desired contacts that already match the server
+    """
+
+    creates: List[CreateContact] = field(default_factory=list)
+    updates: List[UpdateContact] = field(default_factory=list)
+    deletes: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changes(self) -> int:
+        """Number of contacts that need a write."""
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+
+@dataclass
+class ReconcileReport:
+    """
+    Outcome of a reconciliation.
+
+    Attributes:
+        plan: The computed changes
+        dry_run: Whether the plan was only computed and not applied
+        created: Result of the chunked import of `plan.creates`
+        updated: Result of every update, in plan order
+        deleted: Result of every delete, in plan order
+    """
+
+    plan: ReconcilePlan
+    dry_run: bool = False
+    created: BulkImportResult = field(default_factory=BulkImportResult)
+    updated: List[ItemResult] = field(default_factory=list)
+    deleted: List[ItemResult] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[ItemResult]:
+        """Failed import chunks, updates and deletes."""
+        return [
+            *self.created.failed_chunks,
+            *(result for result in self.updated if not result.ok),
+            *(result for result in self.deleted if not result.ok),
+        ]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every change was applied successfully."""
+        return not self.errors
+
+
+def _diff(remote: _RemoteContact, contact: CreateContact) -> Optional[UpdateContact]:
+    changes: Dict[str, Any] = {}
+    for name, fingerprint in zip(_FIELDS, remote.fields):
+        value = getattr(contact, name)
+        if value is not None and _desired_fingerprint(value) != fingerprint:
+            changes[name] = value
+    if (
+        contact.custom_properties
+        and _desired_fingerprint(contact.custom_properties) != remote.custom_properties
+    ):
+        changes["custom_properties"] = contact.custom_properties
+    if not contact.ignore_list_subscriptions_when_updating:
+        desired = set(contact.subscribed_to_lists)
+        if desired - remote.lists:
+            changes["added_list_subscripitons"] = sorted(desired - remote.lists)
+        if remote.lists - desired:
+            changes["removed_list_subscripitons"] = sorted(remote.lists - desired)
+    if not changes:
+        return None
+    return UpdateContact(email=remote.email, **changes)
+
+
+def plan_reconcile(
+    remote: RemoteIndex,
+    contacts: Iterable[CreateContact],
+    delete_missing: bool = False,
+) -> ReconcilePlan:
+    """
+    Compute the changes that make the server match `contacts`.
+
+    A field of a desired contact that is None (or empty custom properties)
+    is left as it is on the server. List subscriptions are replaced by the
+    desired ones, like `create_contact` with `update_if_exists` does, unless
+    `ignore_list_subscriptions_when_updating` is set on the contact.
+
+    Args:
+        remote: Index of the contacts currently on the server
+        contacts: Desired contacts; emails are matched case-insensitively
+        delete_missing: Delete server contacts that are not in `contacts`
+
+    Raises:
+        ValueError: If an email appears more than once in `contacts`
+    """
+    plan = ReconcilePlan()
+    seen = set()
+    for contact in contacts:
+        key = contact.email.lower()
+        if key in seen:
+            raise ValueError(f"Contact {contact.email} appears more than once")
+        seen.add(key)
+        existing = remote.get(key)
+        if existing is None:
+            plan.creates.append(contact)
+            continue
+        update = _diff(existing, contact)
+        if update is None:
+            plan.unchanged += 1
+        else:
+            plan.updates.append(update)
+    if delete_missing:
+        plan.deletes = [
+            remote._contacts[key].email for key in remote if key not in seen
+        ]
+    return plan
+
+
+def reconcile_contacts(
+    client: "IndiePitcherClient",
+    contacts: Iterable[CreateContact],
+    delete_missing: bool,
+    dry_run: bool,
+    max_concurrency: int,
+    per_page: int,
+    prefetch: int,
+) -> ReconcileReport:
+    """Index the server, plan the changes and apply them with a synchronous client."""
+    remote = RemoteIndex.from_contacts(
+        client.iter_contacts_lazy(per_page=per_page, prefetch=prefetch)
+    )
+    report = ReconcileReport(
+        plan_reconcile(remote, contacts, delete_missing), dry_run=dry_run
+    )
+    if dry_run:
+        return report
+    report.created = client.import_contacts(
+        report.plan.creates, max_concurrency=max_concurrency
+    )
+    report.updated = list(
+        thread_map(client.update_contact, report.plan.updates, max_concurrency)
+    )
+    report.deleted = list(
+        thread_map(client.delete_contact, report.plan.deletes, max_concurrency)
+    )
+    return report
+
+
+async def areconcile_contacts(
+    client: "IndiePitcherAsyncClient",
+    contacts: Iterable[CreateContact],
+    delete_missing: bool,
+    dry_run: bool,
+    max_concurrency: int,
+    per_page: int,
+    prefetch: int,
+) -> ReconcileReport:
+    """Index the server, plan the changes and apply them with an async client."""
+    remote = await RemoteIndex.afrom_contacts(
+        client.aiter_contacts_lazy(per_page=per_page, prefetch=prefetch)
+    )
+    report = ReconcileReport(
+        plan_reconcile(remote, contacts, delete_missing), dry_run=dry_run
+    )
+    if dry_run:
+        return report
+    report.created = await client.import_contacts(
+        report.plan.creates, max_concurrency=max_concurrency
+    )
+    report.updated = [
+        result
+        async for result in task_map(
+            client.update_contact, report.plan.updates, max_concurrency
+        )
+    ]
+    report.deleted = [
+        result
+        async for result in task_map(
+            client.delete_contact, report.plan.deletes, max_concurrency
+        )
+    ]
+    return report
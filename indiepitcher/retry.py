@@ -0,0 +1,147 @@
+"""Retry policy with exponential backoff, jitter and Retry-After support."""
+
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+# Transport errors raised before the request reached the server; retrying
+# them is safe even for operations that are not idempotent.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Configuration for retrying failed requests.
+
+    Delays grow exponentially from `initial_backoff` by `backoff_multiplier`
+    up to `max_backoff`, and a random fraction (`jitter`) of each delay is
+    shaved off so that many clients failing at once do not retry in lockstep.
+    A `Retry-After` header on the response takes precedence over the computed
+    delay when `respect_retry_after` is set.
+
+    By default only idempotent operations are retried on server errors and
+    read failures. Rate-limited requests (429) and connection failures are
+    always retried, because the server did not process them.
+
+    Attributes:
+        max_attempts: Total number of attempts, including the first one
+        initial_backoff: Delay before the first retry, in seconds
+        max_backoff: Upper bound for a single computed delay, in seconds
+        backoff_multiplier: Factor applied to the delay after every attempt
+        jitter: Fraction of each delay that is randomized, between 0 and 1
+        retry_statuses: HTTP status codes that are considered transient
+        respect_retry_after: Honor the `Retry-After` response header
+        max_retry_after: Give up instead of waiting longer than this for a
+            `Retry-After` delay, in seconds
+        total_timeout: Overall time budget for all attempts, in seconds
+        retry_non_idempotent: Also retry non-idempotent operations (such as
+            sending emails) on server errors and read failures
+    """
+
+    max_attempts: int = 3
+    initial_backoff: float = 0.5
+    max_backoff: float = 30.0
+    backoff_multiplier: float = 2.0
+    jitter: float = 1.0
+    retry_statuses: FrozenSet[int] = frozenset({408, 429, 500, 502, 503, 504})
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    total_timeout: Optional[float] = None
+    retry_non_idempotent: bool = False
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0.0 <= self.jitter <= 1.0:
+            raise ValueError("jitter must be between 0 and 1")
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay to wait after the given failed attempt."""
+        delay = min(
+            self.max_backoff,
+            self.initial_backoff * self.backoff_multiplier ** (attempt - 1),
+        )
+        return delay * (1.0 - self.jitter * random.random())
+
+    def next_delay(
+        self,
+        attempt: int,
+        started_at: float,
+        idempotent: bool,
+        response: Optional[httpx.Response] = None,
+        error: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether a failed attempt should be retried.
+
+        Args:
+            attempt: Number of the attempt that just failed, starting at 1
+            started_at: `time.monotonic()` timestamp of the first attempt
+            idempotent: Whether the operation can safely be repeated
+            response: The error response, if the server answered
+            error: The transport error, if the server did not answer
+
+        Returns:
+            The number of seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if not self._is_retryable(idempotent, response, error):
+            return None
+
+        delay = self.backoff(attempt)
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+                delay = retry_after
+
+        if self.total_timeout is not None:
+            remaining = self.total_timeout - (time.monotonic() - started_at)
+            if delay >= remaining:
+                return None
+        return delay
+
+    def _is_retryable(
+        self,
+        idempotent: bool,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> bool:
+        retry_any = idempotent or self.retry_non_idempotent
+        if response is not None:
+            if response.status_code not in self.retry_statuses:
+                return False
+            return response.status_code == 429 or retry_any
+        if isinstance(error, _NOT_SENT_ERRORS):
+            return True
+        return isinstance(error, httpx.TransportError) and retry_any
+
+
+# Policy used when a client is created without one: every request is attempted once.
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the delay requested by a `Retry-After` header, in seconds."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
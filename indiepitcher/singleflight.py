@@ -0,0 +1,130 @@
+"""Deduplication of concurrent identical requests."""
+
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .deadlines import DeadlineExceeded, clear_deadline, remaining, within_deadline
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+def read_key(path: str, params: Optional[Dict[str, Any]]) -> Hashable:
+    """Key under which identical reads are coalesced."""
+    return (path, tuple(sorted((params or {}).items())))
+
+
+class SingleFlight(Generic[T]):
+    """
+    Shares one call among threads that make the same call at the same time.
+
+    The first thread to call `do` with a key runs the function; threads that
+    call `do` with the same key before it finishes wait for it and receive
+    the same result or exception, or `DeadlineExceeded` if their own deadline
+    passes first. If the call fails on the deadline of the thread running it,
+    the waiting threads make the call again. Once the call finishes, the next
+    `do` starts a new one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[T]"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Run `fn`, or wait for the identical call already in flight.
+
+        Returns:
+            The result, and whether it was shared from another thread's call
+        """
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if future is None:
+                    future = self._calls[key] = Future()
+            if leader:
+                break
+            timeout = remaining()
+            try:
+                return future.result(timeout=timeout), True
+            except DeadlineExceeded:
+                # The call ran out of its caller's deadline, not necessarily
+                # out of ours: make the call again. Handled first because
+                # DeadlineExceeded is also a (future) TimeoutError.
+                continue
+            except FutureTimeoutError as exc:
+                raise DeadlineExceeded(
+                    "Deadline exceeded waiting for the call"
+                ) from exc
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._finish(key)
+            future.set_exception(exc)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result, False
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+
+async def _without_deadline(fn: Callable[[], Awaitable[T]]) -> T:
+    # Runs in the shared task's own copy of the context.
+    clear_deadline()
+    return await fn()
+
+
+class AsyncSingleFlight(Generic[T]):
+    """
+    Shares one call among tasks that make the same call at the same time.
+
+    Asyncio counterpart of `SingleFlight`. The shared call runs in its own
+    task, so cancelling one of the waiting tasks does not cancel it for the
+    others. For the same reason the call runs without a deadline, and every
+    waiting task gives up at its own.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[T]"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Run `fn`, or wait for the identical call already in flight.
+
+        Returns:
+            The result, and whether it was shared from another task's call
+        """
+        import asyncio
+
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(_without_deadline(fn))
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await within_deadline(asyncio.shield(task)), shared
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[T]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved in case every waiter was cancelled.
+            task.exception()
@@ -0,0 +1,227 @@
+"""In-process stand-in for the IndiePitcher API, for tests and benchmarks."""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+# Fields accepted by `/contacts/create` and `/contacts/update` that are stored as-is.
+_CONTACT_FIELDS = ("userId", "name", "avatarURL", "languageCode", "customProperties")
+
+
+class MockIndiePitcherAPI:
+    """
+    In-memory implementation of every IndiePitcher API endpoint used by the SDK.
+
+    Pass `transport()` to `IndiePitcherClient` or `async_transport()` to
+    `IndiePitcherAsyncClient` to run the SDK without network access:
+
+        api = MockIndiePitcherAPI()
+        client = IndiePitcherClient(api_key="test", transport=api.transport())
+
+    Attributes:
+        contacts: Stored contacts by email, in API (camelCase) format
+        mailing_lists: Stored mailing lists, in API format
+        requests: Every request received, in order
+        sent: `(path, body)` of every email send request
+        fail_next: `(status_code, reason)` errors returned, in order, for the
+            next requests instead of handling them
+        latency: Seconds each request takes, to simulate network round trips
+        gzip_responses: Gzip response bodies of requests that accept it, as
+            a compressing proxy in front of the API would
+
+    Gzip-compressed request bodies (`Content-Encoding: gzip`) are accepted.
+    """
+
+    def __init__(self, latency: float = 0.0, gzip_responses: bool = False) -> None:
+        self.contacts: Dict[str, Dict[str, Any]] = {}
+        self.mailing_lists: List[Dict[str, Any]] = []
+        self.requests: List[httpx.Request] = []
+        self.sent: List[Tuple[str, Dict[str, Any]]] = []
+        self.fail_next: List[Tuple[int, str]] = []
+        self.latency = latency
+        self.gzip_responses = gzip_responses
+        self._lock = threading.Lock()
+
+    def add_mailing_list(self, name: str, title: str, num_subscribers: int = 0) -> None:
+        """Add a mailing list that `/lists` will return."""
+        self.mailing_lists.append(
+            {"name": name, "title": title, "numSubscribers": num_subscribers}
+        )
+
+    def transport(self) -> httpx.MockTransport:
+        """Transport for a synchronous client; latency is simulated with `time.sleep`."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if self.latency:
+                time.sleep(self.latency)
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """Transport for an async client; latency is simulated with `asyncio.sleep`."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return self.handle(request)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Handle a single request and return the API response."""
+        with self._lock:
+            self.requests.append(request)
+            if self.fail_next:
+                status_code, reason = self.fail_next.pop(0)
+                response = httpx.Response(status_code, json={"reason": reason})
+            else:
+                response = self._route(request)
+        if self.gzip_responses and "gzip" in request.headers.get("Accept-Encoding", ""):
+            return _gzipped(response)
+        return response
+
+    def _route(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/v1/"):
+            path = path[len("/v1") :]
+        params = request.url.params
+        if path.startswith("/email/"):
+            self.sent.append((path, _body(request)))
+            return _ok()
+        if path == "/contacts/find":
+            contact = self.contacts.get(params.get("email", ""))
+            if contact is None:
+                return _error(404, "Contact not found")
+            return _ok(contact)
+        if path == "/contacts":
+            return self._page(params, list(self.contacts.values()))
+        if path == "/contacts/create":
+            return self._create(_body(request))
+        if path == "/contacts/create_many":
+            created = [self._store(contact) for contact in _body(request)]
+            return _ok(created[0]) if created else _error(400, "No contacts given")
+        if path == "/contacts/update":
+            return self._update(_body(request))
+        if path == "/contacts/delete":
+            if self.contacts.pop(_body(request)["email"], None) is None:
+                return _error(404, "Contact not found")
+            return _ok()
+        if path == "/lists":
+            return self._page(params, self.mailing_lists)
+        if path == "/lists/portal_session":
+            body = _body(request)
+            expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+            return _ok(
+                {
+                    "url": "https://indiepitcher.com/portal/session",
+                    "expiresAt": expires_at.isoformat(),
+                    "returnURL": body["returnURL"],
+                }
+            )
+        return _error(404, f"Unknown endpoint {path}")
+
+    def _page(
+        self, params: httpx.QueryParams, items: List[Dict[str, Any]]
+    ) -> httpx.Response:
+        page = int(params.get("page", 1))
+        per = int(params.get("per", 10))
+        return httpx.Response(
+            200,
+            json={
+                "success": True,
+                "data": items[(page - 1) * per : page * per],
+                "metadata": {"page": page, "per": per, "total": len(items)},
+            },
+        )
+
+    def _create(self, body: Dict[str, Any]) -> httpx.Response:
+        if body["email"] in self.contacts and not body.get("updateIfExists"):
+            return _error(400, "Contact already exists")
+        return _ok(self._store(body))
+
+    def _store(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        contact = self.contacts.get(body["email"]) or {
+            "email": body["email"],
+            "subscribedToLists": [],
+            "customProperties": {},
+        }
+        for field in _CONTACT_FIELDS:
+            if field in body:
+                contact[field] = body[field]
+        if not (
+            body.get("ignoreListSubscriptionsWhenUpdating")
+            and body["email"] in self.contacts
+        ):
+            contact["subscribedToLists"] = list(body.get("subscribedToLists", []))
+        self.contacts[body["email"]] = contact
+        return contact
+
+    def _update(self, body: Dict[str, Any]) -> httpx.Response:
+        contact = self.contacts.get(body["email"])
+        if contact is None:
+            return _error(404, "Contact not found")
+        for field in _CONTACT_FIELDS:
+            if field in body:
+                contact[field] = body[field]
+        lists = [
+            name
+            for name in contact.get("subscribedToLists", [])
+            if name not in body.get("removedListSubscripitons", [])
+        ]
+        for name in body.get("addedListSubscripitons", []):
+            if name not in lists:
+                lists.append(name)
+        contact["subscribedToLists"] = lists
+        return _ok(contact)
+
+
+def _body(request: httpx.Request) -> Any:
+    if request.headers.get("Content-Encoding") == "gzip":
+        return json.loads(gzip.decompress(request.content))
+    return json.loads(request.content)
+
+
+class _Stream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Body that is read by the client, so it counts the downloaded bytes."""
+
+    def __init__(self, content: bytes) -> None:
+        self._content = content
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._content
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._content
+
+
+def _gzipped(response: httpx.Response) -> httpx.Response:
+    content = gzip.compress(response.content)
+    return httpx.Response(
+        response.status_code,
+        headers={
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+            "Content-Length": str(len(content)),
+        },
+        stream=_Stream(content),
+    )
+
+
+def _ok(data: Optional[Any] = None) -> httpx.Response:
+    if data is None:
+        return httpx.Response(200, json={"success": True})
+    return httpx.Response(200, json={"success": True, "data": data})
+
+
+def _error(status_code: int, reason: str) -> httpx.Response:
+    return httpx.Response(status_code, json={"reason": reason})
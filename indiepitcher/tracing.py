@@ -0,0 +1,125 @@
+"""Per-call tracing hooks with timings for serialization, network and decoding."""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CallTrace:
+    """
+    Timings and sizes of a single client method call.
+
+    Attributes:
+        method: HTTP method
+        endpoint: API path, e.g. `/email/transactional`
+        started_at: Wall-clock time the call started, as a UNIX timestamp
+        attempts: Number of HTTP attempts made, including retries
+        status_code: HTTP status of the last response, if any was received
+        bytes_sent: Size of the request body as sent, after compression
+        bytes_received: Size of the last response body as received, before
+            decompression
+        uncompressed_bytes_sent: Size of the encoded request body before
+            compression
+        uncompressed_bytes_received: Size of the last response body after
+            decompression
+        serialize_time: Seconds spent encoding and compressing the request body
+        network_time: Seconds spent waiting for HTTP responses, over all attempts
+        decode_time: Seconds spent validating the response
+        duration: Total seconds spent in the call, including retry backoff
+        error: Exception raised by the call, if it failed
+        coalesced: Whether the call shared the HTTP response of a concurrent
+            identical call instead of sending its own request
+        hedged: Whether a hedge request was sent because a response was slow
+    """
+
+    method: str
+    endpoint: str
+    started_at: float
+    attempts: int = 0
+    status_code: Optional[int] = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    uncompressed_bytes_sent: int = 0
+    uncompressed_bytes_received: int = 0
+    serialize_time: float = 0.0
+    network_time: float = 0.0
+    decode_time: float = 0.0
+    duration: float = 0.0
+    error: Optional[BaseException] = None
+    coalesced: bool = False
+    hedged: bool = False
+
+
+# A tracer is any callable that receives the trace of every finished call.
+Tracer = Callable[[CallTrace], None]
+
+
+def emit(tracer: Optional[Tracer], trace: CallTrace) -> None:
+    """Pass a finished trace to the tracer, never letting it break the call."""
+    if tracer is None:
+        return
+    try:
+        tracer(trace)
+    except Exception:
+        logger.exception("IndiePitcher tracer failed")
+
+
+class OpenTelemetryTracer:
+    """
+    Tracer that records every call as an OpenTelemetry client span.
+
+    Requires the `opentelemetry-api` package (`pip install indiepitcher[opentelemetry]`).
+    """
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        """
+        Initialize the tracer.
+
+        Args:
+            tracer_provider: OpenTelemetry tracer provider (default: the global one)
+
+        Raises:
+            ImportError: If `opentelemetry-api` is not installed
+        """
+        try:
+            import opentelemetry.trace as trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetryTracer requires opentelemetry-api; "
+                "install it with `pip install indiepitcher[opentelemetry]`"
+            ) from exc
+        self._trace = trace
+        self._tracer = trace.get_tracer("indiepitcher", tracer_provider=tracer_provider)
+
+    def __call__(self, call: CallTrace) -> None:
+        start_ns = int(call.started_at * 1e9)
+        span = self._tracer.start_span(
+            f"{call.method} {call.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=start_ns,
+            attributes={
+                "http.request.method": call.method,
+                "url.path": call.endpoint,
+                "http.request.body.size": call.bytes_sent,
+                "http.response.body.size": call.bytes_received,
+                "indiepitcher.uncompressed_request_size": call.uncompressed_bytes_sent,
+                "indiepitcher.uncompressed_response_size": (
+                    call.uncompressed_bytes_received
+                ),
+                "indiepitcher.attempts": call.attempts,
+                "indiepitcher.serialize_time_ms": call.serialize_time * 1000,
+                "indiepitcher.network_time_ms": call.network_time * 1000,
+                "indiepitcher.decode_time_ms": call.decode_time * 1000,
+                "indiepitcher.coalesced": call.coalesced,
+                "indiepitcher.hedged": call.hedged,
+            },
+        )
+        if call.status_code is not None:
+            span.set_attribute("http.response.status_code", call.status_code)
+        if call.error is not None:
+            span.record_exception(call.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=start_ns + int(call.duration * 1e9))
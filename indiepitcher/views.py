@@ -0,0 +1,143 @@
+"""Lazy, low-memory views over raw API objects."""
+
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union, overload
+
+from pydantic import GetCoreSchemaHandler, TypeAdapter
+from pydantic_core import core_schema
+
+from .models import BaseIndiePitcherModel, Contact, MailingList, PagedDataResponse
+
+M = TypeVar("M", bound=BaseIndiePitcherModel)
+T = TypeVar("T")
+V = TypeVar("V", bound="ModelView")
+
+
+class _LazyField(Generic[T]):
+    """Descriptor reading one model field from the raw JSON object on access."""
+
+    def __set_name__(self, owner: Type["ModelView"], name: str) -> None:
+        self.name = name
+        self.field = owner.model.model_fields[name]
+        self.alias = self.field.alias or name
+        self._adapter: Optional[TypeAdapter[T]] = None
+
+    @overload
+    def __get__(self, view: None, owner: type) -> "_LazyField[T]": ...
+
+    @overload
+    def __get__(self, view: "ModelView", owner: type) -> T: ...
+
+    def __get__(
+        self, view: Optional["ModelView"], owner: type
+    ) -> Union[T, "_LazyField[T]"]:
+        if view is None:
+            return self
+        if self.alias in view._raw:
+            value = view._raw[self.alias]
+        elif self.name in view._raw:
+            value = view._raw[self.name]
+        elif self.field.is_required():
+            raise AttributeError(f"'{self.name}' is missing from the API response")
+        else:
+            return self.field.get_default(call_default_factory=True)
+        if self._adapter is None:
+            # Built on first access, so views that are only scanned for a few
+            # fields never pay for the others.
+            self._adapter = TypeAdapter(self.field.annotation)
+        return self._adapter.validate_python(value)
+
+
+class ModelView(Generic[M]):
+    """
+    Read-only view over an API object that validates fields only on access.
+
+    Views keep the parsed JSON object as-is instead of building a full model,
+    so scanning large listings for a few fields stays cheap. Attribute access
+    returns the same types as the model, and `to_model()` performs full
+    validation on demand.
+    """
+
+    __slots__ = ("_raw",)
+
+    model: Type[M]
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self._raw = raw
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # `any_schema` keeps the objects parsed from JSON as they are, without
+        # the per-key copy that a dict schema would make.
+        return core_schema.no_info_after_validator_function(
+            cls._from_raw, core_schema.any_schema()
+        )
+
+    @classmethod
+    def _from_raw(cls: Type[V], raw: Any) -> V:
+        if not isinstance(raw, dict):
+            raise ValueError(f"expected a JSON object, got {type(raw).__name__}")
+        return cls(raw)
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The JSON object as returned by the API, with camelCase keys."""
+        return self._raw
+
+    def to_model(self) -> M:
+        """Validate every field and return the full model."""
+        return self.model.model_validate(self._raw)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ModelView):
+            return NotImplemented
+        return type(self) is type(other) and self._raw == other._raw
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._raw!r})"
+
+
+class ContactView(ModelView[Contact]):
+    """Lazy view over a contact returned by a listing; see `ModelView`."""
+
+    __slots__ = ()
+
+    model = Contact
+
+    email: _LazyField[str] = _LazyField()
+    user_id: _LazyField[Optional[str]] = _LazyField()
+    name: _LazyField[Optional[str]] = _LazyField()
+    avatar_url: _LazyField[Optional[str]] = _LazyField()
+    language_code: _LazyField[Optional[str]] = _LazyField()
+    hard_bounced_at: _LazyField[Optional[datetime]] = _LazyField()
+    subscribed_to_lists: _LazyField[List[str]] = _LazyField()
+    custom_properties: _LazyField[Dict[str, Any]] = _LazyField()
+
+    def to_contact(self) -> Contact:
+        """Validate every field and return the full `Contact`."""
+        return self.to_model()
+
+
+class MailingListView(ModelView[MailingList]):
+    """Lazy view over a mailing list returned by a listing; see `ModelView`."""
+
+    __slots__ = ()
+
+    model = MailingList
+
+    name: _LazyField[str] = _LazyField()
+    title: _LazyField[str] = _LazyField()
+    num_subscribers: _LazyField[int] = _LazyField()
+
+    def to_mailing_list(self) -> MailingList:
+        """Validate every field and return the full `MailingList`."""
+        return self.to_model()
+
+
+# Response shapes of the lazy listings, parametrized once at import time.
+ContactViewPage = PagedDataResponse[ContactView]
+MailingListViewPage = PagedDataResponse[MailingListView]
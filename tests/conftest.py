@@ -0,0 +1,35 @@
+"""Shared fixtures for offline tests against a mock IndiePitcher API."""
+
+from typing import Any, Callable
+
+import pytest
+
+from indiepitcher import IndiePitcherAsyncClient, IndiePitcherClient
+from indiepitcher.testing import MockIndiePitcherAPI
+
+
+@pytest.fixture
+def fake_api() -> MockIndiePitcherAPI:
+    return MockIndiePitcherAPI()
+
+
+@pytest.fixture
+def make_client(fake_api: MockIndiePitcherAPI) -> Callable[..., IndiePitcherClient]:
+    def factory(**kwargs: Any) -> IndiePitcherClient:
+        return IndiePitcherClient(
+            api_key="test_api_key", transport=fake_api.transport(), **kwargs
+        )
+
+    return factory
+
+
+@pytest.fixture
+def make_async_client(
+    fake_api: MockIndiePitcherAPI,
+) -> Callable[..., IndiePitcherAsyncClient]:
+    def factory(**kwargs: Any) -> IndiePitcherAsyncClient:
+        return IndiePitcherAsyncClient(
+            api_key="test_api_key", transport=fake_api.async_transport(), **kwargs
+        )
+
+    return factory
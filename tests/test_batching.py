@@ -0,0 +1,81 @@
+"""Tests for coalescing contact sends into batched requests."""
+
+import asyncio
+
+import pytest
+
+from indiepitcher import (
+    AsyncEmailToContactBatcher,
+    EmailBodyFormat,
+    EmailToContactBatcher,
+    SendEmailToContact,
+)
+
+
+def _email(contact_email: str, subject: str = "Update") -> SendEmailToContact:
+    return SendEmailToContact(
+        contact_email=contact_email,
+        subject=subject,
+        body="Something happened",
+        body_format=EmailBodyFormat.MARKDOWN,
+        list="important",
+    )
+
+
+def test_identical_sends_are_batched(make_client, fake_api) -> None:
+    """Test that sends differing only by recipient share one request."""
+    with EmailToContactBatcher(make_client(), linger=0.05) as batcher:
+        futures = [batcher.submit(_email(f"user{i}@example.com")) for i in range(10)]
+        futures.append(batcher.submit(_email("other@example.com", subject="Other")))
+
+    assert all(future.result().success for future in futures)
+    assert len(fake_api.sent) == 2
+    batched = next(body for _, body in fake_api.sent if body["subject"] == "Update")
+    assert len(batched["contactEmails"]) == 10
+    assert "contactEmail" not in batched
+
+
+def test_batches_are_split_at_max_batch_size(make_client, fake_api) -> None:
+    """Test that full batches are sent without waiting for the linger time."""
+    with EmailToContactBatcher(make_client(), max_batch_size=4, linger=10) as batcher:
+        futures = [batcher.submit(_email(f"user{i}@example.com")) for i in range(8)]
+        for future in futures:
+            future.result(timeout=5)
+
+    assert [len(body["contactEmails"]) for _, body in fake_api.sent] == [4, 4]
+
+
+def test_batch_failure_is_reported_to_every_caller(make_client, fake_api) -> None:
+    """Test that a failed batch fails the futures of all its sends."""
+    fake_api.fail_next.append((400, "Unknown list"))
+    with EmailToContactBatcher(make_client()) as batcher:
+        futures = [batcher.submit(_email(f"user{i}@example.com")) for i in range(3)]
+
+    for future in futures:
+        assert future.exception().status_code == 400
+
+
+def test_cancelled_send_does_not_strand_its_batch(make_client, fake_api) -> None:
+    """Test that cancelling one future still resolves the rest of its batch."""
+    with EmailToContactBatcher(make_client(), linger=0.05) as batcher:
+        cancelled = batcher.submit(_email("user0@example.com"))
+        future = batcher.submit(_email("user1@example.com"))
+        assert cancelled.cancel()
+
+        assert future.result(timeout=2).success
+    assert len(fake_api.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_batcher(make_async_client, fake_api) -> None:
+    """Test that the async batcher merges concurrent sends."""
+    client = make_async_client()
+    async with AsyncEmailToContactBatcher(client, linger=0.01) as batcher:
+        results = await asyncio.gather(
+            *(batcher.send(_email(f"user{i}@example.com")) for i in range(5))
+        )
+    await client.close()
+
+    assert all(result.success for result in results)
+    assert len(fake_api.sent) == 1
+    assert len(fake_api.sent[0][1]["contactEmails"]) == 5
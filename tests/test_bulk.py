@@ -0,0 +1,98 @@
+"""Tests for chunked, concurrent bulk operations."""
+
+import threading
+import time
+
+import pytest
+
+from indiepitcher import CreateContact
+from indiepitcher.bulk import MAX_CONTACTS_PER_REQUEST, chunked, thread_map
+
+
+def test_chunked_splits_lazily() -> None:
+    """Test that chunked yields lists of at most `size` items."""
+    chunks = list(chunked(iter(range(7)), 3))
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_thread_map_preserves_order_and_captures_errors() -> None:
+    """Test that thread_map yields results in order and keeps going after errors."""
+
+    def work(value: int) -> int:
+        time.sleep(0.01 * (5 - value))
+        if value == 2:
+            raise RuntimeError("boom")
+        return value * 10
+
+    results = list(thread_map(work, range(5), max_workers=3))
+    assert [result.index for result in results] == [0, 1, 2, 3, 4]
+    assert [result.result for result in results if result.ok] == [0, 10, 30, 40]
+    assert isinstance(results[2].error, RuntimeError)
+
+
+def test_thread_map_bounds_in_flight_items() -> None:
+    """Test that thread_map does not consume the input far ahead of the workers."""
+    consumed = 0
+    lock = threading.Lock()
+
+    def source():
+        nonlocal consumed
+        for value in range(1000):
+            with lock:
+                consumed += 1
+            yield value
+
+    results = thread_map(lambda value: value, source(), max_workers=2)
+    next(results)
+    assert consumed <= 5
+    results.close()
+
+
+def test_import_contacts(make_client, fake_api) -> None:
+    """Test that import_contacts chunks the input and reports every chunk."""
+    client = make_client()
+    contacts = (CreateContact(email=f"user{i}@example.com") for i in range(250))
+
+    result = client.import_contacts(contacts, max_concurrency=3)
+
+    assert result.ok
+    assert result.total == 250
+    assert [len(chunk.item) for chunk in result.chunks] == [100, 100, 50]
+    assert len(fake_api.contacts) == 250
+    assert len(fake_api.requests) == 3
+
+
+def test_import_contacts_records_failed_chunks(make_client, fake_api) -> None:
+    """Test that a failing chunk is reported without aborting the import."""
+    client = make_client()
+    fake_api.fail_next.append((400, "Invalid contact"))
+    contacts = [CreateContact(email=f"user{i}@example.com") for i in range(150)]
+
+    result = client.import_contacts(contacts, max_concurrency=1)
+
+    assert not result.ok
+    assert result.succeeded == 50
+    assert result.failed_chunks[0].error.status_code == 400
+
+
+def test_import_contacts_rejects_oversized_chunks(make_client) -> None:
+    """Test that chunk sizes above the server limit are rejected."""
+    with pytest.raises(ValueError):
+        make_client().import_contacts([], chunk_size=MAX_CONTACTS_PER_REQUEST + 1)
+
+
+@pytest.mark.asyncio
+async def test_async_import_contacts(make_async_client, fake_api) -> None:
+    """Test that the async client imports an async iterable of contacts."""
+    client = make_async_client()
+
+    async def contacts():
+        for i in range(120):
+            yield CreateContact(email=f"user{i}@example.com")
+
+    result = await client.import_contacts(contacts(), chunk_size=50)
+    await client.close()
+
+    assert result.ok
+    assert [chunk.index for chunk in result.chunks] == [0, 1, 2]
+    assert len(fake_api.contacts) == 120
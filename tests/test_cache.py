@@ -0,0 +1,84 @@
+"""Tests for the contact cache."""
+
+import time
+
+import pytest
+
+from indiepitcher import ContactCache, CreateContact, UpdateContact
+
+
+def _seed(fake_api) -> None:
+    fake_api.contacts["a@example.com"] = {"email": "a@example.com", "name": "A"}
+
+
+def test_get_contact_is_served_from_cache(make_client, fake_api) -> None:
+    """Test that repeated lookups hit the cache and are counted."""
+    _seed(fake_api)
+    cache = ContactCache()
+    client = make_client(contact_cache=cache)
+
+    client.get_contact("a@example.com")
+    client.get_contact("A@example.com")
+
+    assert len(fake_api.requests) == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_entries_expire_after_ttl(make_client, fake_api) -> None:
+    """Test that expired entries are refetched."""
+    _seed(fake_api)
+    cache = ContactCache(ttl=0.01)
+    client = make_client(contact_cache=cache)
+
+    client.get_contact("a@example.com")
+    time.sleep(0.02)
+    client.get_contact("a@example.com")
+
+    assert len(fake_api.requests) == 2
+    assert cache.stats.expirations == 1
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Test LRU eviction when the cache is full."""
+    cache = ContactCache(max_size=2)
+    for email in ("a", "b"):
+        cache.set(email, object())  # type: ignore[arg-type]
+    cache.get("a")
+    cache.set("c", object())  # type: ignore[arg-type]
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_writes_update_and_invalidate_cache(make_client, fake_api) -> None:
+    """Test that writes through the client keep the cache consistent."""
+    _seed(fake_api)
+    cache = ContactCache()
+    client = make_client(contact_cache=cache)
+
+    client.get_contact("a@example.com")
+    client.update_contact(UpdateContact(email="a@example.com", name="Updated"))
+    assert client.get_contact("a@example.com").data.name == "Updated"
+
+    client.delete_contact("a@example.com")
+    assert len(cache) == 0
+
+    client.create_contact(CreateContact(email="b@example.com", name="B"))
+    requests_before = len(fake_api.requests)
+    assert client.get_contact("b@example.com").data.name == "B"
+    assert len(fake_api.requests) == requests_before
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_cache(make_async_client, fake_api) -> None:
+    """Test that the async client reads through the cache."""
+    _seed(fake_api)
+    client = make_async_client(contact_cache=ContactCache())
+
+    await client.get_contact("a@example.com")
+    await client.get_contact("a@example.com")
+    await client.close()
+
+    assert len(fake_api.requests) == 1
@@ -0,0 +1,204 @@
+"""Tests for the circuit breaker."""
+
+import asyncio
+import threading
+import time
+from typing import List, Tuple
+
+import pytest
+
+from indiepitcher import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    EmailBodyFormat,
+    IndiePitcherResponseError,
+    RateLimit,
+    RateLimiter,
+    RetryPolicy,
+    SendEmail,
+)
+
+
+def _email() -> SendEmail:
+    return SendEmail(
+        to="user@example.com",
+        subject="Hi",
+        body="Hello",
+        body_format=EmailBodyFormat.MARKDOWN,
+    )
+
+
+def _fail(breaker: CircuitBreaker, path: str, times: int) -> None:
+    for _ in range(times):
+        breaker.record(path, breaker.acquire(path), failed=True)
+
+
+def test_opens_after_consecutive_failures() -> None:
+    """Test that the circuit opens at the threshold and fails fast."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    _fail(breaker, "/email/transactional", 2)
+    breaker.record(
+        "/email/transactional", breaker.acquire("/email/transactional"), False
+    )
+    _fail(breaker, "/email/transactional", 2)
+    assert breaker.state("email") is CircuitState.CLOSED
+
+    _fail(breaker, "/email/transactional", 1)
+
+    assert breaker.state("email") is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as info:
+        breaker.acquire("/email/contact")
+    assert info.value.group == "email"
+    assert info.value.retry_after > 59
+    assert breaker.acquire("/contacts/find") is False
+
+
+def test_half_open_probes_close_or_reopen() -> None:
+    """Test that limited probes are let through after the reset timeout."""
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=0.01, half_open_max_calls=2
+    )
+    _fail(breaker, "/contacts", 1)
+    time.sleep(0.02)
+
+    first = breaker.acquire("/contacts")
+    second = breaker.acquire("/contacts")
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire("/contacts")
+    assert (first, second) == (True, True)
+    assert breaker.state("contacts") is CircuitState.HALF_OPEN
+
+    breaker.record("/contacts", first, failed=False)
+    breaker.record("/contacts", second, failed=False)
+    assert breaker.state("contacts") is CircuitState.CLOSED
+
+    _fail(breaker, "/contacts", 1)
+    time.sleep(0.02)
+    breaker.record("/contacts", breaker.acquire("/contacts"), failed=True)
+    assert breaker.state("contacts") is CircuitState.OPEN
+    assert breaker.stats()["contacts"].opened == 3
+
+
+def test_abandoned_probe_frees_its_slot() -> None:
+    """Test that a probe without an outcome lets another probe through."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    _fail(breaker, "/lists", 1)
+
+    probe = breaker.acquire("/lists")
+    breaker.record("/lists", probe, failed=None)
+
+    assert breaker.acquire("/lists") is True
+
+
+def test_slow_calls_count_as_failures() -> None:
+    """Test that successful but slow requests can open the circuit."""
+    breaker = CircuitBreaker(failure_threshold=2, slow_call_duration=1.0)
+
+    for duration in (1.5, 2.0):
+        breaker.record("/email/contact", False, failed=False, duration=duration)
+
+    assert breaker.state("email") is CircuitState.OPEN
+
+
+def test_state_listener() -> None:
+    """Test that transitions are reported, and a failing listener is tolerated."""
+    changes: List[Tuple[str, CircuitState, CircuitState]] = []
+
+    def listener(group: str, old: CircuitState, new: CircuitState) -> None:
+        changes.append((group, old, new))
+        raise RuntimeError("listener failed")
+
+    breaker = CircuitBreaker(failure_threshold=1, on_state_change=listener)
+    _fail(breaker, "/email/transactional", 1)
+
+    assert changes == [("email", CircuitState.CLOSED, CircuitState.OPEN)]
+
+
+def test_client_fails_fast_while_open(make_client, fake_api) -> None:
+    """Test that server errors open the circuit and later calls skip the API."""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    client = make_client(circuit_breaker=breaker)
+    fake_api.fail_next = [(503, "Unavailable")] * 2
+
+    for _ in range(2):
+        with pytest.raises(IndiePitcherResponseError):
+            client.send_email(_email())
+    with pytest.raises(CircuitOpenError):
+        client.send_email(_email())
+
+    assert len(fake_api.requests) == 2
+    client.list_contacts()
+    assert breaker.stats()["email"].rejected == 1
+
+
+def test_client_errors_do_not_open_circuit(make_client, fake_api) -> None:
+    """Test that 4xx responses count as healthy responses."""
+    breaker = CircuitBreaker(failure_threshold=1)
+    client = make_client(circuit_breaker=breaker)
+
+    with pytest.raises(IndiePitcherResponseError):
+        client.get_contact("missing@example.com")
+
+    assert breaker.state("contacts") is CircuitState.CLOSED
+
+
+def test_circuit_opening_stops_retries(make_client, fake_api) -> None:
+    """Test that retries stop as soon as the circuit opens."""
+    fake_api.fail_next = [(503, "Unavailable")] * 5
+    client = make_client(
+        circuit_breaker=CircuitBreaker(failure_threshold=2),
+        retry_policy=RetryPolicy(
+            max_attempts=5, initial_backoff=0, retry_non_idempotent=True
+        ),
+    )
+
+    with pytest.raises(CircuitOpenError):
+        client.send_email(_email())
+
+    assert len(fake_api.requests) == 2
+
+
+def test_open_circuit_skips_rate_limit_and_slot_waits(make_client, fake_api) -> None:
+    """Test that an open circuit fails fast without a token or in-flight slot."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    _fail(breaker, "/lists", 1)
+    limiter = RateLimiter(default=RateLimit(rate=1, burst=1))
+    client = make_client(circuit_breaker=breaker, rate_limiter=limiter, max_in_flight=1)
+    fake_api.latency = 0.3
+    sending = threading.Thread(target=client.send_email, args=(_email(),))
+    sending.start()
+    time.sleep(0.05)
+
+    started = time.perf_counter()
+    with pytest.raises(CircuitOpenError):
+        client.list_mailing_lists()
+
+    assert time.perf_counter() - started < 0.1
+    sending.join()
+    assert limiter.reserve("/lists") > 0.5
+    assert len(fake_api.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_probe_is_released(make_async_client, fake_api) -> None:
+    """Test that cancelling a half-open probe frees the probe slot."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    client = make_async_client(circuit_breaker=breaker)
+    fake_api.fail_next = [(500, "Internal error")]
+    with pytest.raises(IndiePitcherResponseError):
+        await client.send_email(_email())
+
+    fake_api.latency = 0.5
+    probe = asyncio.ensure_future(client.send_email(_email()))
+    await asyncio.sleep(0.05)
+    with pytest.raises(CircuitOpenError):
+        await client.send_email(_email())
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    fake_api.latency = 0
+    await client.send_email(_email())
+    assert breaker.state("email") is CircuitState.CLOSED
@@ -0,0 +1,59 @@
+"""Tests for request encoding and response decoding."""
+
+import json
+from datetime import datetime, timezone
+
+from indiepitcher import CreateContact, EmailBodyFormat, SendEmailToContact
+from indiepitcher._codec import decode_response, encode_body
+from indiepitcher.models import ContactPage
+
+
+def test_encode_model_uses_aliases_and_drops_none() -> None:
+    """Test that models are encoded with camelCase aliases and without nulls."""
+    email = SendEmailToContact(
+        contact_email="a@example.com",
+        subject="Ünïcode",
+        body="Hi",
+        body_format=EmailBodyFormat.MARKDOWN,
+        list="news",
+        delay_until_date=datetime(2030, 1, 1, tzinfo=timezone.utc),
+    )
+
+    encoded = json.loads(encode_body(email))
+
+    assert encoded == {
+        "contactEmail": "a@example.com",
+        "subject": "Ünïcode",
+        "body": "Hi",
+        "bodyFormat": "markdown",
+        "list": "news",
+        "delayUntilDate": "2030-01-01T00:00:00Z",
+    }
+
+
+def test_encode_list_of_models_and_plain_data() -> None:
+    """Test encoding of bulk bodies and plain dictionaries."""
+    contacts = [
+        CreateContact(email="a@example.com"),
+        CreateContact(email="b@example.com"),
+    ]
+
+    assert [item["email"] for item in json.loads(encode_body(contacts))] == [
+        "a@example.com",
+        "b@example.com",
+    ]
+    assert json.loads(encode_body({"email": "a@example.com"})) == {
+        "email": "a@example.com"
+    }
+
+
+def test_decode_response() -> None:
+    """Test decoding a paged response with the precompiled shape."""
+    page = decode_response(
+        ContactPage,
+        b'{"success": true, "data": [{"email": "a@example.com"}],'
+        b' "metadata": {"page": 1, "per": 10, "total": 1}}',
+    )
+
+    assert page.data[0].email == "a@example.com"
+    assert page.metadata.total == 1
@@ -0,0 +1,131 @@
+"""Tests for request compression and transfer counters."""
+
+import gzip
+import os
+from typing import List
+
+import pytest
+
+from indiepitcher import (
+    CallTrace,
+    Compression,
+    CreateContact,
+    EmailBodyFormat,
+    RetryPolicy,
+    SendEmail,
+)
+
+HTML_BODY = "<table>" + "<tr><td>Hello, world</td></tr>" * 500 + "</table>"
+
+
+def _email(body: str = HTML_BODY) -> SendEmail:
+    return SendEmail(
+        to="user@example.com",
+        subject="Campaign",
+        body=body,
+        body_format=EmailBodyFormat.HTML,
+    )
+
+
+def test_compress_respects_threshold() -> None:
+    """Test that only bodies at or above the threshold are compressed."""
+    compression = Compression(threshold=100)
+
+    assert compression.compress(b"x" * 99) is None
+    compressed = compression.compress(b"x" * 100)
+    assert compressed is not None
+    assert gzip.decompress(compressed) == b"x" * 100
+
+
+def test_compress_skips_incompressible_bodies() -> None:
+    """Test that bodies that would grow are sent as-is."""
+    assert Compression(threshold=0).compress(os.urandom(4096)) is None
+
+
+def test_compression_validates_options() -> None:
+    """Test that invalid settings are rejected."""
+    with pytest.raises(ValueError):
+        Compression(threshold=-1)
+    with pytest.raises(ValueError):
+        Compression(level=0)
+
+
+def test_large_bodies_are_sent_gzipped(make_client, fake_api) -> None:
+    """Test that large bodies are compressed and small ones are not."""
+    traces: List[CallTrace] = []
+    client = make_client(compression=Compression(), tracer=traces.append)
+
+    client.send_email(_email())
+    client.send_email(_email("Hi"))
+
+    large, small = fake_api.requests
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in small.headers
+    assert [body["body"] for _, body in fake_api.sent] == [HTML_BODY, "Hi"]
+    assert traces[0].bytes_sent == len(large.content)
+    assert traces[0].uncompressed_bytes_sent > 10 * traces[0].bytes_sent
+    assert traces[1].bytes_sent == traces[1].uncompressed_bytes_sent
+
+
+def test_bodies_are_not_compressed_by_default(make_client, fake_api) -> None:
+    """Test that compression is opt-in."""
+    client = make_client()
+
+    client.send_email(_email())
+
+    assert "Content-Encoding" not in fake_api.requests[0].headers
+
+
+def test_retries_resend_the_compressed_body(make_client, fake_api) -> None:
+    """Test that every attempt sends the same compressed body, counted each time."""
+    fake_api.fail_next = [(503, "Unavailable")]
+    client = make_client(
+        compression=Compression(),
+        retry_policy=RetryPolicy(initial_backoff=0, retry_non_idempotent=True),
+    )
+
+    client.send_email(_email())
+
+    first, second = fake_api.requests
+    assert first.content == second.content
+    stats = client.transfer_stats()
+    assert stats.requests == 2
+    assert stats.bytes_sent == 2 * len(first.content)
+
+
+def test_transfer_stats_count_compressed_responses(make_client, fake_api) -> None:
+    """Test that received bytes are counted before and after decompression."""
+    fake_api.gzip_responses = True
+    client = make_client(compression=Compression(threshold=1024))
+    client.create_contacts(
+        [
+            CreateContact(
+                email=f"user{i}@example.com",
+                custom_properties={"bio": "Likes long emails. " * 20},
+            )
+            for i in range(20)
+        ]
+    )
+
+    page = client.list_contacts(per_page=20)
+
+    assert len(page.data) == 20
+    stats = client.transfer_stats()
+    assert stats.requests == 2
+    assert stats.bytes_sent < stats.uncompressed_bytes_sent
+    assert stats.bytes_received < stats.uncompressed_bytes_received
+    assert stats.bytes_saved > 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_compresses_bodies(make_async_client, fake_api) -> None:
+    """Test that the async client compresses large bodies too."""
+    fake_api.gzip_responses = True
+    client = make_async_client(compression=Compression())
+
+    await client.send_email(_email())
+
+    assert fake_api.requests[0].headers["Content-Encoding"] == "gzip"
+    assert fake_api.sent[0][1]["body"] == HTML_BODY
+    stats = client.transfer_stats()
+    assert stats.bytes_sent < stats.uncompressed_bytes_sent
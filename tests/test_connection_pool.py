@@ -0,0 +1,55 @@
+"""Tests for connection pool and transport configuration."""
+
+import httpx
+import pytest
+
+from indiepitcher import IndiePitcherAsyncClient, IndiePitcherClient
+
+
+def test_shared_http_client_is_not_closed(fake_api) -> None:
+    """Test that clients sharing an httpx.Client use it without owning it."""
+    shared = httpx.Client(transport=httpx.MockTransport(fake_api))
+    first = IndiePitcherClient(api_key="key_a", http_client=shared)
+    second = IndiePitcherClient(api_key="key_b", http_client=shared)
+
+    first.list_mailing_lists()
+    second.list_mailing_lists()
+    first.close()
+
+    assert not shared.is_closed
+    assert [request.headers["Authorization"] for request in fake_api.requests] == [
+        "Bearer key_a",
+        "Bearer key_b",
+    ]
+    shared.close()
+
+
+def test_pool_options_are_applied() -> None:
+    """Test that timeouts are configurable per phase."""
+    timeout = httpx.Timeout(10.0, connect=2.0)
+    client = IndiePitcherClient(
+        api_key="key", timeout=timeout, limits=httpx.Limits(max_connections=5)
+    )
+    assert client.client.timeout == timeout
+    client.close()
+    assert client.client.is_closed
+
+
+def test_http_client_cannot_be_combined_with_pool_options() -> None:
+    """Test that conflicting pool options are rejected."""
+    with httpx.Client() as shared:
+        with pytest.raises(ValueError):
+            IndiePitcherClient(api_key="key", http_client=shared, limits=httpx.Limits())
+
+
+@pytest.mark.asyncio
+async def test_async_shared_http_client(fake_api) -> None:
+    """Test that async clients can share an httpx.AsyncClient."""
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(fake_api))
+    client = IndiePitcherAsyncClient(api_key="key", http_client=shared)
+
+    await client.list_mailing_lists()
+    await client.close()
+
+    assert not shared.is_closed
+    await shared.aclose()
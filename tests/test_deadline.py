@@ -0,0 +1,254 @@
+"""Tests for deadline budgets."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from indiepitcher import (
+    DeadlineExceeded,
+    EmailBodyFormat,
+    IndiePitcherAsyncClient,
+    IndiePitcherClient,
+    IndiePitcherResponseError,
+    RateLimit,
+    RateLimiter,
+    RetryPolicy,
+    SendEmail,
+    deadline,
+)
+from indiepitcher.deadlines import current_deadline
+
+
+def _email(i: int = 0) -> SendEmail:
+    return SendEmail(
+        to=f"user{i}@example.com",
+        subject="Hi",
+        body="Hello",
+        body_format=EmailBodyFormat.MARKDOWN,
+    )
+
+
+def test_nested_deadlines_only_shorten_the_budget() -> None:
+    """Test that an inner deadline cannot outlast the enclosing one."""
+    assert current_deadline() is None
+    with deadline(0.5) as outer:
+        with deadline(60) as inner:
+            assert inner.expires_at == outer.expires_at
+        with deadline(0.1) as inner:
+            assert inner.expires_at < outer.expires_at
+            assert current_deadline() == inner
+        assert current_deadline() == outer
+    assert current_deadline() is None
+
+
+def test_request_timeout_is_shortened(fake_api) -> None:
+    """Test that requests are sent with at most the time left as timeout."""
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return fake_api.handle(request)
+
+    client = IndiePitcherClient(
+        api_key="test_api_key", transport=httpx.MockTransport(handler), timeout=30.0
+    )
+    client.send_email(_email())
+    with deadline(2.0):
+        client.send_email(_email())
+
+    assert timeouts[0]["read"] == 30.0
+    assert all(0 < value <= 2.0 for value in timeouts[1].values())
+
+
+def test_expired_deadline_fails_fast(make_client, fake_api) -> None:
+    """Test that no request is sent once the budget is spent."""
+    client = make_client()
+
+    with deadline(0.01):
+        time.sleep(0.02)
+        with pytest.raises(DeadlineExceeded):
+            client.send_email(_email())
+
+    assert fake_api.requests == []
+
+
+def test_retry_is_not_attempted_past_the_deadline(make_client, fake_api) -> None:
+    """Test that a retry whose backoff outlasts the deadline is given up."""
+    fake_api.fail_next = [(503, "Unavailable")] * 3
+    client = make_client(
+        retry_policy=RetryPolicy(initial_backoff=1.0, jitter=0, max_attempts=3)
+    )
+
+    started = time.perf_counter()
+    with deadline(0.5), pytest.raises(DeadlineExceeded) as info:
+        client.list_mailing_lists()
+
+    assert time.perf_counter() - started < 0.5
+    assert isinstance(info.value.__cause__, IndiePitcherResponseError)
+    assert len(fake_api.requests) == 1
+
+
+def test_deadline_follows_calls_into_worker_threads(make_client, fake_api) -> None:
+    """Test that calls made by `map` on worker threads share the deadline."""
+    fake_api.latency = 0.05
+    client = make_client()
+
+    with deadline(0.08):
+        results = list(client.map(client.send_email, map(_email, range(8)), 2))
+
+    errors = [result.error for result in results if not result.ok]
+    assert errors and all(isinstance(error, DeadlineExceeded) for error in errors)
+    assert len(fake_api.requests) < 8
+
+
+def test_coalesced_read_waiter_honors_its_deadline(make_client, fake_api) -> None:
+    """Test that a caller sharing a slow read gives up at its own deadline."""
+    fake_api.latency = 0.2
+    client = make_client(coalesce_reads=True)
+
+    def read(i: int):
+        if i == 0:
+            return client.list_mailing_lists()
+        time.sleep(0.02)
+        with deadline(0.05):
+            return client.list_mailing_lists()
+
+    results = list(client.map(read, range(2), 2))
+
+    assert results[0].ok
+    assert isinstance(results[1].error, DeadlineExceeded)
+    assert len(fake_api.requests) == 1
+
+
+def test_coalesced_read_follower_without_deadline(fake_api) -> None:
+    """Test that a waiter without a deadline is not failed by the caller's one."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # Honor the read timeout, which the mock transport ignores.
+        read_timeout = request.extensions["timeout"]["read"]
+        time.sleep(min(0.2, read_timeout))
+        if read_timeout < 0.2:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return fake_api.handle(request)
+
+    client = IndiePitcherClient(
+        api_key="test_api_key",
+        transport=httpx.MockTransport(handler),
+        coalesce_reads=True,
+    )
+
+    def read(i: int):
+        if i == 0:
+            with deadline(0.1):
+                return client.list_mailing_lists()
+        time.sleep(0.02)
+        return client.list_mailing_lists()
+
+    results = list(client.map(read, range(2), 2))
+
+    assert isinstance(results[0].error, DeadlineExceeded)
+    assert results[1].ok
+
+
+@pytest.mark.asyncio
+async def test_async_coalesced_read_follower_without_deadline(
+    make_async_client, fake_api
+) -> None:
+    """Test that an async waiter without a deadline outlives the caller's one."""
+    fake_api.latency = 0.2
+    client = make_async_client(coalesce_reads=True)
+
+    async def read_within_deadline():
+        with deadline(0.1):
+            return await client.list_mailing_lists()
+
+    leader = asyncio.ensure_future(read_within_deadline())
+    await asyncio.sleep(0.02)
+    follower = await client.list_mailing_lists()
+
+    assert follower.data == []
+    with pytest.raises(DeadlineExceeded):
+        await leader
+    assert len(fake_api.requests) == 1
+
+
+def test_rate_limit_wait_is_bounded_by_the_deadline(make_client, fake_api) -> None:
+    """Test that a call does not sleep for a token it could only use too late."""
+    limiter = RateLimiter(default=RateLimit(rate=1, burst=1))
+    client = make_client(rate_limiter=limiter)
+    client.list_mailing_lists()
+
+    started = time.perf_counter()
+    with deadline(0.1), pytest.raises(DeadlineExceeded):
+        client.list_mailing_lists()
+
+    assert time.perf_counter() - started < 0.05
+    assert 0.5 < limiter.reserve("/lists") <= 1.0
+    assert len(fake_api.requests) == 1
+
+
+def test_slot_wait_is_bounded_by_the_deadline(make_client, fake_api) -> None:
+    """Test that waiting for an in-flight slot gives up at the deadline."""
+    fake_api.latency = 0.5
+    client = make_client(max_in_flight=1)
+    sending = threading.Thread(target=client.send_email, args=(_email(),))
+    sending.start()
+    time.sleep(0.05)
+
+    started = time.perf_counter()
+    with deadline(0.1), pytest.raises(DeadlineExceeded):
+        client.list_mailing_lists()
+
+    assert time.perf_counter() - started < 0.3
+    sending.join()
+
+
+@pytest.mark.asyncio
+async def test_async_slot_wait_is_bounded_by_the_deadline(
+    make_async_client, fake_api
+) -> None:
+    """Test that async calls waiting for an in-flight slot give up at the deadline."""
+    fake_api.latency = 0.5
+    client = make_async_client(max_in_flight=1)
+    sending = asyncio.ensure_future(client.send_email(_email()))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    with deadline(0.1), pytest.raises(DeadlineExceeded):
+        await client.list_mailing_lists()
+
+    assert time.perf_counter() - started < 0.3
+    await sending
+
+
+@pytest.mark.asyncio
+async def test_async_request_is_cancelled_at_the_deadline(fake_api) -> None:
+    """Test that an async request in flight is abandoned when the deadline passes."""
+    fake_api.latency = 0.5
+    async with IndiePitcherAsyncClient(
+        api_key="test_api_key", transport=fake_api.async_transport()
+    ) as client:
+        started = time.perf_counter()
+        with deadline(0.05), pytest.raises(DeadlineExceeded):
+            await client.send_email(_email())
+
+        assert time.perf_counter() - started < 0.3
+
+
+@pytest.mark.asyncio
+async def test_async_deadline_spans_concurrent_tasks(make_async_client) -> None:
+    """Test that tasks started within a deadline share it."""
+    client = make_async_client()
+
+    with deadline(0.05):
+        await asyncio.sleep(0.06)
+        results = await asyncio.gather(
+            client.send_email(_email(0)),
+            client.send_email(_email(1)),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, DeadlineExceeded) for result in results)
@@ -0,0 +1,112 @@
+"""Tests for streaming contact exports."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from indiepitcher import IndiePitcherResponseError
+from indiepitcher.export import export_contacts
+
+
+def _seed(fake_api, count: int) -> None:
+    for i in range(count):
+        email = f"user{i:03d}@example.com"
+        fake_api.contacts[email] = {
+            "email": email,
+            "subscribedToLists": ["news"],
+            "customProperties": {"seats": i},
+        }
+
+
+def _read_ndjson(path) -> list:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_export_ndjson(make_client, fake_api, tmp_path) -> None:
+    """Test that every contact is written in order and the checkpoint removed."""
+    _seed(fake_api, 25)
+    dest = tmp_path / "contacts.ndjson"
+
+    result = make_client().export_contacts(dest, per_page=10)
+
+    assert (result.contacts, result.pages, result.resumed_from) == (25, 3, None)
+    assert _read_ndjson(dest) == list(fake_api.contacts.values())
+    assert not (tmp_path / "contacts.ndjson.checkpoint").exists()
+
+
+def test_export_csv_to_stream(make_client, fake_api) -> None:
+    """Test CSV output to a binary stream, with nested values JSON-encoded."""
+    _seed(fake_api, 3)
+    stream = io.BytesIO()
+
+    make_client().export_contacts(stream, format="csv")
+
+    rows = list(csv.DictReader(io.StringIO(stream.getvalue().decode())))
+    assert [row["email"] for row in rows] == list(fake_api.contacts)
+    assert rows[1]["subscribedToLists"] == '["news"]'
+    assert json.loads(rows[1]["customProperties"]) == {"seats": 1}
+    assert rows[1]["name"] == ""
+
+
+def test_export_resumes_from_checkpoint(make_client, fake_api, tmp_path) -> None:
+    """Test that a failed export continues after the last written page."""
+    _seed(fake_api, 45)
+    client = make_client()
+    dest = tmp_path / "contacts.ndjson"
+    failed = []
+
+    def flaky_fetch(page: int, per_page: int):
+        if page == 3 and not failed:
+            failed.append(page)
+            raise IndiePitcherResponseError(status_code=500, reason="boom")
+        return client.list_contacts_lazy(page=page, per_page=per_page)
+
+    with pytest.raises(IndiePitcherResponseError):
+        export_contacts(flaky_fetch, dest, per_page=10, prefetch=1)
+    assert len(_read_ndjson(dest)) == 20
+    with open(dest, "ab") as file:
+        file.write(b'{"email": "half-written')
+
+    result = export_contacts(flaky_fetch, dest, per_page=10, prefetch=1)
+
+    assert result.resumed_from == 3
+    assert (result.contacts, result.pages) == (45, 3)
+    assert _read_ndjson(dest) == list(fake_api.contacts.values())
+
+
+def test_export_rejects_mismatched_checkpoint(make_client, tmp_path) -> None:
+    """Test that resuming with different options fails instead of corrupting."""
+    dest = tmp_path / "contacts.csv"
+    checkpoint = {"format": "csv", "per_page": 50, "page": 1}
+    (tmp_path / "contacts.csv.checkpoint").write_text(json.dumps(checkpoint))
+
+    with pytest.raises(ValueError):
+        make_client().export_contacts(dest, format="csv", per_page=100)
+    with pytest.raises(ValueError):
+        make_client().export_contacts(dest, format="xml")
+
+
+def test_export_parquet(make_client, fake_api, tmp_path) -> None:
+    """Test Parquet output when pyarrow is installed."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    _seed(fake_api, 15)
+    dest = tmp_path / "contacts.parquet"
+
+    make_client().export_contacts(dest, format="parquet", per_page=10)
+
+    table = pq.read_table(dest)
+    assert table.column("email").to_pylist() == list(fake_api.contacts)
+
+
+@pytest.mark.asyncio
+async def test_async_export(make_async_client, fake_api, tmp_path) -> None:
+    """Test the async export."""
+    _seed(fake_api, 25)
+    dest = tmp_path / "contacts.ndjson"
+
+    result = await make_async_client().export_contacts(dest, per_page=10)
+
+    assert result.contacts == 25
+    assert _read_ndjson(dest) == list(fake_api.contacts.values())
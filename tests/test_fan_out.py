@@ -0,0 +1,169 @@
+"""Tests for running client operations over many items concurrently."""
+
+import asyncio
+import threading
+
+import pytest
+
+from indiepitcher import (
+    CreateContact,
+    IndiePitcherResponseError,
+    SendEmail,
+    SendEmailToContact,
+    SendEmailToMailingList,
+)
+
+
+def _emails(count: int):
+    return [
+        SendEmail(
+            to=f"user{i}@example.com", subject="Hi", body="Hi", body_format="html"
+        )
+        for i in range(count)
+    ]
+
+
+def test_map_sends_from_many_threads(make_client, fake_api) -> None:
+    """Test that one client can be shared by the pool and results keep input order."""
+    fake_api.latency = 0.001
+    client = make_client()
+    threads = set()
+
+    def send(email):
+        threads.add(threading.get_ident())
+        return client.send_email(email)
+
+    results = list(client.map(send, _emails(200), max_workers=8))
+
+    assert [result.index for result in results] == list(range(200))
+    assert all(result.ok and result.result.success for result in results)
+    assert sorted(body["to"] for _, body in fake_api.sent) == sorted(
+        f"user{i}@example.com" for i in range(200)
+    )
+    assert len(threads) > 1
+
+
+def test_map_collects_errors(make_client, fake_api) -> None:
+    """Test that a failing item does not abort the rest of the batch."""
+    fake_api.fail_next.append((400, "Invalid email"))
+    client = make_client()
+
+    results = list(client.map(client.send_email, _emails(5), max_workers=1))
+
+    assert [result.ok for result in results] == [False, True, True, True, True]
+    assert isinstance(results[0].error, IndiePitcherResponseError)
+    assert len(fake_api.sent) == 4
+
+
+def test_map_as_completed(make_client, fake_api) -> None:
+    """Test that unordered mode yields every item once."""
+    client = make_client()
+    results = list(client.map(client.send_email, _emails(20), ordered=False))
+    assert sorted(result.index for result in results) == list(range(20))
+
+
+def test_map_rejects_invalid_max_workers_when_called(make_client) -> None:
+    """Test that an invalid worker count raises before iterating."""
+    client = make_client()
+    with pytest.raises(ValueError):
+        client.map(client.send_email, _emails(1), max_workers=0)
+    with pytest.raises(ValueError):
+        client.send_many(_emails(1), max_workers=0)
+
+
+def test_send_many_dispatches_by_type(make_client, fake_api) -> None:
+    """Test that every kind of email request goes to its endpoint."""
+    fake_api.contacts["c@example.com"] = {"email": "c@example.com"}
+    emails = [
+        *_emails(2),
+        SendEmailToContact(
+            contact_email="c@example.com",
+            list="news",
+            subject="Hi",
+            body="Hi",
+            body_format="html",
+        ),
+        SendEmailToMailingList(
+            list="news", subject="Hi", body="Hi", body_format="html"
+        ),
+        CreateContact(email="not-an-email-request@example.com"),
+    ]
+
+    results = sorted(make_client().send_many(emails), key=lambda r: r.index)
+
+    assert [result.ok for result in results] == [True, True, True, True, False]
+    assert isinstance(results[-1].error, TypeError)
+    assert sorted(path for path, _ in fake_api.sent) == [
+        "/email/contact",
+        "/email/list",
+        "/email/transactional",
+        "/email/transactional",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_send_many_bounds_in_flight(make_async_client, fake_api) -> None:
+    """Test that the input is pulled lazily and concurrency stays capped."""
+    fake_api.latency = 0.005
+    client = make_async_client()
+    in_flight = 0
+    peak = 0
+    produced = 0
+
+    async def campaign():
+        nonlocal produced
+        for email in _emails(100):
+            produced += 1
+            yield email
+
+    async def send(email):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            return await client.send_email(email)
+        finally:
+            in_flight -= 1
+
+    first = True
+    async for result in client.map(send, campaign(), max_concurrency=5, ordered=False):
+        assert result.ok
+        if first:
+            assert produced <= 6
+            first = False
+
+    assert peak == 5
+    assert len(fake_api.sent) == 100
+
+
+@pytest.mark.asyncio
+async def test_async_send_many_cancels_on_close(make_async_client, fake_api) -> None:
+    """Test that closing the stream early cancels the sends still in flight."""
+    fake_api.latency = 0.05
+    client = make_async_client()
+
+    results = client.send_many(_emails(50), max_concurrency=10)
+    try:
+        async for result in results:
+            assert result.ok
+            break
+    finally:
+        await results.aclose()
+    handled = len(fake_api.requests)
+    await asyncio.sleep(0.1)
+
+    # Only the first batch of sends ever reaches the API, and nothing more
+    # arrives after the stream is closed.
+    assert handled <= 10
+    assert len(fake_api.requests) == handled
+
+
+@pytest.mark.asyncio
+async def test_async_map_rejects_invalid_concurrency_when_called(
+    make_async_client,
+) -> None:
+    """Test that an invalid concurrency limit raises before iterating."""
+    client = make_async_client()
+    with pytest.raises(ValueError):
+        client.map(client.send_email, _emails(1), max_concurrency=0)
+    await client.close()
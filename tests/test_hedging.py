@@ -0,0 +1,163 @@
+"""Tests for hedged requests."""
+
+import asyncio
+import pickle
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from indiepitcher import (
+    CallTrace,
+    EmailBodyFormat,
+    HedgingPolicy,
+    IndiePitcherAsyncClient,
+    IndiePitcherClient,
+    SendEmail,
+)
+from indiepitcher.testing import MockIndiePitcherAPI
+
+
+class _SlowFirst:
+    """Mock API whose first `slow` requests take `latency` seconds."""
+
+    def __init__(self, slow: int = 1, latency: float = 0.5) -> None:
+        self.api = MockIndiePitcherAPI()
+        self.slow = slow
+        self.latency = latency
+        self.started = 0
+        self._lock = threading.Lock()
+
+    def _delay(self) -> float:
+        with self._lock:
+            self.started += 1
+            return self.latency if self.started <= self.slow else 0.0
+
+    def transport(self) -> httpx.MockTransport:
+        def handler(request: httpx.Request) -> httpx.Response:
+            time.sleep(self._delay())
+            return self.api.handle(request)
+
+        return httpx.MockTransport(handler)
+
+    def async_transport(self) -> httpx.MockTransport:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(self._delay())
+            return self.api.handle(request)
+
+        return httpx.MockTransport(handler)
+
+
+def test_slow_read_is_hedged() -> None:
+    """Test that a slow GET is answered by the hedge."""
+    server = _SlowFirst()
+    hedging = HedgingPolicy(delay=0.02, max_ratio=1.0)
+    traces: List[CallTrace] = []
+    with IndiePitcherClient(
+        api_key="test_api_key",
+        hedging=hedging,
+        tracer=traces.append,
+        transport=server.transport(),
+    ) as client:
+        started = time.perf_counter()
+        client.list_mailing_lists()
+
+        assert time.perf_counter() - started < 0.3
+    assert server.started == 2
+    assert traces[0].hedged
+    stats = hedging.stats()
+    assert (stats.requests, stats.hedges, stats.hedge_wins) == (1, 1, 1)
+
+
+def test_sends_are_never_hedged() -> None:
+    """Test that non-idempotent requests are sent once."""
+    server = _SlowFirst(latency=0.05)
+    hedging = HedgingPolicy(delay=0.0, max_ratio=1.0)
+    client = IndiePitcherClient(
+        api_key="test_api_key", hedging=hedging, transport=server.transport()
+    )
+
+    client.send_email(
+        SendEmail(
+            to="user@example.com",
+            subject="Hi",
+            body="Hello",
+            body_format=EmailBodyFormat.MARKDOWN,
+        )
+    )
+
+    assert server.started == 1
+    assert hedging.stats().requests == 0
+
+
+def test_hedge_rate_is_capped() -> None:
+    """Test that hedges stay within `max_ratio` of the requests."""
+    server = _SlowFirst(slow=100, latency=0.02)
+    hedging = HedgingPolicy(delay=0.0, max_ratio=0.25)
+    client = IndiePitcherClient(
+        api_key="test_api_key", hedging=hedging, transport=server.transport()
+    )
+
+    for _ in range(12):
+        client.list_mailing_lists()
+
+    assert hedging.stats().hedges == 3
+
+
+def test_adaptive_delay_follows_observed_latency() -> None:
+    """Test that the delay is the percentile of recent latencies, per endpoint."""
+    hedging = HedgingPolicy(percentile=0.9, max_ratio=1.0, min_samples=10)
+    for i in range(9):
+        hedging.record_latency("/lists", (i + 1) / 100)
+    assert hedging.hedge_delay("/lists") is None
+
+    hedging.record_latency("/lists", 1.0)
+
+    assert hedging.hedge_delay("/lists") == 1.0
+    assert hedging.hedge_delay("/contacts") is None
+    for _ in range(100):
+        hedging.record_latency("/lists", 0.01)
+    assert hedging.hedge_delay("/lists") == 0.01
+
+
+def test_invalid_policy() -> None:
+    """Test that out-of-range settings are rejected."""
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=1.0)
+    with pytest.raises(ValueError):
+        HedgingPolicy(max_ratio=2)
+    with pytest.raises(ValueError):
+        HedgingPolicy(min_samples=50, window=10)
+
+
+def test_policy_pickles_without_state() -> None:
+    """Test that a pickled policy keeps its settings but not its latencies."""
+    hedging = HedgingPolicy(delay=0.1, max_ratio=0.5)
+    hedging.record_latency("/lists", 0.2)
+    hedging.hedge_delay("/lists")
+
+    copy = pickle.loads(pickle.dumps(hedging))
+
+    assert (copy.delay, copy.max_ratio) == (0.1, 0.5)
+    assert copy.stats().requests == 0
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_cancels_the_slow_request() -> None:
+    """Test that the async client takes the hedge and cancels the slow request."""
+    server = _SlowFirst(latency=5.0)
+    hedging = HedgingPolicy(delay=0.02, max_ratio=1.0)
+    async with IndiePitcherAsyncClient(
+        api_key="test_api_key", hedging=hedging, transport=server.async_transport()
+    ) as client:
+        started = time.perf_counter()
+        await client.list_mailing_lists()
+
+        assert time.perf_counter() - started < 0.3
+    assert hedging.stats().hedge_wins == 1
+    await asyncio.sleep(0)
+    assert [
+        task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+    ] == []
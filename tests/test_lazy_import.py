@@ -0,0 +1,34 @@
+"""Tests for the lazily loaded package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+import indiepitcher
+
+
+def test_import_does_not_load_dependencies() -> None:
+    """Test that `import indiepitcher` loads neither httpx nor pydantic."""
+    code = (
+        "import sys, indiepitcher; "
+        "print(sorted(m for m in ('httpx', 'pydantic', 'asyncio') if m in sys.modules))"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "[]"
+
+
+def test_sync_client_does_not_load_asyncio() -> None:
+    """Test that importing the synchronous client leaves asyncio unloaded."""
+    code = "import sys; from indiepitcher import IndiePitcherClient; print('asyncio' in sys.modules)"
+    output = subprocess.check_output([sys.executable, "-c", code], text=True)
+    assert output.strip() == "False"
+
+
+def test_every_public_name_resolves() -> None:
+    """Test that every name in `__all__` is importable and listed by dir()."""
+    for name in indiepitcher.__all__:
+        assert getattr(indiepitcher, name) is not None
+        assert name in dir(indiepitcher)
+    with pytest.raises(AttributeError):
+        indiepitcher.DoesNotExist
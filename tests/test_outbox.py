@@ -0,0 +1,146 @@
+"""Tests for the durable SQLite outbox."""
+
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from indiepitcher import (
+    AsyncOutboxFlusher,
+    EmailBodyFormat,
+    Outbox,
+    OutboxFlusher,
+    RetryPolicy,
+    SendEmail,
+    SendEmailToMailingList,
+)
+from indiepitcher.outbox import FAILED, PENDING, SENT
+
+
+def _email(to: str = "user@example.com") -> SendEmail:
+    return SendEmail(
+        to=to, subject="Hi", body="Hello", body_format=EmailBodyFormat.MARKDOWN
+    )
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    with Outbox(str(tmp_path / "outbox.db")) as outbox:
+        yield outbox
+
+
+def test_flusher_sends_and_marks_messages(outbox, make_client, fake_api) -> None:
+    """Test that queued emails of every kind are sent and marked as sent."""
+    outbox.enqueue(_email())
+    outbox.enqueue(
+        SendEmailToMailingList(
+            subject="News", body="Hi", body_format=EmailBodyFormat.HTML, list="news"
+        )
+    )
+
+    OutboxFlusher(outbox, make_client()).stop(drain=True)
+
+    assert [path for path, _ in fake_api.sent] == [
+        "/email/transactional",
+        "/email/list",
+    ]
+    assert outbox.counts() == {SENT: 2}
+
+
+def test_messages_survive_restart(tmp_path, make_client, fake_api) -> None:
+    """Test that pending and abandoned messages are sent after reopening."""
+    path = str(tmp_path / "outbox.db")
+    with Outbox(path, lease_timeout=0.0) as outbox:
+        outbox.enqueue(_email("a@example.com"))
+        outbox.enqueue(_email("b@example.com"))
+        outbox.claim(1)  # claimed, then the process "crashes"
+
+    with Outbox(path) as reopened:
+        OutboxFlusher(reopened, make_client()).stop(drain=True)
+        assert reopened.counts() == {SENT: 2}
+    assert sorted(body["to"] for _, body in fake_api.sent) == [
+        "a@example.com",
+        "b@example.com",
+    ]
+
+
+def test_failures_are_retried_or_given_up(outbox, make_client, fake_api) -> None:
+    """Test that transient errors are rescheduled and client errors are final."""
+    transient = outbox.enqueue(_email("a@example.com"))
+    permanent = outbox.enqueue(_email("b@example.com"))
+    fake_api.fail_next.extend([(503, "Unavailable"), (422, "Invalid email")])
+
+    flusher = OutboxFlusher(
+        outbox, make_client(), max_concurrency=1, retry_policy=RetryPolicy(jitter=0.0)
+    )
+    flusher.flush_once()
+
+    assert outbox.counts() == {PENDING: 1, FAILED: 1}
+    assert transient < permanent
+
+
+@pytest.mark.asyncio
+async def test_async_flusher(outbox, make_async_client, fake_api) -> None:
+    """Test that the async flusher drains the outbox."""
+    client = make_async_client()
+    async with AsyncOutboxFlusher(outbox, client, poll_interval=0.01):
+        for i in range(5):
+            outbox.enqueue(_email(f"user{i}@example.com"))
+    await client.close()
+
+    assert outbox.counts() == {SENT: 5}
+    assert len(fake_api.sent) == 5
+
+
+def test_flusher_survives_flush_errors(outbox, make_client, fake_api, caplog) -> None:
+    """Test that the flusher logs a failed round and keeps polling."""
+    claim = outbox.claim
+    failures = [sqlite3.OperationalError("database is locked")]
+
+    def flaky_claim(limit: int):
+        if failures:
+            raise failures.pop()
+        return claim(limit)
+
+    outbox.claim = flaky_claim
+    outbox.enqueue(_email())
+    flusher = OutboxFlusher(outbox, make_client(), poll_interval=0.01)
+    flusher.start()
+    for _ in range(100):
+        if outbox.counts() == {SENT: 1}:
+            break
+        time.sleep(0.01)
+    flusher.stop(drain=False)
+
+    assert outbox.counts() == {SENT: 1}
+    assert "outbox flush failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_async_flusher_survives_flush_errors(
+    outbox, make_async_client, fake_api, caplog
+) -> None:
+    """Test that the async flusher logs a failed round and keeps polling."""
+    claim = outbox.claim
+    failures = [sqlite3.OperationalError("database is locked")]
+
+    def flaky_claim(limit: int):
+        if failures:
+            raise failures.pop()
+        return claim(limit)
+
+    outbox.claim = flaky_claim
+    outbox.enqueue(_email())
+    client = make_async_client()
+    flusher = AsyncOutboxFlusher(outbox, client, poll_interval=0.01)
+    flusher.start()
+    for _ in range(100):
+        if outbox.counts() == {SENT: 1}:
+            break
+        await asyncio.sleep(0.01)
+    await flusher.stop(drain=False)
+    await client.close()
+
+    assert outbox.counts() == {SENT: 1}
+    assert "outbox flush failed" in caplog.text
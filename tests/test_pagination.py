@@ -0,0 +1,76 @@
+"""Tests for prefetching page iterators."""
+
+import threading
+import time
+
+import pytest
+
+from indiepitcher import IndiePitcherResponseError
+from indiepitcher.models import PagedDataResponse
+from indiepitcher.pagination import iter_pages
+
+
+def _seed(fake_api, count: int) -> None:
+    for i in range(count):
+        email = f"user{i:03d}@example.com"
+        fake_api.contacts[email] = {"email": email}
+
+
+def test_iter_contacts_yields_all_in_order(make_client, fake_api) -> None:
+    """Test that iter_contacts walks every page and keeps server order."""
+    _seed(fake_api, 45)
+    client = make_client()
+
+    emails = [contact.email for contact in client.iter_contacts(per_page=10)]
+
+    assert emails == list(fake_api.contacts)
+    assert len(fake_api.requests) == 5
+
+
+def test_iter_contacts_empty(make_client, fake_api) -> None:
+    """Test that an empty audience needs a single request."""
+    assert list(make_client().iter_contacts()) == []
+    assert len(fake_api.requests) == 1
+
+
+def test_iter_mailing_lists_raises_on_failed_page(make_client, fake_api) -> None:
+    """Test that a failing page surfaces as an exception."""
+    fake_api.fail_next.append((500, "Internal error"))
+    with pytest.raises(IndiePitcherResponseError):
+        list(make_client().iter_mailing_lists())
+
+
+def test_iter_pages_holds_at_most_prefetch_pages() -> None:
+    """Test that pages are not fetched far ahead of a slow consumer."""
+    fetched = 0
+    lock = threading.Lock()
+
+    def fetch_page(page: int, per_page: int) -> PagedDataResponse[int]:
+        nonlocal fetched
+        with lock:
+            fetched += 1
+        return PagedDataResponse.model_validate(
+            {
+                "success": True,
+                "data": [page],
+                "metadata": {"page": page, "per": per_page, "total": 20},
+            }
+        )
+
+    for consumed, _ in enumerate(iter_pages(fetch_page, 1, prefetch=3), start=1):
+        time.sleep(0.005)
+        with lock:
+            # The first page is fetched before the prefetching starts.
+            assert fetched - consumed <= 2
+
+
+@pytest.mark.asyncio
+async def test_aiter_contacts(make_async_client, fake_api) -> None:
+    """Test that aiter_contacts walks every page and keeps server order."""
+    _seed(fake_api, 23)
+    client = make_async_client()
+
+    emails = [contact.email async for contact in client.aiter_contacts(per_page=5)]
+    await client.close()
+
+    assert emails == list(fake_api.contacts)
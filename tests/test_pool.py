@@ -0,0 +1,124 @@
+"""Tests for multi-tenant client pools."""
+
+import asyncio
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from indiepitcher import (
+    EmailBodyFormat,
+    HedgingPolicy,
+    IndiePitcherAsyncClientPool,
+    IndiePitcherClientPool,
+    RateLimit,
+    SendEmail,
+)
+
+
+def _email(i: int = 0) -> SendEmail:
+    return SendEmail(
+        to=f"user{i}@example.com",
+        subject="Hi",
+        body="Hello",
+        body_format=EmailBodyFormat.MARKDOWN,
+    )
+
+
+def test_tenants_share_the_connection_pool(fake_api) -> None:
+    """Test that every tenant sends its own key over the shared HTTP client."""
+    with IndiePitcherClientPool(transport=fake_api.transport()) as pool:
+        first = pool.client("key_a")
+        pool.client("key_b").send_email(_email())
+        first.send_email(_email())
+
+        assert pool.client("key_a") is first
+        assert first.client is pool.client("key_b").client is pool.http_client
+        assert sorted(pool.api_keys()) == ["key_a", "key_b"]
+        pool.remove("key_a")
+        assert pool.api_keys() == ["key_b"]
+
+    assert [request.headers["Authorization"] for request in fake_api.requests] == [
+        "Bearer key_b",
+        "Bearer key_a",
+    ]
+    assert pool.http_client.is_closed
+
+
+def test_tenants_get_separate_rate_limits(fake_api) -> None:
+    """Test that each tenant is throttled by its own limiter."""
+    pool = IndiePitcherClientPool(
+        tenant_rate_limit=RateLimit(rate=1, burst=1), transport=fake_api.transport()
+    )
+    limiter_a = pool.client("key_a").rate_limiter
+    limiter_b = pool.client("key_b").rate_limiter
+    assert limiter_a is not None and limiter_b is not None
+
+    assert limiter_a.reserve("/email/transactional") == 0.0
+    assert limiter_a.reserve("/email/transactional") > 0.5
+    assert limiter_b.reserve("/email/transactional") == 0.0
+
+
+def test_invalid_tenant_budget() -> None:
+    """Test that a tenant in-flight budget must be positive."""
+    with pytest.raises(ValueError):
+        IndiePitcherClientPool(tenant_max_in_flight=0)
+
+
+def test_tenants_share_one_hedge_thread_pool(fake_api) -> None:
+    """Test that hedged reads of every tenant run on the pool's threads."""
+    fake_api.latency = 0.02
+    pool = IndiePitcherClientPool(
+        hedging=HedgingPolicy(delay=0.0, max_ratio=1.0),
+        limits=httpx.Limits(max_connections=4),
+        transport=fake_api.transport(),
+    )
+    for i in range(20):
+        pool.client(f"key_{i}").list_mailing_lists()
+
+    assert len(_hedge_threads()) <= 4
+    pool.close()
+    time.sleep(0.1)
+    assert _hedge_threads() == []
+
+
+def _hedge_threads() -> List[threading.Thread]:
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name.startswith("indiepitcher-hedge")
+    ]
+
+
+def test_client_max_in_flight(make_client, fake_api) -> None:
+    """Test that a client queues requests beyond its in-flight limit."""
+    fake_api.latency = 0.05
+    client = make_client(max_in_flight=2)
+
+    started = time.perf_counter()
+    results = list(client.map(client.send_email, map(_email, range(6)), max_workers=6))
+
+    assert all(result.ok for result in results)
+    assert time.perf_counter() - started >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_noisy_tenant_does_not_delay_others(fake_api) -> None:
+    """Test that a tenant at its in-flight budget does not hold up other tenants."""
+    fake_api.latency = 0.05
+    finished = {}
+    async with IndiePitcherAsyncClientPool(
+        tenant_max_in_flight=2, transport=fake_api.async_transport()
+    ) as pool:
+        started = time.perf_counter()
+
+        async def send(api_key: str, i: int) -> None:
+            await pool.client(api_key).send_email(_email(i))
+            finished[api_key, i] = time.perf_counter() - started
+
+        await asyncio.gather(*(send("noisy", i) for i in range(6)), send("quiet", 0))
+
+    assert finished["quiet", 0] < 0.1
+    assert max(finished[key] for key in finished if key[0] == "noisy") >= 0.15
@@ -0,0 +1,132 @@
+"""Tests for prepared emails."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from indiepitcher import (
+    EmailBodyFormat,
+    PreparedEmail,
+    SendEmail,
+    SendEmailToContact,
+    SendEmailToMailingList,
+)
+from indiepitcher._codec import encode_body
+
+HTML_BODY = "<p>" + "Hello, world. " * 1000 + "</p>"
+
+
+def _contact_email(**fields) -> SendEmailToContact:
+    return SendEmailToContact(
+        subject="Digest",
+        body=HTML_BODY,
+        body_format=EmailBodyFormat.HTML,
+        list="digest",
+        track_email_opens=True,
+        **fields,
+    )
+
+
+def test_render_matches_encoded_model() -> None:
+    """Test that a rendered body equals the body of the equivalent model."""
+    template = SendEmail(
+        to="", subject="Receipt", body=HTML_BODY, body_format=EmailBodyFormat.HTML
+    )
+
+    body = PreparedEmail(template).render("user@example.com")
+
+    expected = template.model_copy(update={"to": "user@example.com"})
+    assert json.loads(body) == json.loads(encode_body(expected))
+
+
+def test_render_contact_email_with_delays() -> None:
+    """Test that per-send delays replace the template's delay."""
+    delay = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    prepared = PreparedEmail(_contact_email(delay_seconds=60))
+
+    default = json.loads(prepared.render("a@example.com"))
+    dated = json.loads(prepared.render("b@example.com", delay_until_date=delay))
+
+    assert default == json.loads(
+        encode_body(_contact_email(contact_email="a@example.com", delay_seconds=60))
+    )
+    assert dated == json.loads(
+        encode_body(
+            _contact_email(contact_email="b@example.com", delay_until_date=delay)
+        )
+    )
+
+
+def test_template_recipients_are_ignored() -> None:
+    """Test that recipients set on the template are not sent."""
+    prepared = PreparedEmail(_contact_email(contact_emails=["old@example.com"]))
+
+    body = json.loads(prepared.render("new@example.com"))
+
+    assert body["contactEmail"] == "new@example.com"
+    assert "contactEmails" not in body
+
+
+def test_render_escapes_recipient() -> None:
+    """Test that recipients are JSON-encoded rather than pasted in."""
+    prepared = PreparedEmail(
+        SendEmail(to="", subject="Hi", body="Hi", body_format=EmailBodyFormat.HTML)
+    )
+
+    assert json.loads(prepared.render('"quoted"@example.com'))["to"] == (
+        '"quoted"@example.com'
+    )
+
+
+def test_invalid_prepared_emails() -> None:
+    """Test that mailing list sends and delayed transactional sends are rejected."""
+    with pytest.raises(TypeError):
+        PreparedEmail(
+            SendEmailToMailingList(
+                subject="Hi", body="Hi", body_format=EmailBodyFormat.HTML, list="news"
+            )
+        )
+    prepared = PreparedEmail(
+        SendEmail(to="", subject="Hi", body="Hi", body_format=EmailBodyFormat.HTML)
+    )
+    with pytest.raises(TypeError):
+        prepared.render("user@example.com", delay_seconds=10)
+
+
+def test_send_prepared(make_client, fake_api) -> None:
+    """Test that prepared emails are sent to their endpoint, one per recipient."""
+    client = make_client()
+    prepared = PreparedEmail(_contact_email())
+
+    for i in range(3):
+        client.send_prepared(prepared, f"user{i}@example.com")
+
+    assert [path for path, _ in fake_api.sent] == ["/email/contact"] * 3
+    assert [body["contactEmail"] for _, body in fake_api.sent] == [
+        f"user{i}@example.com" for i in range(3)
+    ]
+    assert all(body["body"] == HTML_BODY for _, body in fake_api.sent)
+
+
+@pytest.mark.asyncio
+async def test_async_send_prepared(make_async_client, fake_api) -> None:
+    """Test that the async client sends prepared emails."""
+    client = make_async_client()
+    prepared = PreparedEmail(
+        SendEmail(to="", subject="Hi", body=HTML_BODY, body_format=EmailBodyFormat.HTML)
+    )
+
+    await client.send_prepared(prepared, "user@example.com")
+
+    assert fake_api.sent == [
+        (
+            "/email/transactional",
+            {
+                "to": "user@example.com",
+                "subject": "Hi",
+                "body": HTML_BODY,
+                "bodyFormat": "html",
+            },
+        )
+    ]
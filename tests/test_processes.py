@@ -0,0 +1,204 @@
+"""Tests for using clients across forked and spawned processes."""
+
+import os
+import pickle
+import signal
+import threading
+import time
+from contextlib import ExitStack
+
+import httpx
+import pytest
+
+from indiepitcher import (
+    CircuitBreaker,
+    Compression,
+    ContactCache,
+    EmailBodyFormat,
+    HedgingPolicy,
+    IndiePitcherAsyncClient,
+    IndiePitcherClient,
+    IndiePitcherClientPool,
+    RateLimit,
+    RateLimiter,
+    RetryPolicy,
+    SendEmail,
+)
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+def _email() -> SendEmail:
+    return SendEmail(
+        to="user@example.com",
+        subject="Hi",
+        body="Hello",
+        body_format=EmailBodyFormat.MARKDOWN,
+    )
+
+
+def _in_child(check, timeout: float = 10.0) -> int:
+    """Run `check` in a forked child and return its exit status."""
+    pid = os.fork()
+    if pid == 0:
+        try:
+            check()
+        except BaseException:
+            os._exit(1)
+        os._exit(0)
+    # Kill a deadlocked child instead of hanging the test run.
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        finished, status = os.waitpid(pid, os.WNOHANG)
+        if finished:
+            return os.waitstatus_to_exitcode(status)
+        time.sleep(0.01)
+    os.kill(pid, signal.SIGKILL)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def test_client_pickles_as_configuration() -> None:
+    """Test that a pickled client is rebuilt from its settings."""
+    limiter = RateLimiter(default=RateLimit(rate=5, burst=10))
+    limiter.reserve("/contacts")
+    client = IndiePitcherClient(
+        api_key="key",
+        base_url="https://example.com/v1",
+        retry_policy=RetryPolicy(max_attempts=5),
+        rate_limiter=limiter,
+        circuit_breaker=CircuitBreaker(failure_threshold=3),
+        contact_cache=ContactCache(max_size=10),
+        compression=Compression(threshold=100),
+        coalesce_reads=True,
+        max_in_flight=4,
+        timeout=5.0,
+        limits=httpx.Limits(max_connections=7),
+    )
+
+    copy = pickle.loads(pickle.dumps(client))
+
+    assert (copy.api_key, copy.base_url) == ("key", "https://example.com/v1")
+    assert copy.retry_policy == client.retry_policy
+    assert copy.compression == client.compression
+    assert copy.timeout == client.timeout
+    assert copy.max_in_flight == 4
+    assert copy.client is not client.client
+    assert copy.rate_limiter is not None and copy.rate_limiter is not limiter
+    assert copy.rate_limiter.reserve("/contacts") == 0.0
+    assert copy.circuit_breaker is not None
+    assert copy.circuit_breaker.failure_threshold == 3
+    assert copy.contact_cache is not None and copy.contact_cache.max_size == 10
+    assert copy._reads is not None
+
+
+def test_async_client_pickles_as_configuration() -> None:
+    """Test that async clients are picklable too."""
+    client = IndiePitcherAsyncClient(api_key="key", max_in_flight=2)
+
+    copy = pickle.loads(pickle.dumps(client))
+
+    assert (copy.api_key, copy.max_in_flight) == ("key", 2)
+    assert isinstance(copy.client, httpx.AsyncClient)
+
+
+def test_client_with_shared_http_client_is_not_picklable() -> None:
+    """Test that a client borrowing a connection pool refuses to be pickled."""
+    with httpx.Client() as http_client:
+        client = IndiePitcherClient(api_key="key", http_client=http_client)
+        with pytest.raises(TypeError):
+            pickle.dumps(client)
+
+
+def test_client_with_custom_transport_is_not_picklable() -> None:
+    """Test that clients and pools owning a custom transport refuse to be pickled."""
+    transport = httpx.HTTPTransport(retries=2)
+    client = IndiePitcherClient(api_key="key", transport=transport)
+    with pytest.raises(TypeError, match="custom transport"):
+        pickle.dumps(client)
+    with pytest.raises(TypeError, match="custom transport"):
+        pickle.dumps(IndiePitcherClientPool(transport=transport))
+
+
+def test_pool_pickles_as_configuration() -> None:
+    """Test that a client pool is pickled without its tenants."""
+    pool = IndiePitcherClientPool(tenant_max_in_flight=3)
+    pool.client("key_a")
+
+    copy = pickle.loads(pickle.dumps(pool))
+
+    assert copy.api_keys() == []
+    assert copy.client("key_b").max_in_flight == 3
+
+
+@requires_fork
+def test_forked_child_gets_its_own_connection_pool(make_client, fake_api) -> None:
+    """Test that a client rebuilds its connection pool after a fork."""
+    client = make_client(coalesce_reads=True)
+    client.send_email(_email())
+    parent_pool = client.client
+
+    def check() -> None:
+        assert client.client is not parent_pool
+        assert client.transfer_stats().requests == 0
+        client.send_email(_email())
+
+    assert _in_child(check) == 0
+    assert client.client is parent_pool
+    client.send_email(_email())
+    assert len(fake_api.requests) == 2
+
+
+@requires_fork
+def test_forked_pool_rebinds_tenants(fake_api) -> None:
+    """Test that tenant clients follow the pool's new connection pool."""
+    pool = IndiePitcherClientPool(transport=fake_api.transport())
+    tenant = pool.client("key_a")
+    parent_pool = pool.http_client
+
+    def check() -> None:
+        assert pool.http_client is not parent_pool
+        assert tenant.client is pool.http_client
+        tenant.send_email(_email())
+
+    assert _in_child(check) == 0
+    assert tenant.client is parent_pool
+
+
+@requires_fork
+def test_locks_held_at_fork_time_are_replaced(make_client, fake_api) -> None:
+    """Test that the child does not deadlock on locks a parent thread held."""
+    limiter = RateLimiter(default=RateLimit(rate=100))
+    cache = ContactCache()
+    breaker = CircuitBreaker()
+    hedging = HedgingPolicy()
+    client = make_client(
+        rate_limiter=limiter,
+        contact_cache=cache,
+        circuit_breaker=breaker,
+        hedging=hedging,
+    )
+    assert limiter._default is not None
+    locks = [limiter._default._lock, cache._lock, breaker._lock, hedging._lock]
+    held, release = threading.Event(), threading.Event()
+
+    def hold_locks() -> None:
+        with ExitStack() as stack:
+            for lock in locks:
+                stack.enter_context(lock)
+            held.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_locks)
+    holder.start()
+    held.wait()
+
+    def check() -> None:
+        client.list_mailing_lists()
+        assert cache.get("user@example.com") is None
+
+    try:
+        assert _in_child(check) == 0
+    finally:
+        release.set()
+        holder.join()
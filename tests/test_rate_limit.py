@@ -0,0 +1,54 @@
+"""Tests for the client-side rate limiter."""
+
+import time
+
+import pytest
+
+from indiepitcher import RateLimit, RateLimiter
+
+
+def test_bucket_allows_burst_then_throttles() -> None:
+    """Test that requests beyond the burst must wait for refill."""
+    limiter = RateLimiter(default=RateLimit(rate=10, burst=3))
+
+    delays = [limiter.reserve("/contacts") for _ in range(5)]
+
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+    assert delays[4] == pytest.approx(0.2, abs=0.01)
+
+
+def test_group_limits_are_independent() -> None:
+    """Test that an exhausted email budget does not throttle contact requests."""
+    limiter = RateLimiter(groups={"email": RateLimit(rate=1, burst=1)})
+
+    assert limiter.reserve("/email/transactional") == 0.0
+    assert limiter.reserve("/email/contact") > 0.5
+    assert limiter.reserve("/contacts/find") == 0.0
+
+
+def test_limiter_shared_between_clients(make_client, fake_api) -> None:
+    """Test that two clients sharing a limiter are throttled together."""
+    limiter = RateLimiter(default=RateLimit(rate=20, burst=2))
+    first = make_client(rate_limiter=limiter)
+    second = make_client(rate_limiter=limiter)
+
+    started = time.monotonic()
+    for client in (first, second, first, second):
+        client.list_mailing_lists()
+
+    assert time.monotonic() - started >= 0.09
+    assert len(fake_api.requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_async_client_waits_for_capacity(make_async_client) -> None:
+    """Test that the async client awaits the limiter before sending."""
+    client = make_async_client(rate_limiter=RateLimiter(RateLimit(rate=20, burst=1)))
+
+    started = time.monotonic()
+    await client.list_mailing_lists()
+    await client.list_mailing_lists()
+    await client.close()
+
+    assert time.monotonic() - started >= 0.04
@@ -0,0 +1,154 @@
+"""Tests for contact reconciliation."""
+
+from datetime import datetime
+
+import pytest
+
+from indiepitcher import CreateContact
+
+
+def _seed(fake_api) -> None:
+    fake_api.contacts = {
+        "same@example.com": {
+            "email": "same@example.com",
+            "name": "Same",
+            "subscribedToLists": ["news"],
+            "customProperties": {"plan": "pro"},
+        },
+        "renamed@example.com": {
+            "email": "renamed@example.com",
+            "name": "Old",
+            "subscribedToLists": ["news", "beta"],
+            "customProperties": {},
+        },
+        "gone@example.com": {
+            "email": "gone@example.com",
+            "subscribedToLists": [],
+            "customProperties": {},
+        },
+    }
+
+
+def _desired():
+    return [
+        CreateContact(
+            email="Same@example.com",
+            name="Same",
+            subscribed_to_lists=["news"],
+            custom_properties={"plan": "pro"},
+        ),
+        CreateContact(
+            email="renamed@example.com", name="New", subscribed_to_lists=["news", "vip"]
+        ),
+        CreateContact(email="new@example.com", name="New"),
+    ]
+
+
+def test_dry_run_plans_minimal_changes(make_client, fake_api) -> None:
+    """Test that only real differences end up in the plan, and nothing is sent."""
+    _seed(fake_api)
+
+    report = make_client().reconcile_contacts(
+        _desired(), delete_missing=True, dry_run=True
+    )
+
+    plan = report.plan
+    assert [contact.email for contact in plan.creates] == ["new@example.com"]
+    assert len(plan.updates) == 1
+    update = plan.updates[0]
+    assert update.email == "renamed@example.com"
+    assert update.name == "New"
+    assert update.added_list_subscripitons == ["vip"]
+    assert update.removed_list_subscripitons == ["beta"]
+    assert update.custom_properties is None
+    assert plan.deletes == ["gone@example.com"]
+    assert plan.unchanged == 1
+    assert all(request.method == "GET" for request in fake_api.requests)
+
+
+def test_reconcile_applies_plan(make_client, fake_api) -> None:
+    """Test that applying the plan converges the server to the desired state."""
+    _seed(fake_api)
+    client = make_client()
+
+    report = client.reconcile_contacts(_desired(), delete_missing=True)
+
+    assert report.ok
+    assert report.created.succeeded == 1
+    assert sorted(fake_api.contacts) == [
+        "new@example.com",
+        "renamed@example.com",
+        "same@example.com",
+    ]
+    assert fake_api.contacts["renamed@example.com"]["name"] == "New"
+    assert fake_api.contacts["renamed@example.com"]["subscribedToLists"] == [
+        "news",
+        "vip",
+    ]
+    assert client.reconcile_contacts(_desired(), delete_missing=True).plan.changes == 0
+
+
+def test_reconcile_keeps_missing_contacts_and_ignored_lists(
+    make_client, fake_api
+) -> None:
+    """Test that deletes are opt-in and ignored list subscriptions are kept."""
+    _seed(fake_api)
+    desired = [
+        CreateContact(
+            email="renamed@example.com", ignore_list_subscriptions_when_updating=True
+        )
+    ]
+
+    plan = make_client().reconcile_contacts(desired, dry_run=True).plan
+
+    assert plan.changes == 0
+    assert plan.unchanged == 1
+
+
+def test_custom_properties_compare_in_json_form(make_client, fake_api) -> None:
+    """Test that desired properties are compared as they would be sent."""
+    fake_api.contacts = {
+        "a@example.com": {
+            "email": "a@example.com",
+            "subscribedToLists": [],
+            "customProperties": {"n": 1, "since": "2024-05-01T12:00:00"},
+        },
+    }
+    desired = [
+        CreateContact(
+            email="a@example.com",
+            custom_properties={"n": 1.0, "since": datetime(2024, 5, 1, 12)},
+        ),
+        CreateContact(
+            email="b@example.com", custom_properties={"since": datetime(2024, 5, 2)}
+        ),
+    ]
+
+    plan = make_client().reconcile_contacts(desired, dry_run=True).plan
+
+    assert plan.unchanged == 1
+    assert [contact.email for contact in plan.creates] == ["b@example.com"]
+
+
+def test_reconcile_rejects_duplicates(make_client) -> None:
+    """Test that duplicate desired emails are reported instead of guessed."""
+    desired = [
+        CreateContact(email="a@example.com"),
+        CreateContact(email="A@example.com"),
+    ]
+    with pytest.raises(ValueError):
+        make_client().reconcile_contacts(desired, dry_run=True)
+
+
+@pytest.mark.asyncio
+async def test_async_reconcile(make_async_client, fake_api) -> None:
+    """Test reconciliation with the async client."""
+    _seed(fake_api)
+
+    report = await make_async_client().reconcile_contacts(
+        _desired(), delete_missing=True
+    )
+
+    assert report.ok
+    assert len(report.updated) == 1 and len(report.deleted) == 1
+    assert "gone@example.com" not in fake_api.contacts
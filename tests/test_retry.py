@@ -0,0 +1,95 @@
+"""Tests for the retry policy and client retry behavior."""
+
+import time
+
+import httpx
+import pytest
+
+from indiepitcher import (
+    EmailBodyFormat,
+    IndiePitcherResponseError,
+    RetryPolicy,
+    SendEmail,
+)
+
+FAST = RetryPolicy(max_attempts=3, initial_backoff=0.0, jitter=0.0)
+
+
+def _email() -> SendEmail:
+    return SendEmail(
+        to="user@example.com",
+        subject="Hi",
+        body="Hello",
+        body_format=EmailBodyFormat.MARKDOWN,
+    )
+
+
+def test_backoff_grows_exponentially_and_is_capped() -> None:
+    """Test the backoff curve without jitter."""
+    policy = RetryPolicy(initial_backoff=1.0, max_backoff=5.0, jitter=0.0)
+    assert [policy.backoff(attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+
+def test_retry_after_header_takes_precedence() -> None:
+    """Test that a Retry-After header overrides the computed backoff."""
+    response = httpx.Response(503, headers={"Retry-After": "7"})
+    delay = RetryPolicy().next_delay(1, time.monotonic(), True, response=response)
+    assert delay == 7.0
+
+
+def test_total_timeout_stops_retries() -> None:
+    """Test that no retry is scheduled past the total time budget."""
+    policy = RetryPolicy(initial_backoff=10.0, jitter=0.0, total_timeout=5.0)
+    response = httpx.Response(503)
+    assert policy.next_delay(1, time.monotonic(), True, response=response) is None
+
+
+def test_idempotent_read_is_retried(make_client, fake_api) -> None:
+    """Test that a GET is retried after transient server errors."""
+    fake_api.contacts["a@example.com"] = {"email": "a@example.com"}
+    fake_api.fail_next.extend([(503, "Unavailable"), (502, "Bad gateway")])
+
+    response = make_client(retry_policy=FAST).get_contact("a@example.com")
+
+    assert response.data.email == "a@example.com"
+    assert len(fake_api.requests) == 3
+
+
+def test_send_is_not_retried_on_server_error(make_client, fake_api) -> None:
+    """Test that sends are not repeated after a server error by default."""
+    fake_api.fail_next.append((503, "Unavailable"))
+
+    with pytest.raises(IndiePitcherResponseError):
+        make_client(retry_policy=FAST).send_email(_email())
+    assert len(fake_api.requests) == 1
+
+
+def test_send_is_retried_when_rate_limited(make_client, fake_api) -> None:
+    """Test that a 429 is retried even for non-idempotent operations."""
+    fake_api.fail_next.append((429, "Too many requests"))
+
+    make_client(retry_policy=FAST).send_email(_email())
+    assert len(fake_api.requests) == 2
+
+
+def test_gives_up_after_max_attempts(make_client, fake_api) -> None:
+    """Test that the last error is raised once attempts are exhausted."""
+    fake_api.fail_next.extend([(503, "Unavailable")] * 5)
+
+    with pytest.raises(IndiePitcherResponseError) as exc_info:
+        make_client(retry_policy=FAST).list_mailing_lists()
+    assert exc_info.value.status_code == 503
+    assert len(fake_api.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries(make_async_client, fake_api) -> None:
+    """Test that the async client applies the same retry policy."""
+    fake_api.fail_next.append((500, "Internal error"))
+    client = make_async_client(retry_policy=FAST)
+
+    response = await client.list_mailing_lists()
+    await client.close()
+
+    assert response.success
+    assert len(fake_api.requests) == 2
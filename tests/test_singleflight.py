@@ -0,0 +1,105 @@
+"""Tests for coalescing of concurrent identical reads."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from indiepitcher import IndiePitcherResponseError, SendEmail
+
+
+def _seed(fake_api) -> None:
+    for email in ("a@example.com", "b@example.com"):
+        fake_api.contacts[email] = {"email": email}
+
+
+@pytest.mark.asyncio
+async def test_async_identical_reads_share_one_request(
+    make_async_client, fake_api
+) -> None:
+    """Test that concurrent identical GETs are sent once and distinct ones are not."""
+    _seed(fake_api)
+    fake_api.latency = 0.05
+    traces = []
+    client = make_async_client(coalesce_reads=True, tracer=traces.append)
+
+    results = await asyncio.gather(
+        *(client.get_contact("a@example.com") for _ in range(10)),
+        client.get_contact("b@example.com"),
+    )
+
+    assert [result.data.email for result in results] == ["a@example.com"] * 10 + [
+        "b@example.com"
+    ]
+    assert len(fake_api.requests) == 2
+    assert sum(trace.coalesced for trace in traces) == 9
+
+    await client.get_contact("a@example.com")
+    assert len(fake_api.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_coalesced_errors_and_cancellation(
+    make_async_client, fake_api
+) -> None:
+    """Test that errors reach every waiter and a cancelled waiter does not cancel others."""
+    fake_api.latency = 0.05
+    client = make_async_client(coalesce_reads=True)
+
+    results = await asyncio.gather(
+        *(client.get_contact("missing@example.com") for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, IndiePitcherResponseError) for result in results)
+    assert len(fake_api.requests) == 1
+
+    _seed(fake_api)
+    first = asyncio.ensure_future(client.get_contact("a@example.com"))
+    second = asyncio.ensure_future(client.get_contact("a@example.com"))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert (await second).data.email == "a@example.com"
+    assert len(fake_api.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_writes_are_not_coalesced(make_async_client, fake_api) -> None:
+    """Test that identical sends are all delivered."""
+    client = make_async_client(coalesce_reads=True)
+    email = SendEmail(to="a@example.com", subject="Hi", body="Hi", body_format="html")
+
+    await asyncio.gather(*(client.send_email(email) for _ in range(3)))
+
+    assert len(fake_api.sent) == 3
+
+
+def test_sync_identical_reads_share_one_request(make_client, fake_api) -> None:
+    """Test that threads reading the same contact at once share one request."""
+    _seed(fake_api)
+    fake_api.latency = 0.1
+    client = make_client(coalesce_reads=True)
+    barrier = threading.Barrier(8)
+
+    def read(_):
+        barrier.wait()
+        return client.get_contact("a@example.com")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(read, range(8)))
+
+    assert {result.data.email for result in results} == {"a@example.com"}
+    assert len(fake_api.requests) == 1
+    assert results[0] is not results[1]
+
+
+def test_sync_reads_without_coalescing(make_client, fake_api) -> None:
+    """Test that coalescing is off by default."""
+    _seed(fake_api)
+    fake_api.latency = 0.05
+    client = make_client()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: client.get_contact("a@example.com"), range(4)))
+
+    assert len(fake_api.requests) == 4
@@ -0,0 +1,63 @@
+"""Tests for the in-process mock IndiePitcher API."""
+
+import pytest
+
+from indiepitcher import (
+    CreateContact,
+    CreateMailingListPortalSession,
+    IndiePitcherResponseError,
+    UpdateContact,
+)
+
+
+def test_contact_lifecycle(make_client, fake_api) -> None:
+    """Test every contact endpoint against the mock API."""
+    client = make_client()
+
+    client.create_contact(
+        CreateContact(email="a@example.com", subscribed_to_lists=["news"])
+    )
+    with pytest.raises(IndiePitcherResponseError):
+        client.create_contact(CreateContact(email="a@example.com"))
+
+    updated = client.update_contact(
+        UpdateContact(
+            email="a@example.com",
+            name="A",
+            added_list_subscripitons=["product"],
+            removed_list_subscripitons=["news"],
+        )
+    )
+    assert updated.data.name == "A"
+    assert updated.data.subscribed_to_lists == ["product"]
+
+    client.delete_contact("a@example.com")
+    with pytest.raises(IndiePitcherResponseError) as exc_info:
+        client.get_contact("a@example.com")
+    assert exc_info.value.status_code == 404
+
+
+def test_mailing_list_endpoints(make_client, fake_api) -> None:
+    """Test listing mailing lists and creating portal sessions."""
+    fake_api.add_mailing_list("news", "Newsletter", num_subscribers=3)
+    client = make_client()
+
+    assert client.list_mailing_lists().data[0].num_subscribers == 3
+    session = client.create_mailing_list_portal_session(
+        CreateMailingListPortalSession(
+            contact_email="a@example.com", return_url="https://example.com"
+        )
+    )
+    assert session.data.return_url == "https://example.com"
+
+
+@pytest.mark.asyncio
+async def test_async_transport_simulates_latency(make_async_client, fake_api) -> None:
+    """Test that the async transport serves requests with simulated latency."""
+    fake_api.latency = 0.01
+    client = make_async_client()
+
+    response = await client.list_contacts()
+    await client.close()
+
+    assert response.metadata.total == 0
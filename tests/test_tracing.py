@@ -0,0 +1,101 @@
+"""Tests for per-call tracing hooks."""
+
+from typing import List
+
+import pytest
+
+from indiepitcher import (
+    CallTrace,
+    EmailBodyFormat,
+    IndiePitcherResponseError,
+    RetryPolicy,
+    SendEmail,
+)
+
+
+def test_trace_records_phases_and_sizes(make_client, fake_api) -> None:
+    """Test that every call emits a trace with timings and sizes."""
+    traces: List[CallTrace] = []
+    client = make_client(tracer=traces.append)
+
+    client.send_email(
+        SendEmail(
+            to="user@example.com",
+            subject="Hi",
+            body="Hello",
+            body_format=EmailBodyFormat.MARKDOWN,
+        )
+    )
+
+    (trace,) = traces
+    assert (trace.method, trace.endpoint, trace.status_code) == (
+        "POST",
+        "/email/transactional",
+        200,
+    )
+    assert trace.attempts == 1
+    assert trace.bytes_sent == len(fake_api.requests[0].content)
+    assert trace.bytes_received > 0
+    assert trace.duration >= trace.serialize_time + trace.network_time
+    assert trace.error is None
+
+
+def test_trace_records_retries_and_errors(make_client, fake_api) -> None:
+    """Test that failed calls are traced with their attempts and error."""
+    traces: List[CallTrace] = []
+    client = make_client(
+        tracer=traces.append,
+        retry_policy=RetryPolicy(max_attempts=2, initial_backoff=0.0),
+    )
+    fake_api.fail_next.extend([(503, "Unavailable")] * 2)
+
+    with pytest.raises(IndiePitcherResponseError):
+        client.list_contacts()
+
+    assert traces[0].attempts == 2
+    assert traces[0].status_code == 503
+    assert isinstance(traces[0].error, IndiePitcherResponseError)
+
+
+def test_failing_tracer_does_not_break_calls(make_client) -> None:
+    """Test that exceptions raised by the tracer are swallowed."""
+
+    def broken(trace: CallTrace) -> None:
+        raise RuntimeError("tracer bug")
+
+    assert make_client(tracer=broken).list_mailing_lists().success
+
+
+def test_opentelemetry_tracer(make_client) -> None:
+    """Test that the OpenTelemetry adapter records client spans."""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from indiepitcher import OpenTelemetryTracer
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    client = make_client(tracer=OpenTelemetryTracer(tracer_provider=provider))
+
+    client.list_mailing_lists()
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET /lists"
+    assert span.attributes["http.response.status_code"] == 200
+
+
+@pytest.mark.asyncio
+async def test_async_client_traces(make_async_client) -> None:
+    """Test that the async client emits traces as well."""
+    traces: List[CallTrace] = []
+    client = make_async_client(tracer=traces.append)
+
+    await client.list_mailing_lists()
+    await client.close()
+
+    assert [trace.endpoint for trace in traces] == ["/lists"]
@@ -0,0 +1,72 @@
+"""Tests for lazy contact and mailing list views."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from indiepitcher import Contact, ContactView, MailingList
+
+
+def _seed(fake_api, count: int) -> None:
+    for i in range(count):
+        email = f"user{i:03d}@example.com"
+        fake_api.contacts[email] = {
+            "email": email,
+            "hardBouncedAt": "2024-01-01T00:00:00Z",
+            "customProperties": {"seats": i},
+        }
+
+
+def test_list_contacts_lazy_reads_fields_on_access(make_client, fake_api) -> None:
+    """Test that views expose the same values as the full model."""
+    _seed(fake_api, 3)
+    page = make_client().list_contacts_lazy(per_page=2)
+
+    view = page.data[0]
+    assert isinstance(view, ContactView)
+    assert page.metadata.total == 3
+    assert view.email == "user000@example.com"
+    assert view.hard_bounced_at == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert view.custom_properties == {"seats": 0}
+    assert view.name is None
+    assert view.subscribed_to_lists == []
+    assert view.raw["hardBouncedAt"] == "2024-01-01T00:00:00Z"
+    assert isinstance(view.to_contact(), Contact)
+    assert view.to_contact() == make_client().get_contact(view.email).data
+
+
+def test_view_validates_only_the_field_read() -> None:
+    """Test that an invalid field only fails when it is accessed."""
+    view = ContactView({"email": "a@example.com", "hardBouncedAt": "not a date"})
+
+    assert view.email == "a@example.com"
+    with pytest.raises(ValueError):
+        view.hard_bounced_at
+    with pytest.raises(AttributeError):
+        ContactView({}).email
+
+
+def test_iter_contacts_lazy(make_client, fake_api) -> None:
+    """Test that the lazy iterator walks every page in order."""
+    _seed(fake_api, 25)
+
+    emails = [view.email for view in make_client().iter_contacts_lazy(per_page=10)]
+
+    assert emails == list(fake_api.contacts)
+
+
+@pytest.mark.asyncio
+async def test_async_lazy_listings(make_async_client, fake_api) -> None:
+    """Test the async lazy contact and mailing list listings."""
+    _seed(fake_api, 15)
+    fake_api.add_mailing_list("news", "Newsletter", 15)
+    client = make_async_client()
+
+    emails = [view.email async for view in client.aiter_contacts_lazy(per_page=10)]
+    lists = await client.list_mailing_lists_lazy()
+
+    assert emails == list(fake_api.contacts)
+    assert lists.data[0].num_subscribers == 15
+    assert lists.data[0].to_mailing_list() == MailingList(
+        name="news", title="Newsletter", num_subscribers=15
+    )